@@ -1,16 +1,17 @@
-import pandas as pd
-import glob
+import os
+import sys
 
-# Define the path and file type (e.g., all CSV files in a folder)
-path = '../Game Reports/Stevens Home Games'  # Replace with the folder path where your files are located
-file_extension = '*.csv'  # You can change this to *.txt or other file types if needed
-all_files = "../All Game CSVs/Game Files/Stevens25G1.csv" , "../All Game CSVs/Game Files/Stevens25G2.csv", "../All Game CSVs/Game Files/Stevens2024Game.csv"
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Shared Scripts'))
+from SeasonIngest import ingest_files
+from SeasonStore import list_games
 
-# Use a list comprehension to read and concatenate all files into one DataFrame
-df = pd.concat([pd.read_csv(file) for file in all_files], ignore_index=True)
+# Define the game files to add and the season store they go into
+all_files = "../All Game CSVs/Game Files/Stevens25G1.csv" , "../All Game CSVs/Game Files/Stevens25G2.csv", "../All Game CSVs/Game Files/Stevens2024Game.csv"
+store_dir = '../All Game CSVs/SeasonStore'  # One Parquet file per GameID lives here
 
-# Now 'df' contains the concatenated data from all the CSV files
-print(df.head())  # Display the first few rows
+# Ingest the files into the store; files already ingested are skipped and repeated pitches are dropped
+written = ingest_files(all_files, store_dir)
+print(f"Games written: {', '.join(written) if written else 'none'}")
 
-# Optionally save to a new CSV file
-df.to_csv('../All Game CSVs/StevensGamesConcat.csv', index=False)
+# Now the store contains every game added so far; the season scripts read it with load_season
+print(list_games(store_dir))
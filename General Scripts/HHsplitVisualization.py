@@ -1,48 +1,26 @@
-import pandas as pd
+import os
+import sys
 import matplotlib.pyplot as plt
 import seaborn as sns
 
-# Load the CSV file
-df = pd.read_csv('EndOfFallData/AllFallScrimmageData.csv')
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Shared Scripts'))
+from SeasonStore import load_season
+from StreamingAggregates import stream_hit_percentages
+from GroupedMetrics import HIT_SPLIT_METRICS, grouped_metrics
 
-# Function to determine hit hardness based on exit velocity
-def is_hard_hit(exit_speed):
-    return exit_speed >= 85
+STORE_DIR = '../Fall/AllFallCSV/FallScrimmageCSV/ScrimmageStore'
 
-# Function to determine hit type based on launch angle
-def determine_hit_type(angle):
-    if angle >= 45:
-        return 'Pop Up'
-    elif angle >= 30:
-        return 'Fly Ball'
-    elif angle >= 0:
-        return 'Line Drive'
-    else:
-        return 'Ground Ball'
-
-# Calculate the percentages for each hit type, including total balls in play
-def calculate_hit_percentages(group):
-    in_play = group[group['PitchCall'] == 'InPlay']
-    hard_hit_count = in_play[in_play['ExitSpeed'].apply(is_hard_hit)].shape[0]
-    ground_ball_count = in_play[in_play['Angle'].apply(determine_hit_type) == 'Ground Ball'].shape[0]
-    pop_up_count = in_play[in_play['Angle'].apply(determine_hit_type) == 'Pop Up'].shape[0]
-    total_in_play = in_play.shape[0]
-
-    return pd.Series({
-        'HardHit%': (hard_hit_count / total_in_play) * 100 if total_in_play > 0 else 0,
-        'GroundBall%': (ground_ball_count / total_in_play) * 100 if total_in_play > 0 else 0,
-        'PopUp%': (pop_up_count / total_in_play) * 100 if total_in_play > 0 else 0,
-        'TotalInPlay': total_in_play,
-        'TotalHardHits': hard_hit_count
-    })
+# Set to a row count (e.g. 250_000) to aggregate the store in chunks instead of loading it whole
+STREAM_CHUNK_ROWS = None
 
 # Calculate percentages for each pitch type and role (Pitcher or Batter)
-def calculate_for_pitch_type_and_role(df, role='Pitcher'):
+def calculate_for_pitch_type_and_role(df, role='Pitcher', percentages=None):
     if role not in ['Pitcher', 'Batter']:
         raise ValueError("Invalid role! Choose either 'Pitcher' or 'Batter'.")
 
-    # Group by role and TaggedPitchType
-    percentages = df.groupby([role, 'TaggedPitchType']).apply(calculate_hit_percentages).reset_index()
+    # Group by role and TaggedPitchType (already done when the file was streamed)
+    if percentages is None:
+        percentages = grouped_metrics(df, [role, 'TaggedPitchType'], HIT_SPLIT_METRICS, empty_value=0)
 
     # Create stacked bar chart
     plt.figure(figsize=(12, 6))
@@ -57,7 +35,7 @@ def calculate_for_pitch_type_and_role(df, role='Pitcher'):
     plt.show()
 
     # Heatmap for pitch locations (assuming 'PlateLocX' and 'PlateLocY' columns for pitch coordinates)
-    if 'PlateLocX' in df.columns and 'PlateLocY' in df.columns:
+    if df is not None and 'PlateLocX' in df.columns and 'PlateLocY' in df.columns:
         plt.figure(figsize=(8, 6))
         pitch_loc_data = df[df['PitchCall'] == 'InPlay']  # Filter for pitches in play
         heatmap_data = pitch_loc_data.pivot_table(index='PlateLocY', columns='PlateLocX', aggfunc='size', fill_value=0)
@@ -73,5 +51,13 @@ def calculate_for_pitch_type_and_role(df, role='Pitcher'):
     print(f"Percentages calculated and saved to {output_file}")
 
 # Run for both Pitchers and Batters
-calculate_for_pitch_type_and_role(df, 'Pitcher')
-calculate_for_pitch_type_and_role(df, 'Batter')
+if STREAM_CHUNK_ROWS:
+    # One pass over the store in bounded chunks; the pitch location heatmap needs every row and is skipped
+    streamed = stream_hit_percentages(STORE_DIR, empty_value=0, chunk_rows=STREAM_CHUNK_ROWS)
+    calculate_for_pitch_type_and_role(None, 'Pitcher', streamed['Pitcher'])
+    calculate_for_pitch_type_and_role(None, 'Batter', streamed['Batter'])
+else:
+    # Load the season store
+    df = load_season(STORE_DIR, columns=['Pitcher', 'Batter', 'TaggedPitchType', 'PitchCall', 'ExitSpeed', 'Angle', 'HardHit', 'HitType', 'PlateLocX', 'PlateLocY'])
+    calculate_for_pitch_type_and_role(df, 'Pitcher')
+    calculate_for_pitch_type_and_role(df, 'Batter')
@@ -1,62 +1,27 @@
-import pandas as pd
+import os
+import sys
 
-# Load the CSV file (replace 'input.csv' with your actual CSV filename)
-df = pd.read_csv('../Fall/AllFallCSV/FallScrimmageCSV/AllFallScrimmageData-Xwoba.csv')
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Shared Scripts'))
+from SeasonStore import load_season
+from StreamingAggregates import stream_hit_percentages
+from GroupedMetrics import HIT_SPLIT_METRICS, grouped_metrics
 
-# Function to determine hit hardness based on exit velocity
-def is_hard_hit(exit_speed):
-    return exit_speed >= 85
+# Season store built with SeasonIngest.py
+STORE_DIR = '../Fall/AllFallCSV/FallScrimmageCSV/ScrimmageStore'
 
-# Function to determine hit type based on launch angle
-def determine_hit_type(angle):
-    if angle >= 45:
-        return 'Pop Up'
-    elif angle >= 30:
-        return 'Fly Ball'
-    elif angle >= 0:
-        return 'Line Drive'
-    else:
-        return 'Ground Ball'
-
-# Function to calculate the percentages for each hit type, including total balls in play
-def calculate_hit_percentages(group):
-    # Only consider balls in play
-    in_play = group[group['PitchCall'] == 'InPlay']
-
-    # Count hard-hit balls
-    hard_hit_count = in_play[in_play['ExitSpeed'].apply(is_hard_hit)].shape[0]
-
-    # Count ground balls and pop-ups based on launch angle
-    ground_ball_count = in_play[in_play['Angle'].apply(determine_hit_type) == 'Ground Ball'].shape[0]
-    pop_up_count = in_play[in_play['Angle'].apply(determine_hit_type) == 'Pop Up'].shape[0]
-
-    # Calculate total balls in play
-    total_in_play = in_play.shape[0]
-
-    if total_in_play > 0:
-        hard_hit_percentage = (hard_hit_count / total_in_play) * 100
-        ground_ball_percentage = (ground_ball_count / total_in_play) * 100
-        pop_up_percentage = (pop_up_count / total_in_play) * 100
-    else:
-        hard_hit_percentage = ground_ball_percentage = pop_up_percentage = None
-
-    # Return the percentages along with total balls in play
-    return pd.Series({
-        'HardHit%': hard_hit_percentage,
-        'GroundBall%': ground_ball_percentage,
-        'PopUp%': pop_up_percentage,
-        'TotalInPlay': total_in_play,
-        'TotalHardHits': hard_hit_count
-    })
+# Set to a row count (e.g. 250_000) to aggregate the store in chunks instead of loading it whole
+STREAM_CHUNK_ROWS = None
 
 # Function to calculate percentages for each pitch type and player role (pitcher or hitter)
-def calculate_for_pitch_type_and_role(df, role='Pitcher'):
+def calculate_for_pitch_type_and_role(df, role='Pitcher', percentages=None):
     # Validate the role
     if role not in ['Pitcher', 'Batter']:
         raise ValueError("Invalid role! Choose either 'Pitcher' or 'Batter'.")
 
     # Group the data by the selected role and TaggedPitchType, and calculate percentages
-    percentages = df.groupby([role, 'TaggedPitchType']).apply(calculate_hit_percentages).reset_index()
+    # (already done when the file was streamed)
+    if percentages is None:
+        percentages = grouped_metrics(df, [role, 'TaggedPitchType'], HIT_SPLIT_METRICS, empty_value=None)
 
     # Save the updated CSV file with the calculated percentages
     output_file = f'FallBreakdown/Scrimmage/{role}_PitchType_HitTypePercentages.csv'
@@ -65,5 +30,13 @@ def calculate_for_pitch_type_and_role(df, role='Pitcher'):
     print(f"Percentages calculated and saved to {output_file}")
 
 # Run for both pitchers and hitters, grouped by TaggedPitchType
-calculate_for_pitch_type_and_role(df, 'Pitcher')
-calculate_for_pitch_type_and_role(df, 'Batter')
+if STREAM_CHUNK_ROWS:
+    # One pass over the store in bounded chunks; groups without a ball in play get empty percentages
+    streamed = stream_hit_percentages(STORE_DIR, empty_value=None, chunk_rows=STREAM_CHUNK_ROWS)
+    calculate_for_pitch_type_and_role(None, 'Pitcher', streamed['Pitcher'])
+    calculate_for_pitch_type_and_role(None, 'Batter', streamed['Batter'])
+else:
+    # Load the season store
+    df = load_season(STORE_DIR, columns=['Pitcher', 'Batter', 'TaggedPitchType', 'PitchCall', 'ExitSpeed', 'Angle', 'HardHit', 'HitType'])
+    calculate_for_pitch_type_and_role(df, 'Pitcher')
+    calculate_for_pitch_type_and_role(df, 'Batter')
@@ -1,32 +1,27 @@
+import os
+import sys
 import pandas as pd
 
-# Define the function to determine hit type based on angle
-def determine_hit_type(angle):
-    if angle >= 45:
-        return 'Pop Up'
-    elif angle >= 30:
-        return 'Fly Ball'
-    elif angle >= 0:
-        return 'Line Drive'
-    else:
-        return 'Ground Ball'
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Shared Scripts'))
+from SeasonStore import load_season
+from EnrichedColumns import derived_column
 
 # Load the CSV file into a DataFrame
-df = pd.read_csv('../Fall/AllFallCSV/FallScrimmageCSV/AllFallScrimmageData-Xwoba.csv')
+df = load_season('../Fall/AllFallCSV/FallScrimmageCSV/ScrimmageStore', columns=['Pitcher', 'PlayResult', 'Angle', 'HitType'])
 
 # Filter out rows where PlayResult is undefined, irrelevant, or fouls
 # Assuming undefined or foul plays are represented by 'undefined', 'FoulBall', or similar
 valid_play_results = df['PlayResult'].notna() & (df['PlayResult'] != 'Undefined')
 df_filtered = df[valid_play_results]
 
-# Apply the determine_hit_type function to the 'angle' column to create a new 'HitType' column
-df_filtered['HitType'] = df_filtered['Angle'].apply(determine_hit_type)
+# Hit type of each launch angle, stored at ingest (classified here for older stores)
+df_filtered = df_filtered.assign(HitType=derived_column(df_filtered, 'HitType'))
 
 # Group by 'Pitcher' and 'HitType', then count occurrences of each hit type
-hit_counts = df_filtered.groupby(['Pitcher', 'HitType']).size().reset_index(name='HitCount')
+hit_counts = df_filtered.groupby(['Pitcher', 'HitType'], observed=True).size().reset_index(name='HitCount')
 
 # Calculate total hits (balls in play) allowed by each pitcher
-total_hits = df_filtered.groupby('Pitcher').size().reset_index(name='TotalBIP')  # Total Balls In Play (BIP)
+total_hits = df_filtered.groupby('Pitcher', observed=True).size().reset_index(name='TotalBIP')  # Total Balls In Play (BIP)
 
 # Merge hit counts with total hits to get both in one DataFrame
 merged_df = pd.merge(hit_counts, total_hits, on='Pitcher')
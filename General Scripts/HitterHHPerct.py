@@ -1,26 +1,22 @@
-import pandas as pd
+import os
+import sys
 
-# Load the CSV file (replace 'input.csv' with your actual CSV filename)
-df = pd.read_csv('../Game Reports/Stevens Home Games/Stevens25_Home_Games-Xwoba.csv')
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Shared Scripts'))
+from TrackmanSchema import load_trackman
+from EnrichedColumns import derived_column
 
-HARD_HIT_THRESHOLD = 85
+# Load the home games only (the season store holds every game)
+df = load_trackman('../Game Reports/Stevens Home Games/Stevens25_Home_Games-Xwoba.csv', columns=['Pitcher', 'PitchCall', 'ExitSpeed'])
 
-# Function to determine if a ball is hard hit based on exit velocity
-def is_hard_hit(exit_speed):
-    if exit_speed >= HARD_HIT_THRESHOLD:
-        return 1  # Hard Hit
-    else:
-        return 0  # Not Hard Hit
-
-# Apply the function to create a 'Hard Hit' column
-df['Hard Hit'] = df['ExitSpeed'].apply(is_hard_hit)
+# Create a 'Hard Hit' column (1 = hard hit, 0 = not)
+df['Hard Hit'] = derived_column(df, 'HardHit').astype(int)
 
 # Filter for balls in play (assuming 'PitchCall' column indicates 'InPlay' status)
 balls_in_play = df[df['PitchCall'] == 'InPlay']
 print(balls_in_play)
 
 # Calculate the hard hit stats for each hitter
-hit_stats = balls_in_play.groupby('Pitcher').agg(
+hit_stats = balls_in_play.groupby('Pitcher', observed=True).agg(
     TotalBallsInPlay=('PitchCall', 'size'),   # Total balls in play
     HardHitBalls=('Hard Hit', 'sum')          # Total hard hit balls
 ).reset_index()
@@ -1,34 +1,32 @@
-import pandas as pd
-
-# Load the CSV file (replace 'input.csv' with your actual CSV filename)
-df = pd.read_csv('EndOfFallData/AllFallScrimmageData.csv')
-
-# Function to determine hit hardness based on exit velocity
-def is_hard_hit(exit_speed):
-    return exit_speed >= 80
-
-# Function to determine which quadrant the pitch was in based on PlateLocHeight and PlateLocSide
-def determine_quadrant(height, side):
-    if height >= 0 and side < 0:
-        return 'Upper Left (High & Inside)'
-    elif height >= 0 and side >= 0:
-        return 'Upper Right (High & Outside)'
-    elif height < 0 and side < 0:
-        return 'Lower Left (Low & Inside)'
-    else:
-        return 'Lower Right (Low & Outside)'
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Shared Scripts'))
+from SeasonStore import load_season
+from BattedBall import is_hard_hit
+from EnrichedColumns import quadrant_labels
+
+# Load the season from its store (built with SeasonIngest.py)
+df = load_season('../Fall/AllFallCSV/FallScrimmageCSV/ScrimmageStore', columns=['TaggedPitchType', 'PitchCall', 'ExitSpeed', 'PlateLocHeight', 'PlateLocSide', 'Quadrant'])
+
+# This breakdown has always used a lower hard-hit threshold than the other reports
+HARD_HIT_THRESHOLD = 80
+
+# Quadrant labels, in ZoneBinning's code order (top left, top right, bottom left, bottom right)
+QUADRANT_LABELS = ['Upper Left (High & Inside)', 'Upper Right (High & Outside)',
+                   'Lower Left (Low & Inside)', 'Lower Right (Low & Outside)']
 
 # Function to calculate HardHit% by pitch type and quadrant
 def calculate_hard_hit_percentages_by_pitch_and_quadrant(df):
-    # Add a column for the quadrant of the strike zone
-    df['StrikeZoneQuadrant'] = df.apply(lambda row: determine_quadrant(row['PlateLocHeight'], row['PlateLocSide']), axis=1)
+    # Add a column for the quadrant of the strike zone (split at the zone's center, not at 0 ft)
+    df['StrikeZoneQuadrant'] = quadrant_labels(df, QUADRANT_LABELS)
 
     # Only consider balls in play
     in_play = df[df['PitchCall'] == 'InPlay']
 
     # Count total and hard-hit balls by pitch type and quadrant
-    hard_hit_by_pitch_quadrant = in_play[in_play['ExitSpeed'].apply(is_hard_hit)].groupby(['TaggedPitchType', 'StrikeZoneQuadrant']).size()
-    total_by_pitch_quadrant = in_play.groupby(['TaggedPitchType', 'StrikeZoneQuadrant']).size()
+    hard_hit_by_pitch_quadrant = in_play[is_hard_hit(in_play['ExitSpeed'], HARD_HIT_THRESHOLD)].groupby(['TaggedPitchType', 'StrikeZoneQuadrant'], observed=True).size()
+    total_by_pitch_quadrant = in_play.groupby(['TaggedPitchType', 'StrikeZoneQuadrant'], observed=True).size()
 
     # Calculate HardHit% by pitch type and quadrant
     hard_hit_percentages = (hard_hit_by_pitch_quadrant / total_by_pitch_quadrant) * 100
@@ -1,10 +1,16 @@
+import os
+import sys
 import matplotlib.pyplot as plt
-import pandas as pd
 import numpy as np
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Shared Scripts'))
+from BattedBall import is_hard_hit
+from TrackmanSchema import load_trackman
+from ZoneBinning import QUADRANT_NAMES, label_regions, quadrant_codes
+
 # Load the data from a CSV file
 file_path = 'SchreierGavenFallPitching.csv'  # Replace with the actual path to your CSV file
-data = pd.read_csv(file_path)
+data = load_trackman(file_path, columns=['PlateLocHeight', 'PlateLocSide', 'TaggedPitchType', 'PitchCall', 'ExitSpeed'])
 
 # Extract the necessary columns
 plate_loc_height = data['PlateLocHeight']
@@ -19,28 +25,18 @@ strike_zone_right = 0.83  # Right boundary
 strike_zone_bottom = 1.5  # Bottom boundary (knees)
 strike_zone_top = 4.0  # Top boundary (shoulders)
 
-# Define quadrants within the strike zone
-def get_quadrant(side, height):
-    if side < 0 and height > 2.75:
-        return 'Top Left'
-    elif side >= 0 and height > 2.75:
-        return 'Top Right'
-    elif side < 0 and height <= 2.75:
-        return 'Bottom Left'
-    else:
-        return 'Bottom Right'
-
-# Apply the quadrant function to each pitch
-data['Quadrant'] = data.apply(lambda row: get_quadrant(row['PlateLocSide'], row['PlateLocHeight']), axis=1)
+# Assign every pitch to a strike zone quadrant at once (pitches without a location get none)
+data['Quadrant'] = label_regions(quadrant_codes(data['PlateLocSide'], data['PlateLocHeight']), QUADRANT_NAMES,
+                                 index=data.index)
 
-# Identify hard-hit balls (ExitSpeed > 85)
-data['HardHit'] = data['ExitSpeed'] > 85
+# Identify hard-hit balls (ExitSpeed at or above BattedBall.HARD_HIT_MPH)
+data['HardHit'] = is_hard_hit(data['ExitSpeed'])
 
 # Combine pitch outcomes with hard-hit condition for tally
 data['Outcome'] = np.where(data['HardHit'], 'Hard Hit', data['PitchCall'])
 
 # Tally the outcomes for each quadrant, including hard hits
-outcome_tally = data.groupby(['Quadrant', 'Outcome']).size().unstack(fill_value=0)
+outcome_tally = data.groupby(['Quadrant', 'Outcome'], observed=True).size().unstack(fill_value=0)
 
 # Save the outcome tally to a CSV file
 output_file_path = 'GavenSchreierPitching/GavenSchreierpitch_outcome_tally_by_quadrant.csv'  # Specify your desired output path
@@ -1,10 +1,16 @@
+import os
+import sys
 import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Shared Scripts'))
+from BattedBall import is_hard_hit
+from TrackmanSchema import load_trackman
+
 # Load the data from a CSV file
 file_path = 'SpaanAndrewFallPitching.csv'  # Replace with the actual path to your CSV file
-data = pd.read_csv(file_path)
+data = load_trackman(file_path, columns=['PlateLocHeight', 'PlateLocSide', 'ExitSpeed', 'TaggedPitchType', 'PitchCall'])
 
 # Extract the necessary columns
 plate_loc_height = data['PlateLocHeight']
@@ -23,9 +29,9 @@ colors = [pitch_colors.get(pitch, 'gray') for pitch in pitch_type]  # Default to
 default_size = 50  # Small size for pitches with no exit speed
 sizes = np.where(pd.isna(exit_speed), default_size, np.sqrt(exit_speed) * 1)  # Scale exit speed or set default
 
-# Mark pitches with Exit Speed > 85 as larger and use special marker
-hard_hit_marker = exit_speed > 85
-sizes[hard_hit_marker] = 200  # Assign larger size for hard-hit pitches (over 85 mph)
+# Mark hard-hit pitches (BattedBall.HARD_HIT_MPH and up) as larger and use special marker
+hard_hit_marker = is_hard_hit(exit_speed)
+sizes[hard_hit_marker] = 200  # Assign larger size for hard-hit pitches
 
 # Define markers for pitch outcomes
 ball_marker = pitch_called == 'BallCalled'
@@ -1,5 +1,36 @@
+import os
+import sys
 import pandas as pd
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Shared Scripts'))
+from GroupedMetrics import SWING_CALLS, metric_table
+from ZoneBinning import in_strike_zone
+
+# TaggedHitType values counted as each batted ball type (TrackMan writes "Popup")
+GROUND_BALL_TYPES = ['GroundBall']
+LINE_DRIVE_TYPES = ['LineDrive']
+FLY_BALL_TYPES = ['FlyBall', 'PopUp', 'Popup']
+
+# Count column -> per-pitch indicator, in output order
+COUNT_COLUMNS = [
+    "swings", "takes", "chase_swings", "0-0_swings", "take_1st_strike",
+    "ground_ball", "line_drive", "fly_ball", "plate_appearances",
+    "chase_pitches", "zone_pitches", "zone_swings", "whiffs",
+]
+
+# Percentage column -> (numerator, denominator)
+PERCENT_COLUMNS = {
+    "Total Swing %": ("swings", "pitches"),
+    "Chase %": ("chase_swings", "chase_pitches"),
+    "Zone Swing %": ("zone_swings", "zone_pitches"),
+    "Whiff %": ("whiffs", "swings"),
+    "0-0 Swing %": ("0-0_swings", "plate_appearances"),
+    "Take 1 Strike %": ("take_1st_strike", "plate_appearances"),
+    "Ground Ball %": ("ground_ball", "batted_balls"),
+    "Line Drive %": ("line_drive", "batted_balls"),
+    "Fly Ball %": ("fly_ball", "batted_balls"),
+}
+
 
 def load_data(file_path):
     """Loads the Excel file and reads the first sheet."""
@@ -8,78 +39,59 @@ def load_data(file_path):
     return df
 
 
+def pitch_indicators(df):
+    """
+    Flags every pitch for each counted event, one column at a time.
+
+    Parameters:
+        df (pd.DataFrame): TrackMan data.
+
+    Returns:
+        pd.DataFrame: 0/1 indicator columns aligned with df.
+    """
+    swing = df['PitchCall'].isin(SWING_CALLS)
+    first_pitch = df['PitchofPA'] == 1
+
+    # Chases are swings at located pitches outside the strike zone; pitches without a location are neither
+    located = (df['PlateLocSide'].notna() & df['PlateLocHeight'].notna()).to_numpy()
+    in_zone = in_strike_zone(df['PlateLocSide'], df['PlateLocHeight'])
+    out_of_zone = located & ~in_zone
+
+    hit_type = df['TaggedHitType']
+    indicators = {
+        "pitches": True,
+        "swings": swing,
+        "takes": ~swing,
+        "chase_swings": swing & out_of_zone,
+        "0-0_swings": swing & first_pitch,
+        "take_1st_strike": ~swing & (df['Strikes'] == 0) & (df['PitchCall'] == 'StrikeCalled'),
+        "ground_ball": hit_type.isin(GROUND_BALL_TYPES),
+        "line_drive": hit_type.isin(LINE_DRIVE_TYPES),
+        "fly_ball": hit_type.isin(FLY_BALL_TYPES),
+        "plate_appearances": first_pitch,
+        "chase_pitches": out_of_zone,
+        "zone_pitches": in_zone,
+        "zone_swings": swing & in_zone,
+        "whiffs": df['PitchCall'] == 'StrikeSwinging',
+    }
+    return pd.DataFrame(indicators, index=df.index).astype("int64")
+
+
 def calculate_stats(df):
-    """Calculates hitting statistics from the dataset."""
-    hitters_stats = {}
-    seen_plate_appearances = set()
-
-    for _, row in df.iterrows():
-        player = row['Batter']  # Updated column name
-        pa_identifier = (row['Batter'], row['PAofInning'])  # Unique PA Identifier
-
-        if player not in hitters_stats:
-            hitters_stats[player] = {
-                "swings": 0, "takes": 0, "chase_swings": 0,
-                "0-0_swings": 0, "take_1st_strike": 0,
-                "ground_ball": 0, "line_drive": 0, "fly_ball": 0,
-                "plate_appearances": 0
-            }
-
-        # Count plate appearance only once per at-bat
-        if row['PitchofPA'] == 1:
-            hitters_stats[player]["plate_appearances"] += 1
-
-        # Detect swings from PitchCall
-        swing_events = ["FoulBallNotFieldable", "SwingingStrike", "InPlay", "FoulBallFieldable"]
-        if row['PitchCall'] in swing_events:
-            hitters_stats[player]['swings'] += 1
-
-            # Chase detection: Swung at pitches outside the strike zone
-            # if row['PlateLocHeight'] < 1.5 or row['PlateLocHeight'] > 3.5 or abs(row['PlateLocSide']) > 0.85:
-            #     hitters_stats[player]['chase_swings'] += 1
-
-            # First-pitch swing
-            if row['PitchofPA'] == 1:
-                hitters_stats[player]['0-0_swings'] += 1
-        else:
-            hitters_stats[player]['takes'] += 1
-
-            # First-pitch take for a strike
-            if row['Strikes'] == 0 and row['PitchCall'] == 'StrikeCalled':
-                hitters_stats[player]['take_1st_strike'] += 1
-
-        # Batted ball classification
-        if row['TaggedHitType'] == 'GroundBall':
-            hitters_stats[player]['ground_ball'] += 1
-        elif row['TaggedHitType'] == 'LineDrive':
-            hitters_stats[player]['line_drive'] += 1
-        elif row['TaggedHitType'] in ['FlyBall', 'PopUp']:
-            hitters_stats[player]['fly_ball'] += 1
-
-    # Compute percentages
-    stats_list = []
-    for player, stats in hitters_stats.items():
-        total_pitches = stats["swings"] + stats["takes"]
-        total_batted_balls = stats["ground_ball"] + stats["line_drive"] + stats["fly_ball"]
-
-        stats["Total Swing %"] = (stats["swings"] / total_pitches) * 100 if total_pitches else 0
-        stats["Chase %"] = (stats["chase_swings"] / stats["swings"]) * 100 if stats["swings"] else 0
-        stats["0-0 Swing %"] = (stats["0-0_swings"] / stats["plate_appearances"]) * 100 if stats[
-            "plate_appearances"] else 0
-        stats["Take 1 Strike %"] = (stats["take_1st_strike"] / stats["plate_appearances"]) * 100 if stats[
-            "plate_appearances"] else 0
-        stats["Ground Ball %"] = (stats["ground_ball"] / total_batted_balls) * 100 if total_batted_balls else 0
-        stats["Line Drive %"] = (stats["line_drive"] / total_batted_balls) * 100 if total_batted_balls else 0
-        stats["Fly Ball %"] = (stats["fly_ball"] / total_batted_balls) * 100 if total_batted_balls else 0
-
-        stats_list.append({"Batter": player, **stats})
-
-    return stats_list
-
-
-def export_to_csv(stats_list, output_file="hitter_stats v. Trey.csv"):
+    """
+    Calculates hitting statistics from the dataset, one row per batter in order of
+    first appearance. Every count is a grouped sum of a per-pitch indicator.
+    """
+    sums = pitch_indicators(df).groupby(df['Batter'].rename('Batter'), sort=False).sum()
+    sums["batted_balls"] = sums["ground_ball"] + sums["line_drive"] + sums["fly_ball"]
+
+    percentages = metric_table(sums, PERCENT_COLUMNS, empty_value=0)
+    return pd.concat([sums[COUNT_COLUMNS].reset_index(), percentages.drop(columns=['Batter'])], axis=1)
+
+
+def export_to_csv(hitter_stats, output_file="hitter_stats v. Trey.csv"):
     """Exports the computed stats to a CSV file."""
-    df = pd.DataFrame(stats_list)
+    df = pd.DataFrame(hitter_stats)
     df.to_csv(output_file, index=False)
     print(f"Exported stats to {output_file}")
 
@@ -1,4 +1,9 @@
-import pandas as pd
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Shared Scripts'))
+from SeasonIngest import ingest_files
+from SeasonStore import list_games
 
 # Replace 'file1.csv' and 'file2.csv' with your actual file names
 file1 = 'AllFallCSV/FallBatPracCSV/9.1 Batting Practice.csv'
@@ -6,23 +11,20 @@ file2 = 'AllFallCSV/FallBatPracCSV/9.6 Batting Practice.csv'
 file3 = 'AllFallCSV/FallBatPracCSV/9.13 Batting Practice.csv'
 file4 = 'AllFallCSV/FallBatPracCSV/9.20 Batting Practice.csv'
 file5 = 'AllFallCSV/FallBatPracCSV/10.18 Batting Practice.csv'
-# file6 = 'AllFallCSV/FallScrimmageCSV/10.25 Scrimmage.csv'
-
+file6 = 'AllFallCSV/FallScrimmageCSV/10.25 Scrimmage.csv'
 
-# Read the CSV files into DataFrames
-df1 = pd.read_csv(file1)
-df2 = pd.read_csv(file2)
-df3 = pd.read_csv(file3)
-df4 = pd.read_csv(file4)
-df5 = pd.read_csv(file5)
-# df6 = pd.read_csv(file6)
+# Season store for the batting practice sessions (one Parquet file per GameID)
+store_dir = 'AllFallCSV/FallBatPracCSV/BattingPracticeStore'
 
+# Ingest the sessions into the store; sessions already ingested are skipped
+ingest_files([file1, file2, file3, file4, file5], store_dir)
 
+print(f"Files have been stored in {store_dir}: {', '.join(list_games(store_dir))}")
 
-# Concatenate the two DataFrames
-concatenated_df = pd.concat([df1, df2, df3, df4, df5])
+# Season store for the scrimmages, read by the scrimmage breakdown scripts
+scrimmage_store_dir = 'AllFallCSV/FallScrimmageCSV/ScrimmageStore'
 
-# Write the concatenated DataFrame to a new CSV file
-concatenated_df.to_csv('AllFallCSV/FallBatPracCSV/AllFallBattingPracticeData.csv', index=False)
+# Add new scrimmage files to the list as they come in
+ingest_files([file6], scrimmage_store_dir)
 
-print("Files have been concatenated and saved as ... ")
+print(f"Files have been stored in {scrimmage_store_dir}: {', '.join(list_games(scrimmage_store_dir))}")
@@ -1,8 +1,12 @@
-import pandas as pd
+import os
+import sys
 
-# Load the data from the CSV file
-file_path = '../Fall/AllFallCSV/FallScrimmageCSV/AllFallScrimmageData-Xwoba.csv'  # Replace with the path to your CSV file
-data = pd.read_csv(file_path)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Shared Scripts'))
+from SeasonStore import load_season
+
+# Load the scrimmage season from its store (built with SeasonIngest.py)
+store_dir = '../Fall/AllFallCSV/FallScrimmageCSV/ScrimmageStore'
+data = load_season(store_dir)
 
 # Set the pitcher's name to filter by
 pitcher_name = 'Schreier, Gaven'  # Replace 'X' with the name of the pitcher you want to filter
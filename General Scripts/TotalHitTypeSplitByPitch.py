@@ -1,7 +1,11 @@
-import pandas as pd
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Shared Scripts'))
+from SeasonStore import load_season
 
 # Step 1: Read the CSV file into a DataFrame
-df = pd.read_csv('../Fall/AllFallCSV/FallScrimmageCSV/AllFallScrimmageData.csv')
+df = load_season('../Fall/AllFallCSV/FallScrimmageCSV/ScrimmageStore', columns=['Pitcher', 'Batter', 'TaggedPitchType', 'TaggedHitType', 'PitchCall'])
 
 # Step 2: Filter for rows where PitchCall is 'InPlay'
 df_inplay = df[df['PitchCall'] == 'InPlay']
@@ -9,7 +13,8 @@ df_inplay = df[df['PitchCall'] == 'InPlay']
 # Step 3: Define a function to calculate hit type counts grouped by player and pitch type
 def calculate_hit_type_counts(df, player_col):
     # Group by player and TaggedPitchType, then count TaggedHitType occurrences
-    player_pitch_hit_type_counts = df.groupby([player_col, 'TaggedPitchType', 'TaggedHitType']).size().unstack(fill_value=0)
+    player_pitch_hit_type_counts = df.groupby([player_col, 'TaggedPitchType', 'TaggedHitType'], observed=True).size().unstack(fill_value=0)
+    player_pitch_hit_type_counts.columns = player_pitch_hit_type_counts.columns.astype(str)
 
     # Ensure all hit types are present even if they are missing
     for hit_type in ['Groundball', 'Linedrive', 'Flyball', 'Popup']:
@@ -1,9 +1,15 @@
-import pandas as pd
+import os
+import sys
 import numpy as np
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Shared Scripts'))
+from SeasonStore import load_season
+from EnrichedColumns import quadrant_labels
+from ZoneBinning import QUADRANT_NAMES
+
 # Load the data from a CSV file
-file_path = '../All Game CSVs/AllGameData 4-8-2025 xwoba.csv'  # Replace with your file path
-data = pd.read_csv(file_path)
+store_dir = '../All Game CSVs/SeasonStore'
+data = load_season(store_dir, columns=['PlateLocSide', 'PlateLocHeight', 'Quadrant', 'xwOBA'])
 
 # Define strike zone boundaries
 strike_zone_left = -0.83  # Left boundary
@@ -11,25 +17,14 @@ strike_zone_right = 0.83  # Right boundary
 strike_zone_bottom = 1.5  # Bottom boundary (knees)
 strike_zone_top = 4.0  # Top boundary (shoulders)
 
-# Define quadrants within the strike zone
-def get_quadrant(side, height):
-    if side < 0 and height > 2.75:
-        return 'Top Left'
-    elif side >= 0 and height > 2.75:
-        return 'Top Right'
-    elif side < 0 and height <= 2.75:
-        return 'Bottom Left'
-    else:
-        return 'Bottom Right'
-
-# Apply the quadrant function to each pitch
-data['Quadrant'] = data.apply(lambda row: get_quadrant(row['PlateLocSide'], row['PlateLocHeight']), axis=1)
+# Strike zone quadrant of every pitch, stored at ingest (pitches without a location get none)
+data['Quadrant'] = quadrant_labels(data, QUADRANT_NAMES)
 
 # Filter out rows without valid xwOBA values
 valid_xwOBA = data['xwOBA'].notnull()
 
 # Calculate the average xwOBA for each quadrant
-average_xwOBA = data[valid_xwOBA].groupby('Quadrant')['xwOBA'].mean()
+average_xwOBA = data[valid_xwOBA].groupby('Quadrant', observed=True)['xwOBA'].mean()
 
 # Convert the result to a DataFrame for better presentation
 average_xwOBA_df = average_xwOBA.reset_index()
@@ -1,13 +1,18 @@
+import os
+import sys
 import pandas as pd
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Shared Scripts'))
+from SeasonStore import load_season
+
 # Load the CSV file (replace with your actual CSV filename)
-df = pd.read_csv('../All Game CSVs/AllGameData 4-8-2025 xwoba.csv')
+df = load_season('../All Game CSVs/SeasonStore', columns=['Batter', 'xwOBA'])
 
 # Ensure xwOBA is a numeric column (in case of any non-numeric entries)
 df['xwOBA'] = pd.to_numeric(df['xwOBA'], errors='coerce')
 
 # Group by 'Batter' and calculate the average xwOBA for each batter
-average_xwOBA_per_batter = df.groupby('Batter')['xwOBA'].mean().reset_index()
+average_xwOBA_per_batter = df.groupby('Batter', observed=True)['xwOBA'].mean().reset_index()
 
 # Rename the column for clarity
 average_xwOBA_per_batter.rename(columns={'xwOBA': 'Average_xwOBA'}, inplace=True)
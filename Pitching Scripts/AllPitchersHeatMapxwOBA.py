@@ -1,12 +1,15 @@
 import os
-import pandas as pd
+import sys
 import matplotlib.pyplot as plt
 import seaborn as sns
 import numpy as np
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Shared Scripts'))
+from SeasonStore import load_season
+
 # Load the full dataset
-file_path = '../Fall/AllFallCSV/FallScrimmageCSV/AllFallScrimmageData-Xwoba.csv'  # Replace with your file path
-data = pd.read_csv(file_path)
+store_dir = '../Fall/AllFallCSV/FallScrimmageCSV/ScrimmageStore'
+data = load_season(store_dir, columns=['PlateLocSide', 'PlateLocHeight', 'xwOBA'])
 
 # Define output directory
 output_dir = 'AggregatedPitcherHeatMaps'
@@ -1,11 +1,16 @@
 import os
-import pandas as pd
+import sys
 import matplotlib.pyplot as plt
 import numpy as np
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Shared Scripts'))
+from SeasonStore import load_season
+from BattedBall import HARD_HIT_MPH
+from BitmapIndex import build_index
+
 # Load the full dataset
-file_path = '../Fall/AllFallCSV/FallScrimmageCSV/AllFallScrimmageData-Xwoba.csv'  # Replace with your file path
-data = pd.read_csv(file_path)
+store_dir = '../Fall/AllFallCSV/FallScrimmageCSV/ScrimmageStore'
+data = load_season(store_dir, columns=['PlateLocSide', 'PlateLocHeight', 'ExitSpeed', 'PitchCall'])
 
 # Define output directory
 output_dir = 'AggregatedPitcherCirclePlots'
@@ -60,13 +65,16 @@ def create_density_circle_plot(df, condition, output_path, title):
     plt.close()
 
 
+# Bitmaps for every PitchCall value and for hard hits in play, built in one pass
+index = build_index(data)
+
 # Define conditions for different categories
 conditions = {
-    'Hard Hit': (data['ExitSpeed'] > 85) & (data['PitchCall'] == 'InPlay'),
-    'Ball Called': data['PitchCall'] == 'BallCalled',
-    'Strike Swinging': data['PitchCall'] == 'StrikeSwinging',
-    'Strike Called': data['PitchCall'] == 'StrikeCalled',
-    'Normal Pitches': data['ExitSpeed'] <= 85
+    'Hard Hit': index.get('HardHit', True).to_mask(),
+    'Ball Called': index.get('PitchCall', 'BallCalled').to_mask(),
+    'Strike Swinging': index.get('PitchCall', 'StrikeSwinging').to_mask(),
+    'Strike Called': index.get('PitchCall', 'StrikeCalled').to_mask(),
+    'Normal Pitches': (data['ExitSpeed'] < HARD_HIT_MPH).to_numpy()
 }
 
 # Generate circle plots for each category
@@ -1,10 +1,17 @@
+import os
+import sys
 import matplotlib.pyplot as plt
 import pandas as pd
 import numpy as np
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Shared Scripts'))
+from TrackmanSchema import load_trackman
+from BattedBall import is_hard_hit
+from BitmapIndex import build_index
+
 # Load the data from a CSV file
 file_path = 'SchreierGavenFallPitching.csv'  # Replace with the actual path to your CSV file
-data = pd.read_csv(file_path)
+data = load_trackman(file_path, columns=['PlateLocHeight', 'PlateLocSide', 'ExitSpeed', 'TaggedPitchType', 'PitchCall'])
 
 # Extract the necessary columns
 plate_loc_height = data['PlateLocHeight']
@@ -23,14 +30,18 @@ colors = [pitch_colors.get(pitch, 'gray') for pitch in pitch_type]  # Default to
 default_size = 50  # Small size for pitches with no exit speed
 sizes = np.where(pd.isna(exit_speed), default_size, np.sqrt(exit_speed) * 1)  # Scale exit speed or set default
 
-# Mark pitches with Exit Speed > 85 as larger and use special marker
-hard_hit_marker = exit_speed > 85
-sizes[hard_hit_marker] = 200  # Assign larger size for hard-hit pitches (over 85 mph)
+# Mark hard-hit pitches (BattedBall.HARD_HIT_MPH and up) as larger and use special marker
+hard_hit_marker = is_hard_hit(exit_speed).to_numpy()
+sizes[hard_hit_marker] = 200  # Assign larger size for hard-hit pitches
 
-# Define markers for pitch outcomes
-ball_marker = pitch_called == 'BallCalled'
-strike_swing_marker = pitch_called == 'StrikeSwinging'
-strike_called_marker = pitch_called == 'StrikeCalled'
+# Define markers for pitch outcomes from the PitchCall bitmaps
+index = build_index(data, columns=['PitchCall'])
+ball_bitmap = index.get('PitchCall', 'BallCalled')
+strike_swing_bitmap = index.get('PitchCall', 'StrikeSwinging')
+strike_called_bitmap = index.get('PitchCall', 'StrikeCalled')
+ball_marker = ball_bitmap.to_mask()
+strike_swing_marker = strike_swing_bitmap.to_mask()
+strike_called_marker = strike_called_bitmap.to_mask()
 
 # Function to create scatter plot for each pitch category
 def plot_pitches(marker, title, xlabel, ylabel):
@@ -68,7 +79,7 @@ def plot_pitches(marker, title, xlabel, ylabel):
     plt.show()
 
 # Plot individual graphs for each marker
-plot_pitches(~hard_hit_marker & ~ball_marker & ~strike_swing_marker & ~strike_called_marker,
+plot_pitches(~hard_hit_marker & (~(ball_bitmap | strike_swing_bitmap | strike_called_bitmap)).to_mask(),
              'Normal Pitches', 'Plate Location Side (Horizontal)', 'Plate Location Height (Vertical)')
 
 plot_pitches(hard_hit_marker,
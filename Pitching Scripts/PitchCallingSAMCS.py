@@ -1,32 +1,17 @@
-import pandas as pd
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Shared Scripts'))
+from TrackmanSchema import load_trackman
+from PitchTransitions import ORDER_COLUMN, PA_COLUMNS, STRIKE_CALLS, transition_counts
 
 # Load the data from a CSV file
 file_path = 'SchreierGavenFallPitching.csv'  # Replace with the actual path to your CSV file
-data = pd.read_csv(file_path)
-
-# Extract the necessary columns
-pitch_type = data['TaggedPitchType']  # Column for pitch type
-pitch_called = data['PitchCall']      # Column for pitch outcome
-
-# Initialize a list to store the previous pitch data before each strike
-previous_pitch_tally = []
-
-# Loop through the data starting from the second row to compare with the previous row
-for i in range(1, len(data)):
-    # Check if the current pitch resulted in a strike swinging or strike called
-    if pitch_called[i] in ['StrikeSwinging', 'StrikeCalled']:
-        # Append the previous pitch type and current pitch type to the tally
-        previous_pitch_tally.append({
-            'PreviousPitch': pitch_type[i-1],  # Previous pitch type
-            'CurrentPitch': pitch_type[i],     # Current pitch type that was a strike
-            'StrikeType': pitch_called[i]      # Whether it was swinging or called
-        })
-
-# Convert the list of tallies into a DataFrame
-previous_pitch_df = pd.DataFrame(previous_pitch_tally)
+data = load_trackman(file_path, columns=['Pitcher', 'TaggedPitchType', 'PitchCall'] + PA_COLUMNS + [ORDER_COLUMN])
 
-# Group by previous and current pitch to tally occurrences
-pitch_tally = previous_pitch_df.groupby(['PreviousPitch', 'CurrentPitch', 'StrikeType']).size().unstack(fill_value=0)
+# Tally the previous pitch before each strike swinging or strike called; pairs never cross plate appearances
+transitions = transition_counts(data, by='Pitcher', outcomes=STRIKE_CALLS)
+pitch_tally = transitions.tally()
 
 # Display the tally of previous pitches before strike swings/calls
 print(pitch_tally)
@@ -0,0 +1,51 @@
+import os
+import sys
+import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Shared Scripts'))
+from SeasonStore import load_season
+from PitchTransitions import ORDER_COLUMN, PA_COLUMNS
+from SequenceMining import mine_sequences
+
+# Load the full dataset (modify this path to your actual dataset)
+store_dir = '../Fall/AllFallCSV/FallScrimmageCSV/ScrimmageStore'
+data = load_season(store_dir, columns=['Pitcher', 'TaggedPitchType', 'PitchCall', 'ExitSpeed',
+                                         'PlateLocSide', 'PlateLocHeight'] + PA_COLUMNS + [ORDER_COLUMN])
+
+# Sequence settings
+MAX_SEQUENCE_LENGTH = 4  # Longest sequence counted (pitches)
+MIN_SEQUENCE_LENGTH = 2  # Shortest sequence reported
+USE_ZONES = False  # Split each pitch type by its 3x3 zone cell
+MIN_TIMES_THROWN = 3  # Ignore sequences thrown fewer times than this
+TOP_K = 10  # Sequences reported per outcome
+REPORT_OUTCOMES = ['Whiff', 'Weak Contact']
+
+# Count every sequence of every pitcher in one pass
+sequences = mine_sequences(data, max_length=MAX_SEQUENCE_LENGTH, zones=USE_ZONES)
+
+# Define directory for saving output
+output_dir = 'PitcherData-Copy-Original'
+os.makedirs(output_dir, exist_ok=True)
+
+
+# Function to sanitize file/folder names
+def sanitize_name(name):
+    return name.replace(',', '').replace(' ', '')
+
+
+# Save each pitcher's best sequences for each outcome
+for pitcher in data['Pitcher'].dropna().unique():
+    sanitized_pitcher_name = sanitize_name(pitcher)
+    pitcher_folder = os.path.join(output_dir, sanitized_pitcher_name)
+    os.makedirs(pitcher_folder, exist_ok=True)
+
+    top_sequences = []
+    for outcome in REPORT_OUTCOMES:
+        for length in range(MIN_SEQUENCE_LENGTH, MAX_SEQUENCE_LENGTH + 1):
+            top = sequences.top_k(pitcher, k=TOP_K, length=length, outcome=outcome, min_count=MIN_TIMES_THROWN)
+            top_sequences.append(top[top[outcome] > 0].assign(RankedBy=outcome))
+
+    output_file_path = os.path.join(pitcher_folder, f'{sanitized_pitcher_name}_top_pitch_sequences.csv')
+    pd.concat(top_sequences, ignore_index=True).to_csv(output_file_path, index=False)
+
+    print(f"Top pitch sequences saved to {output_file_path}")
@@ -1,9 +1,18 @@
-import pandas as pd
-import numpy as np
+import os
+import sys
 
-# Function to load CSV file
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Shared Scripts'))
+from EnrichedColumns import SHARPNESS_ANGLES, pitch_sharpness
+from PhysicsCache import ensure_cache, load_index, open_columns
+
+# Only the angle columns are needed for sharpness; the grouping keys come from the row index
+SHAPE_COLUMNS = [col for pair in SHARPNESS_ANGLES for col in pair]
+
+# Function to load the pitch angles; the CSV is only parsed the first time, later runs
+# memory-map the cached arrays
 def load_csv_file(file_path):
-    return pd.read_csv(file_path)
+    cache_dir = ensure_cache(file_path)
+    return load_index(cache_dir, columns=['Pitcher', 'TaggedPitchType']), open_columns(cache_dir, SHAPE_COLUMNS)
 
 # Function to save the result to a CSV file
 def save_to_csv(dataframe, output_path):
@@ -13,16 +22,13 @@ def save_to_csv(dataframe, output_path):
 file_path = "../All Game CSVs/Game Files/FDU-AC.csv"
 
 # Load the CSV data
-shape_data = load_csv_file(file_path)
+shape_data, angles = load_csv_file(file_path)
 
-# Create the sharpness metric for each row using Boyle's formula
-shape_data['PitchSharpness'] = (
-    np.abs(np.abs(shape_data['VertApprAngle']) - np.abs(shape_data['VertRelAngle'])) +
-    np.abs(np.abs(shape_data['HorzApprAngle']) - np.abs(shape_data['HorzRelAngle']))
-) * 10
+# Create the sharpness metric for each row using Boyle's formula (the same definition stored at ingest)
+shape_data['PitchSharpness'] = pitch_sharpness(angles)
 
 # Group by Pitcher and TaggedPitchType to get average sharpness
-avg_sharpness_by_pitcher = shape_data.groupby(['Pitcher', 'TaggedPitchType'])['PitchSharpness'].mean().reset_index()
+avg_sharpness_by_pitcher = shape_data.groupby(['Pitcher', 'TaggedPitchType'], observed=True)['PitchSharpness'].mean().reset_index()
 avg_sharpness_by_pitcher = avg_sharpness_by_pitcher.round(2)
 
 # Ask the user for an output file path
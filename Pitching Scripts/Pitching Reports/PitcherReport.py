@@ -18,6 +18,13 @@ import joypy
 import webbrowser
 import tempfile
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'Shared Scripts'))
+from ExcelCache import is_excel_file, load_workbook
+from TrackmanFiles import read_raw
+from EnrichedColumns import PITCH_CATEGORIES, derived_column
+from PhysicsCache import ensure_cache, open_columns
+from TiltStats import clock_degrees, tilt_stats
+
 ## -- LOAD REPORT -- ##
 script_dir = os.path.dirname(os.path.abspath(__file__))
 
@@ -34,165 +41,207 @@ OUTPUT_PDF_PATH = "../../Game Reports/StevensScoutingReport/Pitcher Reports/Gonz
 #     trackman_file = os.path.abspath(trackman_file)  # Ensure full absolute path
 #     print(f"Trackman File selected: {trackman_file}")
 
-# Validate if the file exists before proceeding
-if not os.path.exists(trackman_file):
-    print(f"Error: File not found at {trackman_file}")
-    sys.exit(1)
 
-# Convert Excel to CSV if needed
-if trackman_file.lower().endswith((".xlsx", ".xls")):
-    print("Detected Excel file. Converting to CSV...")
+def load_report_data(trackman_file):
+    """
+    Loads the report input. Excel workbooks are converted once and cached by content
+    hash, so regenerating a report from the same workbook skips Excel parsing.
 
-    # Load the Excel file
-    try:
-        excel_data = pd.read_excel(trackman_file)
-    except Exception as e:
-        print(f"Error loading Excel file: {e}")
-        sys.exit(1)
+    Parameters:
+        trackman_file (str): Path to the TrackMan CSV or Excel file.
 
-    # If 'Tilt' column exists, ensure it is formatted correctly from HH:MM:SS to HH:MM
-    if "Tilt" in excel_data.columns:
+    Returns:
+        pd.DataFrame: The TrackMan data.
+    """
+    # Validate if the file exists before proceeding
+    if not os.path.exists(trackman_file):
+        print(f"Error: File not found at {trackman_file}")
+        sys.exit(1)
 
-        def fix_tilt_format(value):
-            """Convert HH:MM:SS to HH:MM by removing seconds."""
-            if pd.isna(value) or not isinstance(value, str):
-                return value  # Keep NaN values unchanged
-            parts = value.split(":")
-            if len(parts) == 3:  # HH:MM:SS format detected
-                return f"{parts[0]}:{parts[1]}"  # Keep only HH:MM
-            return value  # Already in HH:MM
+    # Convert Excel to CSV if needed
+    if is_excel_file(trackman_file):
+        try:
+            return load_workbook(trackman_file)
+        except Exception as e:
+            print(f"Error loading Excel file: {e}")
+            sys.exit(1)
 
+    return read_raw(trackman_file)
 
-        # Apply function to Tilt column
-        excel_data["Tilt"] = excel_data["Tilt"].astype(str).apply(fix_tilt_format)
 
-    # Convert to CSV in the same directory
-    csv_path = trackman_file.rsplit(".", 1)[0] + ".csv"
-    excel_data.to_csv(csv_path, index=False)
+def open_physics(trackman_file, data):
+    """
+    Opens the memory-mapped physics arrays (PhysicsCache.py) of a CSV input, building the
+    cache on first use. Returns None for workbooks, or when the cache's rows do not line
+    up with data.
 
-    print(f"Converted and saved CSV file at: {csv_path}")
+    Parameters:
+        trackman_file (str): Path to the TrackMan file data was read from.
+        data (pd.DataFrame): The data as read, whose index is each row's position in the file.
 
-    # Use the converted CSV file for further processing
-    trackman_file = csv_path
+    Returns:
+        dict: Column name -> read-only float32 array, or None.
+    """
+    if is_excel_file(trackman_file):
+        return None
+    physics = open_columns(ensure_cache(trackman_file))
+    return physics if all(len(values) == len(data) for values in physics.values()) else None
 
 
 ## -- FUNCTIONS -- ##
-def tilt_to_minutes(tilt_time):
-    """Converts a tilt time in HH:MM format to total minutes on a 12-hour modular clock."""
-    if tilt_time is None or not isinstance(tilt_time, str) or ":" not in tilt_time:
-        return None  # Handle invalid inputs
-
-    hours, minutes = map(int, tilt_time.split(":"))
-
-    # Convert 12-hour format to "modular minutes"
-    hours = 0 if hours == 12 else hours  # Convert 12:XX → 0:XX
-    total_minutes = hours * 60 + minutes
-
-    return total_minutes
-
-
-def minutes_to_tilt(total_minutes):
-    """Converts total minutes back to a tilt time in HH:MM format."""
-    if total_minutes is None:
-        return None  # Handle invalid inputs
-
-    hours = (total_minutes // 60) % 12  # Modulo 12-hour clock
-    minutes = total_minutes % 60
-
-    # Convert 0 to 12 for the clock display
-    tilt_time = f"{12 if hours == 0 else hours}:{minutes:02d}"
-
-    return tilt_time
-
-
-def average_tilt(tilt_values):
-    """Computes the correct average tilt using circular statistics to avoid truncation issues."""
-    angles = []
-
-    for tilt in tilt_values:
-        minutes = tilt_to_minutes(tilt)
-        if minutes is not None:
-            angle = (minutes / (12 * 60)) * 360  # Convert minutes to degrees (mod 360)
-            angles.append(np.deg2rad(angle))  # Convert degrees to radians
-
-    if not angles:
-        return None  # No valid tilt values
-
-    # Compute vector sum to find circular mean
-    mean_x = np.mean(np.cos(angles))
-    mean_y = np.mean(np.sin(angles))
-    avg_angle = np.arctan2(mean_y, mean_x)  # Compute the mean angle
+# Share of pitches that must be tagged (TaggedPitchType other than "Other") to report tagged pitch types
+SUFFICIENT_TAGGED_SHARE = 0.90
+
+# Chart colors of tagged pitch types, and of the categories used when tagging is insufficient
+TAGGED_COLOR_MAP = {
+    "Fastball": "red",
+    "Slider": "yellow",
+    "Curveball": "blue",
+    "Changeup": "green",
+    "Cutter": "mediumorchid",
+    "Sinker": "orange",
+    "Splitter": "cyan",
+    "Knuckleball": "purple",
+    "Sweeper": "brown",
+    "Slurve": "lime",
+    "Forkball": "darkblue",
+    "Screwball": "magenta",
+    "Other": "gray"
+}
+CATEGORY_COLOR_MAP = {
+    "Fastball": "red",
+    "Offspeed": "green",
+    "Breaking": "blue",
+    "Other": "gray"
+}
+
+# Summary table column -> (CSV column, statistic); "absmax" is the value with the largest magnitude
+SUMMARY_COLUMNS = {
+    "Max Velo": ("RelSpeed", "absmax"),
+    "Avg Velo": ("RelSpeed", "mean"),
+    "Spin Rate": ("SpinRate", "mean"),
+    "Max IVB": ("InducedVertBreak", "absmax"),
+    "Max HB": ("HorzBreak", "absmax"),
+    "Avg IVB": ("InducedVertBreak", "mean"),
+    "Avg HB": ("HorzBreak", "mean"),
+    "Tilt": ("Tilt", "tilt"),
+    "Extension": ("Extension", "mean"),
+    "VAA": ("VertApprAngle", "mean"),
+}
+
+
+def has_sufficient_tagged_data(data):
+    """Checks whether at least 90% of pitches have a TaggedPitchType other than "Other"."""
+    return bool((data["TaggedPitchType"] != "Other").mean() >= SUFFICIENT_TAGGED_SHARE)
+
+
+def pitch_type_mapping(data, by=None):
+    """
+    Assigns every pitch its MappedPitchType. A pitcher with at least 90% of pitches
+    tagged keeps the tagged types; otherwise pitches are grouped into PITCH_CATEGORIES
+    from the tagged type, or the auto type when untagged ("Other" outside the categories).
 
-    if avg_angle < 0:
-        avg_angle += 2 * np.pi  # Ensure angle is positive
+    Parameters:
+        data (pd.DataFrame): The DataFrame containing pitch data.
+        by (str, optional): Column identifying the pitcher; tagging is judged per pitcher.
 
-    # Convert back to total minutes on the modular clock
-    avg_minutes = (np.rad2deg(avg_angle) / 360) * (12 * 60)
-    avg_minutes_rounded = int(round(avg_minutes / 15.0) * 15)
+    Returns:
+        tuple: (mapped, sufficient)
+               - mapped (pd.Series): The mapped pitch type of each pitch.
+               - sufficient (pd.Series): Whether each pitch's pitcher has sufficient tagged data.
+    """
+    tagged = data["TaggedPitchType"]
+    is_tagged = tagged != "Other"
+    if by is None:
+        sufficient = pd.Series(is_tagged.mean() >= SUFFICIENT_TAGGED_SHARE, index=data.index)
+    else:
+        sufficient = is_tagged.groupby(data[by], sort=False).transform("mean") >= SUFFICIENT_TAGGED_SHARE
 
-    return minutes_to_tilt(round(avg_minutes_rounded))
+    category = derived_column(data, "PitchCategory").astype("string").fillna("Other")
+    return tagged.where(sufficient, category), sufficient
 
 
-def get_pitch_color_map_and_types(data):
+def get_pitch_color_map_and_types(data, sufficient_tagged_data=None, mapped_pitch_types=None):
     """
     Determines whether there is sufficient tagged pitch data,
     assigns pitch types accordingly, and returns:
       1) color_map (dict)
-      2) updated DataFrame with 'MappedPitchType' column
+      2) DataFrame with a 'MappedPitchType' column
 
     Parameters:
         data (pd.DataFrame): The DataFrame containing pitch data.
+        sufficient_tagged_data (bool, optional): Whether the tagged types are used. Worked out from data when omitted.
+        mapped_pitch_types (pd.Series, optional): Pitch types already mapped by pitch_type_mapping.
 
     Returns:
         tuple: (color_map, data)
                - color_map (dict): A dictionary mapping pitch types to colors.
-               - data (pd.DataFrame): The updated DataFrame with a 'MappedPitchType' column.
+               - data (pd.DataFrame): A copy of the data with a 'MappedPitchType' column.
     """
     # Pitch classification
-    sufficient_tagged_data, pitch_types = classify_pitch_types(data)
-
-    # Assign color map
-    if sufficient_tagged_data:
-        color_map = {
-            "Fastball": "red",
-            "Slider": "yellow",
-            "Curveball": "blue",
-            "Changeup": "green",
-            "Cutter": "mediumorchid",
-            "Sinker": "orange",
-            "Splitter": "cyan",
-            "Knuckleball": "purple",
-            "Sweeper": "brown",
-            "Slurve": "lime",
-            "Forkball": "darkblue",
-            "Screwball": "magenta",
-            "Other": "gray"
-        }
-        data["MappedPitchType"] = data["TaggedPitchType"]
+    if sufficient_tagged_data is None:
+        sufficient_tagged_data = has_sufficient_tagged_data(data)
+
+    # Assign color map and map every pitch at once
+    color_map = TAGGED_COLOR_MAP if sufficient_tagged_data else CATEGORY_COLOR_MAP
+    if mapped_pitch_types is None:
+        mapped = data["TaggedPitchType"]
+        if not sufficient_tagged_data:
+            # Untagged pitches fall back to the auto type; anything outside the categories is "Other"
+            mapped = derived_column(data, "PitchCategory").astype("string").fillna("Other")
     else:
-        color_map = {
-            "Fastball": "red",
-            "Offspeed": "green",
-            "Breaking": "blue",
-            "Other": "gray"
-        }
-
-        def map_pitch_to_category(pitch):
-            for category, pitch_set in pitch_types.items():
-                if pitch in pitch_set:
-                    return category
-            return "Other"
-
-        data["MappedPitchType"] = data.apply(
-            lambda row: map_pitch_to_category(row["TaggedPitchType"])
-            if row["TaggedPitchType"] != "Other"
-            else map_pitch_to_category(row["AutoPitchType"]),
-            axis=1
-        )
+        mapped = mapped_pitch_types
 
+    # Joined in one step; inserting a column into a wide TrackMan frame is slow
+    data = pd.concat([data.drop(columns=["MappedPitchType"], errors="ignore"), mapped.rename("MappedPitchType")],
+                     axis=1)
     return color_map, data
 
 
+class ReportContext:
+    """
+    One report's pitch data with its pitch-type mapping. The mapping (classification,
+    MappedPitchType column and color map) is computed the first time a chart or the
+    summary table asks for it and shared by all of them after that, unless it is passed
+    in from a classification of the whole staff (pitch_type_mapping). The movement and
+    release charts read their columns from the memory-mapped physics arrays when the
+    context is given them (open_physics); data's index then locates its rows in them.
+    """
+
+    def __init__(self, data, sufficient_tagged_data=None, mapped_pitch_types=None, physics=None):
+        self.raw_data = data
+        self._sufficient = sufficient_tagged_data
+        self._mapped = mapped_pitch_types
+        self._mapping = None
+        self.physics = physics
+
+    @property
+    def sufficient_tagged_data(self):
+        """Whether the report uses the tagged pitch types rather than the pitch categories."""
+        if self._sufficient is None:
+            self._sufficient = has_sufficient_tagged_data(self.raw_data)
+        return self._sufficient
+
+    @property
+    def pitch_mapping(self):
+        """Returns (color_map, data with MappedPitchType), computing them on first use."""
+        if self._mapping is None:
+            self._mapping = get_pitch_color_map_and_types(self.raw_data, self.sufficient_tagged_data, self._mapped)
+        return self._mapping
+
+    def physics_columns(self, columns):
+        """Returns physics columns for the report's rows, from the physics arrays when the context has them."""
+        if self.physics is None:
+            return self.raw_data[columns]
+        rows = self.raw_data.index.to_numpy()
+        return pd.DataFrame({col: self.physics[col][rows] for col in columns}, index=self.raw_data.index)
+
+
+def report_context(data):
+    """Returns a ReportContext for data (a context is returned as it is)."""
+    return data if isinstance(data, ReportContext) else ReportContext(data)
+
+
 def draw_home_plate(ax):
     """
     Draws a home plate outline beneath the strike zone, with a white fill.
@@ -297,18 +346,12 @@ def classify_pitch_types(data):
                                  Otherwise, returns a dictionary grouping pitch types.
     """
 
-    total_pitches = len(data)
-    tagged_pitches = data[data["TaggedPitchType"] != "Other"].shape[0]
-    sufficient_tagged_data = (tagged_pitches / total_pitches) >= 0.90
+    sufficient_tagged_data = has_sufficient_tagged_data(data)
 
     if sufficient_tagged_data:
         pitch_types = set(data["TaggedPitchType"].unique()) - {"Other"}  # Auto-detect unique pitch types
     else:
-        pitch_types = {
-            "Fastball": {"Four-Seam", "Two-Seam", "Fastball", "Cutter", "Sinker"},
-            "Offspeed": {"Splitter", "Changeup", "Forkball", "Screwball"},
-            "Breaking": {"Slider", "Curveball", "Knuckleball", "Sweeper", "Slurve", "Other"}
-        }
+        pitch_types = PITCH_CATEGORIES
 
     return sufficient_tagged_data, pitch_types
 
@@ -319,18 +362,19 @@ def generate_pitch_color_legend(data):
     based on whether the data has sufficient tagged pitches or not.
 
     Parameters:
-        data (pd.DataFrame): The DataFrame containing pitch data.
+        data (pd.DataFrame or ReportContext): The pitch data, or the context shared by the charts.
 
     Returns:
         str: Path to the temporary legend image.
     """
     # Check if required columns exist
     required_columns = {"TaggedPitchType", "AutoPitchType"}
-    if not required_columns.issubset(data.columns):
+    context = report_context(data)
+    if not required_columns.issubset(context.raw_data.columns):
         print("Error: Required columns not found in dataset.")
         return None
 
-    color_map, data = get_pitch_color_map_and_types(data)
+    color_map, data = context.pitch_mapping
 
     # Get only the pitch types that actually appear in this dataset
     pitches_in_data = data["MappedPitchType"].unique()
@@ -355,103 +399,78 @@ def generate_pitch_color_legend(data):
     return temp_file.name
 
 
-def generate_pitch_summary_table(data):
+def finish_pitch_summary(summary, sufficient_tagged_data):
+    """Orders one pitcher's summary by count; untagged pitchers list every category, even unused ones."""
+    summary = summary[["Pitch Type", "Count"] + list(SUMMARY_COLUMNS)]
+
+    if not sufficient_tagged_data:
+        missing = [category for category in PITCH_CATEGORIES if category not in set(summary["Pitch Type"])]
+        summary = pd.concat([summary, pd.DataFrame({"Pitch Type": missing, "Count": 0})], ignore_index=True)
+
+    summary = summary.sort_values(by="Count", ascending=False, kind="stable")
+
+    # Missing stats show as empty cells
+    return summary.astype(object).where(summary.notna(), None)
+
+
+def generate_pitch_summary_table(data, by=None, mapping=None):
     """
-    Processes pitch data and generates a summary table in a DataFrame format.
+    Processes pitch data and generates a summary table in a DataFrame format. Every
+    statistic for every pitch type (and pitcher) comes out of one grouped aggregation.
 
     Parameters:
-    - data (pd.DataFrame): The input dataset containing pitch metrics.
+    - data (pd.DataFrame or ReportContext): The input dataset containing pitch metrics.
+    - by (str, optional): Column identifying the pitcher (e.g. "Pitcher") to summarize a
+      whole staff in one call.
+    - mapping (tuple, optional): (mapped, sufficient) from pitch_type_mapping(data, by), to
+      share one classification with the charts. Worked out from data when omitted.
 
     Returns:
-    - pd.DataFrame: A cleaned and structured pitch summary table.
+    - pd.DataFrame: A cleaned and structured pitch summary table, or a dict of one table
+      per pitcher when by is given.
     """
-
-    # Call the pitch classification function
-    sufficient_tagged_data, pitch_types = classify_pitch_types(data)
-
-    # Define mapping of CSV column headers to table column names
-    column_mapping = {
-        "RelSpeed": ["Max Velo", "Avg Velo"],
-        "SpinRate": ["Spin Rate"],
-        "InducedVertBreak": ["Max IVB", "Avg IVB"],
-        "HorzBreak": ["Max HB", "Avg HB"],
-        "Tilt": ["Tilt"],
-        "Extension": ["Extension"],
-        "VertApprAngle": ["VAA"]
-    }
-
-    # Initialize a dictionary to store stats for each pitch type
-    pitch_stats = {pitch: {"Count": 0} for pitch in (pitch_types if sufficient_tagged_data else pitch_types.keys())}
-
-    for table_col in sum(column_mapping.values(), []):  # Flatten the mapping values
-        for pitch in pitch_stats:
-            pitch_stats[pitch][table_col] = None
+    context = data if isinstance(data, ReportContext) else None
+    if context is not None:
+        data = context.raw_data
+
+    if context is not None and by is None:
+        # Reuse the classification the charts share
+        mapped = context.pitch_mapping[1]["MappedPitchType"]
+        sufficient = pd.Series(context.sufficient_tagged_data, index=data.index)
+    else:
+        mapped, sufficient = pitch_type_mapping(data, by) if mapping is None else mapping
+    pitch_type = mapped.where(mapped != "Other")  # "Other" pitches are left out of the table
+    keys = ([data[by]] if by else []) + [pitch_type.rename("Pitch Type")]
 
     # Ensure relevant columns are numeric (EXCLUDE Tilt)
-    for csv_col in column_mapping.keys():
-        if csv_col != "Tilt":  # Skip Tilt to prevent conversion to NaN
-            data[csv_col] = pd.to_numeric(data[csv_col], errors="coerce")
-
-    # Loop through data and compute values per pitch type
-    for _, row in data.iterrows():
-        # Determine pitch type based on tagging mode
-        if sufficient_tagged_data:
-            pitch_type = row["TaggedPitchType"]
+    csv_columns = list(dict.fromkeys(col for col, stat in SUMMARY_COLUMNS.values() if stat != "tilt"))
+    values = data[csv_columns].apply(pd.to_numeric, errors="coerce")
+
+    grouped = values.groupby(keys, sort=False, observed=True)
+    means, highs, lows = grouped.mean(), grouped.max(), grouped.min()
+
+    columns = {"Count": grouped.size()}
+    for table_col, (csv_col, stat) in SUMMARY_COLUMNS.items():
+        if stat == "absmax":
+            # Largest magnitude, keeping its sign
+            columns[table_col] = highs[csv_col].where(highs[csv_col].abs() >= lows[csv_col].abs(), lows[csv_col])
+        elif stat == "mean":
+            columns[table_col] = means[csv_col]
         else:
-            pitch_type = row["TaggedPitchType"] if row["TaggedPitchType"] != "Other" else row["AutoPitchType"]
-            for category, pitch_set in pitch_types.items():
-                if pitch_type in pitch_set:
-                    pitch_type = category
-                    break
-
-        if pitch_type not in pitch_stats:
-            continue  # Skip unknown pitch types
-
-        # Increment count
-        pitch_stats[pitch_type]["Count"] += 1
-
-        # Collect numerical data for calculations
-        for csv_col, table_cols in column_mapping.items():
-            value = row[csv_col]
-            if pd.notna(value):  # Ignore NaNs
-                for table_col in table_cols:
-                    if pitch_stats[pitch_type][table_col] is None:
-                        pitch_stats[pitch_type][table_col] = []
-                    pitch_stats[pitch_type][table_col].append(value)
-
-    # Process collected stats
-    for pitch, stats in pitch_stats.items():
-        for csv_col, table_cols in column_mapping.items():
-            for table_col in table_cols:
-                if isinstance(stats[table_col], list) and stats[table_col]:  # If values were collected
-                    if "Max" in table_col:
-                        pitch_stats[pitch][table_col] = round(max(stats[table_col], key=abs),
-                                                              1)  # Fix: Use absolute max
-                    elif "Tilt" in table_col:
-                        pitch_stats[pitch][table_col] = average_tilt(stats[table_col])
-                    else:
-                        pitch_stats[pitch][table_col] = round(sum(stats[table_col]) / len(stats[table_col]),
-                                                              1)  # Fix: Ensure avg calculation
-
-    # Convert dictionary to DataFrame
-    df_pitch_summary = pd.DataFrame.from_dict(pitch_stats, orient="index").reset_index()
-    df_pitch_summary.rename(columns={"index": "Pitch Type"}, inplace=True)
-
-    # Define the desired column order for readability
-    column_order = [
-        "Pitch Type", "Count", "Max Velo", "Avg Velo", "Spin Rate",
-        "Max IVB", "Max HB", "Avg IVB", "Avg HB", "Tilt", "Extension", "VAA"
-    ]
-
-    # Reorder DataFrame columns and sort by Count
-    df_pitch_summary = df_pitch_summary[column_order]
-    df_pitch_summary.sort_values(by="Count", ascending=False, inplace=True)
+            # Circular mean of every group's tilt in one pass
+            columns[table_col] = tilt_stats(derived_column(data, "TiltMinutes"), keys)["Tilt"].reindex(means.index)
 
     # Round all numerical columns to 1 decimal place
-    numeric_cols = df_pitch_summary.select_dtypes(include=['float64']).columns
-    df_pitch_summary[numeric_cols] = df_pitch_summary[numeric_cols].round(1)
+    summary = pd.concat(columns, axis=1).round(1).reset_index()
 
-    return df_pitch_summary
+    if by is None:
+        return finish_pitch_summary(summary, bool(sufficient.all()))
+
+    per_pitcher = dict(list(summary.groupby(by, sort=False, observed=True)))
+    return {
+        pitcher: finish_pitch_summary(per_pitcher.get(pitcher, summary.iloc[:0]), sufficient_tagged_data)
+        for pitcher, sufficient_tagged_data in sufficient.groupby(data[by], sort=False, observed=True).first().items()
+    }
 
 
 def generate_pitch_location_plot(data):
@@ -459,18 +478,19 @@ def generate_pitch_location_plot(data):
     Generates and saves a scatter plot of pitch locations with color-coded pitch types.
 
     Parameters:
-        data (pd.DataFrame): The DataFrame containing pitch data.
+        data (pd.DataFrame or ReportContext): The pitch data, or the context shared by the charts.
 
     Returns:
         save_path (str): Temporary file at the end of function returned
     """
     # Check if required columns exist
     required_columns = {"PlateLocHeight", "PlateLocSide", "TaggedPitchType", "AutoPitchType"}
-    if not required_columns.issubset(data.columns):
+    context = report_context(data)
+    if not required_columns.issubset(context.raw_data.columns):
         print("Error: Required columns not found in dataset.")
         return None
 
-    color_map, data = get_pitch_color_map_and_types(data)
+    color_map, data = context.pitch_mapping
     data = data.dropna(
         subset=["PlateLocHeight", "PlateLocSide"])  # Remove rows where PlateLocHeight and PlateLocSide are missing
 
@@ -514,19 +534,21 @@ def generate_pitch_movement_plot(data):
     Generates and saves a scatter plot of pitch movements with color-coded pitch types.
 
     Parameters:
-        data (pd.DataFrame): The DataFrame containing pitch data.
+        data (pd.DataFrame or ReportContext): The pitch data, or the context shared by the charts.
 
     Returns:
         save_path (str): Temporary file at the end of function returned
     """
     # Check if required columns exist
     required_columns = {"InducedVertBreak", "HorzBreak", "TaggedPitchType", "AutoPitchType"}
-    if not required_columns.issubset(data.columns):
+    context = report_context(data)
+    if not required_columns.issubset(context.raw_data.columns):
         print("Error: Required columns not found in dataset.")
         return None
 
-    color_map, data = get_pitch_color_map_and_types(data)
-    data = data.dropna(
+    color_map, data = context.pitch_mapping
+    movement = context.physics_columns(["InducedVertBreak", "HorzBreak"])
+    data = pd.concat([data["MappedPitchType"], movement], axis=1).dropna(
         subset=["InducedVertBreak", "HorzBreak"])  # Remove rows where InducedVertBreak and HorzBreak are missing
 
     # Extract pitch movements and processed pitch types
@@ -615,20 +637,23 @@ def generate_release_point(data):
     Generates and saves a scatter plot of pitch release points with color-coded pitch types.
 
     Parameters:
-        data (pd.DataFrame): The DataFrame containing pitch data.
+        data (pd.DataFrame or ReportContext): The pitch data, or the context shared by the charts.
 
     Returns:
         save_path (str): Temporary file path to the saved PNG image.
     """
     # Check if required columns exist
     required_columns = {"RelHeight", "RelSide", "TaggedPitchType", "AutoPitchType"}
-    if not required_columns.issubset(data.columns):
+    context = report_context(data)
+    if not required_columns.issubset(context.raw_data.columns):
         print("Error: Required columns not found in dataset.")
         return None
 
     # Get color map & classify pitches
-    color_map, data = get_pitch_color_map_and_types(data)
-    data = data.dropna(subset=["RelHeight", "RelSide"])  # Remove rows where RelHeight and RelSide are missing
+    color_map, data = context.pitch_mapping
+    release = context.physics_columns(["RelHeight", "RelSide"])
+    data = pd.concat([data["MappedPitchType"], release], axis=1).dropna(
+        subset=["RelHeight", "RelSide"])  # Remove rows where RelHeight and RelSide are missing
 
     # Extract release side, release height, mapped pitch types
     pitch_x = data["RelSide"]
@@ -731,19 +756,20 @@ def generate_pitch_usage(data):
     Generates and saves a pie chart of pitch usage percentage with color-coded pitch types.
 
     Parameters:
-        data (pd.DataFrame): The DataFrame containing pitch data.
+        data (pd.DataFrame or ReportContext): The pitch data, or the context shared by the charts.
 
     Returns:
         save_path (str): Temporary file path to the saved PNG image.
     """
     # Check if required columns exist
     required_columns = {"TaggedPitchType", "AutoPitchType"}
-    if not required_columns.issubset(data.columns):
+    context = report_context(data)
+    if not required_columns.issubset(context.raw_data.columns):
         print("Error: Required columns not found in dataset.")
         return None
 
     # Get color map & classify pitches
-    color_map, data = get_pitch_color_map_and_types(data)
+    color_map, data = context.pitch_mapping
     pitch_types = data["MappedPitchType"]
 
     # Calculate pitch usage percentages
@@ -794,59 +820,14 @@ def generate_tilt_range(data):
 
     # Ensure required columns are present
     required_columns = {"Tilt", "TaggedPitchType", "AutoPitchType"}
-    if not required_columns.issubset(data.columns):
+    context = report_context(data)
+    if not required_columns.issubset(context.raw_data.columns):
         print("Error: Required columns not found in dataset.")
         return None
 
-    # Get pitch color mapping and ensure valid Tilt values
-    color_map, data = get_pitch_color_map_and_types(data)
-    data = data.dropna(subset=["Tilt"])
-
-    # Compute tilt info for each pitch type
-    pitch_types_info = {}
-    pitch_type_groups = data.groupby("MappedPitchType")["Tilt"]
-
-    for p_type, tilts in pitch_type_groups:
-        tilt_values = [t for t in tilts if t and ":" in t]
-        avg_str = average_tilt(tilt_values)
-
-        # Convert each tilt to degrees (0° for 12:00, 90° for 3:00, etc.)
-        tilt_degs = []
-        for t in tilt_values:
-            minutes = tilt_to_minutes(t)
-            if minutes is not None:
-                deg = (minutes / (12 * 60)) * 360
-                tilt_degs.append(deg % 360)
-
-        if tilt_degs:
-            raw_min_deg = min(tilt_degs)
-            raw_max_deg = max(tilt_degs)
-
-            # Check if the range straddles midnight
-            if (raw_min_deg <= 60) and (raw_max_deg >= 270):
-                # Split tilt_degs into two groups: 6:00–11:45 and 12:00–5:45
-                groupA = [x for x in tilt_degs if 180 <= x <= 352.5]
-                groupB = [x for x in tilt_degs if 0 <= x <= 172.5]
-
-                if groupA and groupB:
-                    new_min_deg = min(groupA)
-                    new_max_deg = max(groupB)
-                else:
-                    new_min_deg = raw_min_deg
-                    new_max_deg = raw_max_deg
-            else:
-                new_min_deg = raw_min_deg
-                new_max_deg = raw_max_deg
-        else:
-            new_min_deg = None
-            new_max_deg = None
-
-        pitch_types_info[p_type] = {
-            "tilt_degs": tilt_degs,
-            "avg_tilt": avg_str,
-            "min_deg": new_min_deg,
-            "max_deg": new_max_deg,
-        }
+    # Get pitch color mapping, then the mean tilt and covering arc of every pitch type
+    color_map, data = context.pitch_mapping
+    stats = tilt_stats(derived_column(data, "TiltMinutes"), [data["MappedPitchType"]])
 
     fig, ax = plt.subplots(figsize=(6, 6))
     ax.set_title("Tilt Consistency", fontsize=20, fontweight="bold")
@@ -879,44 +860,29 @@ def generate_tilt_range(data):
                 ha="center", va="center", fontsize=14, fontweight="bold")
 
     # Draw pitch arcs and average tilt lines
-    for p_type, info in pitch_types_info.items():
-        if not info["tilt_degs"]:
-            continue
-
+    for p_type, info in stats.iterrows():
         c = color_map.get(p_type, "gray")
-        min_deg = info["min_deg"]
-        max_deg = info["max_deg"]
-        avg_str = info["avg_tilt"]
-
-        # Convert average tilt to clock degrees
-        avg_minutes = tilt_to_minutes(avg_str)
-        avg_deg_clock = (avg_minutes / (12 * 60)) * 360 if avg_minutes is not None else None
-
-        # Draw shadow arc from min_deg to max_deg
-        if min_deg is not None and max_deg is not None:
-            arc_start = (90 - min_deg) % 360
-            arc_end = (90 - max_deg) % 360
-            if arc_start > arc_end:
-                arc_start, arc_end = arc_end, arc_start
 
+        # Draw shadow arc clockwise from the start of the tilt range (Wedge angles run counterclockwise from 3:00)
+        if info["ArcWidth"] > 0:
+            arc_start, arc_width = clock_degrees([info["ArcStart"], info["ArcWidth"]])
             wedge = Wedge(center=(0, 0), r=0.95,
-                          theta1=arc_start, theta2=arc_end,
+                          theta1=90 - arc_start - arc_width, theta2=90 - arc_start,
                           facecolor=c, alpha=0.15, edgecolor=None)
             ax.add_patch(wedge)
 
         # Draw a line for average tilt
-        if avg_deg_clock is not None:
-            polar_deg_avg = (90 - avg_deg_clock) % 360
-            avg_rad = math.radians(polar_deg_avg)
-            x_end = 0.95 * math.cos(avg_rad)
-            y_end = 0.95 * math.sin(avg_rad)
-            ax.plot([0, x_end], [0, y_end], color=c, linewidth=2)
-
-            # Label near the tip of the line
-            x_label = 1.15 * math.cos(avg_rad)
-            y_label = 1.15 * math.sin(avg_rad)
-            ax.text(x_label, y_label, p_type, color="black",
-                    fontsize=12, fontweight="bold", ha="center", va="center")
+        polar_deg_avg = (90 - clock_degrees(info["MeanMinutes"])) % 360
+        avg_rad = math.radians(polar_deg_avg)
+        x_end = 0.95 * math.cos(avg_rad)
+        y_end = 0.95 * math.sin(avg_rad)
+        ax.plot([0, x_end], [0, y_end], color=c, linewidth=2)
+
+        # Label near the tip of the line
+        x_label = 1.15 * math.cos(avg_rad)
+        y_label = 1.15 * math.sin(avg_rad)
+        ax.text(x_label, y_label, p_type, color="black",
+                fontsize=12, fontweight="bold", ha="center", va="center")
 
     temp_file = tempfile.NamedTemporaryFile(suffix=".png", delete=False)
     plt.savefig(temp_file.name, bbox_inches="tight", dpi=300)
@@ -930,7 +896,7 @@ def velocity_ridgeline_plot(data):
     Generates a velocity ridgeline plot, color-coded for each pitch type.
 
     Parameters:
-        data (pd.DataFrame): The DataFrame containing pitch data.
+        data (pd.DataFrame or ReportContext): The pitch data, or the context shared by the charts.
 
     Returns:
         save_path (str): Temporary file path to the saved PNG image.
@@ -938,12 +904,13 @@ def velocity_ridgeline_plot(data):
 
     # Check if required columns exist
     required_columns = {"RelSpeed", "TaggedPitchType", "AutoPitchType"}
-    if not required_columns.issubset(data.columns):
+    context = report_context(data)
+    if not required_columns.issubset(context.raw_data.columns):
         print("Error: Required columns not found in dataset.")
         return None
 
     # Classify pitch types & get color map
-    color_map, data = get_pitch_color_map_and_types(data)
+    color_map, data = context.pitch_mapping
     data = data.dropna(subset=["RelSpeed"])
 
     # Create a minimal DataFrame for joypy
@@ -1182,39 +1149,41 @@ def generate_trackman_report(hand_abbreviation, formatted_name, df_pitch_summary
 
 
 ## -- Main Script -- ##
-# Load the CSV file after all preprocessing
-data = pd.read_csv(trackman_file)
-
-# Check if all rows have the same pitcher name and throwing hand
-unique_pitchers = data['Pitcher'].unique()
-unique_hands = data['PitcherThrows'].unique()
-
-if len(unique_pitchers) == 1 and len(unique_hands) == 1:
-    # Extract values
-    pitcher_name = unique_pitchers[0]
-    pitcher_hand = unique_hands[0]
-
-    # Map "Right" → "RHP", "Left" → "LHP"
-    hand_map = {"Right": "RHP", "Left": "LHP"}
-    hand_abbreviation = hand_map.get(pitcher_hand, pitcher_hand)  # Default to original if not mapped
-
-    # Reformat name from "Lastname, Firstname" to "Firstname Lastname"
-    last_name, first_name = pitcher_name.split(", ")
-    formatted_name = f"{first_name} {last_name}"
-
-else:
-    print("\nError: Multiple pitchers or throwing hands detected in the file.")
-
-# Run Functions for Report
-df_pitch_summary = generate_pitch_summary_table(data)
-pitch_location_path = generate_pitch_location_plot(data)
-legend_path = generate_pitch_color_legend(data)
-pitch_movement_path = generate_pitch_movement_plot(data)
-release_point_path = generate_release_point(data)
-velocity_ridgeline_path = velocity_ridgeline_plot(data)
-pitch_usage_path = generate_pitch_usage(data)
-tilt_range_path = generate_tilt_range(data)
-
-# Create Report
-generate_trackman_report(hand_abbreviation, formatted_name, df_pitch_summary, pitch_location_path, pitch_movement_path,
-                         legend_path, release_point_path, velocity_ridgeline_path, pitch_usage_path, tilt_range_path, OUTPUT_PDF_PATH)
\ No newline at end of file
+if __name__ == "__main__":
+    # Load the CSV file after all preprocessing
+    data = load_report_data(trackman_file)
+
+    # Check if all rows have the same pitcher name and throwing hand
+    unique_pitchers = data['Pitcher'].unique()
+    unique_hands = data['PitcherThrows'].unique()
+
+    if len(unique_pitchers) == 1 and len(unique_hands) == 1:
+        # Extract values
+        pitcher_name = unique_pitchers[0]
+        pitcher_hand = unique_hands[0]
+
+        # Map "Right" → "RHP", "Left" → "LHP"
+        hand_map = {"Right": "RHP", "Left": "LHP"}
+        hand_abbreviation = hand_map.get(pitcher_hand, pitcher_hand)  # Default to original if not mapped
+
+        # Reformat name from "Lastname, Firstname" to "Firstname Lastname"
+        last_name, first_name = pitcher_name.split(", ")
+        formatted_name = f"{first_name} {last_name}"
+
+    else:
+        print("\nError: Multiple pitchers or throwing hands detected in the file.")
+
+    # Run Functions for Report (pitch types are classified once and shared by every chart)
+    context = ReportContext(data, physics=open_physics(trackman_file, data))
+    df_pitch_summary = generate_pitch_summary_table(context)
+    pitch_location_path = generate_pitch_location_plot(context)
+    legend_path = generate_pitch_color_legend(context)
+    pitch_movement_path = generate_pitch_movement_plot(context)
+    release_point_path = generate_release_point(context)
+    velocity_ridgeline_path = velocity_ridgeline_plot(context)
+    pitch_usage_path = generate_pitch_usage(context)
+    tilt_range_path = generate_tilt_range(context)
+
+    # Create Report
+    generate_trackman_report(hand_abbreviation, formatted_name, df_pitch_summary, pitch_location_path, pitch_movement_path,
+                             legend_path, release_point_path, velocity_ridgeline_path, pitch_usage_path, tilt_range_path, OUTPUT_PDF_PATH)
\ No newline at end of file
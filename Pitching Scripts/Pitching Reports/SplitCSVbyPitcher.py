@@ -1,17 +1,38 @@
-import pandas as pd
+import os
+import sys
 
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'Shared Scripts'))
+from PitcherPartition import partition_rows, safe_filename, write_partitions
+from PlayerRegistry import MISSING_CODE, encode_players, update_registry
+from TrackmanFiles import read_raw
 
-def split_csv_by_pitcher(input_file):
-    # Read the CSV file
-    df = pd.read_csv(input_file)
 
-    # Group by pitcher and save each group as a separate CSV file
-    for pitcher, pitcher_df in df.groupby("Pitcher"):
-        # Create a valid filename by replacing spaces and commas
-        safe_filename = pitcher.replace(" ", "_").replace(",", "") + ".csv"
-        pitcher_df.to_csv(f"../../{safe_filename}", index=False)
-        print(f"Saved: {safe_filename}")
+def split_csv_by_pitcher(input_file, output_dir="../..", registry=None):
+    # Read the CSV file (plain or compressed)
+    df = read_raw(input_file)
 
+    if registry is None:
+        key, filename = "Pitcher", safe_filename
+    else:
+        # Partition on the registry's integer codes and name files from its file-safe names.
+        # Players it does not know yet get codes for this run only; the registry file is never written.
+        registry = update_registry(df, registry=registry)
+        df = encode_players(df, registry)
+        key, filename = "PitcherCode", lambda code: registry.at[code, "FileName"] + ".csv"
 
-input_file = "../../Stevens- AC - 3Games.csv"
-split_csv_by_pitcher(input_file)
+    # Sort by pitcher once and record each pitcher's row range
+    sorted_df, offsets = partition_rows(df, key, sort=True)
+    offsets.pop(MISSING_CODE, None)
+
+    # Save each pitcher's rows as a separate CSV file (skipped when output_dir is None)
+    if output_dir is not None:
+        write_partitions(sorted_df, offsets, output_dir, filename=filename)
+        for pitcher in offsets:
+            print(f"Saved: {filename(pitcher)}")
+
+    return sorted_df, offsets, registry
+
+
+if __name__ == "__main__":
+    input_file = "../../Stevens- AC - 3Games.csv"
+    split_csv_by_pitcher(input_file)
@@ -1,14 +1,31 @@
 import os
+import sys
 import pandas as pd
 import matplotlib.pyplot as plt
 import numpy as np
 
-# Load the full dataset
-file_path = '../Fall/AllFallCSV/FallScrimmageCSV/AllFallScrimmageData-Xwoba.csv'  # Replace with your file path
-data = pd.read_csv(file_path)
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Shared Scripts'))
+from PitcherPartition import partition_rows
+from SeasonStore import load_season
+from BattedBall import HARD_HIT_MPH, is_hard_hit
+from BitmapIndex import build_index
+from EnrichedColumns import derived_column
 
-# List of pitchers to process (you can modify this to read dynamically from the data)
-pitchers = data['Pitcher'].unique()
+# Load the full scrimmage season from its store (built with SeasonIngest.py)
+store_dir = '../Fall/AllFallCSV/FallScrimmageCSV/ScrimmageStore'
+data = load_season(store_dir)
+
+# Sort by pitcher once; each pitcher's rows are then a slice of the sorted data
+data, pitcher_offsets = partition_rows(data, 'Pitcher')
+
+# Bitmaps for every PitchCall value and for hard hits in play, built once for all pitchers
+index = build_index(data, columns=['PitchCall'])
+
+# Quadrant (A-D) of every pitch, stored at ingest (binned here once for older stores)
+quadrants = derived_column(data, 'Quadrant')
+
+# Set to False to skip saving each pitcher's rows to a CSV
+WRITE_PITCHER_CSVS = True
 
 # Define directory for saving output
 output_dir = 'PitcherData-Copy-Original'
@@ -18,17 +35,6 @@ os.makedirs(output_dir, exist_ok=True)
 def sanitize_name(name):
     return name.replace(',', '').replace(' ', '')
 
-# Function to get quadrant based on plate location
-def get_quadrant(side, height):
-    if side < 0 and height > 2.75:
-        return 'A'  # Top Left
-    elif side >= 0 and height > 2.75:
-        return 'B'  # Top Right
-    elif side < 0 and height <= 2.75:
-        return 'C'  # Bottom Left
-    else:
-        return 'D'  # Bottom Right
-
 # Function to plot scatter for given data and save to PNG
 def plot_pitches(data, pitcher_folder, file_suffix, marker, title):
     fig, ax = plt.subplots(figsize=(6, 6))
@@ -36,7 +42,7 @@ def plot_pitches(data, pitcher_folder, file_suffix, marker, title):
     colors = {'Fastball': 'red', 'Curveball': 'blue', 'Slider': 'yellow', 'Changeup': 'green'}
     pitch_colors = [colors.get(pitch, 'gray') for pitch in data['TaggedPitchType']]
     sizes = np.where(pd.isna(data['ExitSpeed']), 50, np.sqrt(data['ExitSpeed']) * 1)
-    hard_hit_marker = data['ExitSpeed'] > 85
+    hard_hit_marker = is_hard_hit(data['ExitSpeed'])
     sizes[hard_hit_marker] = 200
 
     ax.scatter(data['PlateLocSide'][marker], data['PlateLocHeight'][marker],
@@ -62,9 +68,9 @@ def plot_pitches(data, pitcher_folder, file_suffix, marker, title):
     plt.close()
 
 # Iterate through each pitcher and process their data
-for pitcher in pitchers:
-    # Filter data for the current pitcher
-    pitcher_data = data[data['Pitcher'] == pitcher]
+for pitcher, (start, stop) in pitcher_offsets.items():
+    # This pitcher's rows are a slice of the sorted data
+    pitcher_data = data.iloc[start:stop]
 
     # Create a sanitized folder name for the pitcher and create the folder
     sanitized_pitcher_name = sanitize_name(pitcher)
@@ -72,9 +78,10 @@ for pitcher in pitchers:
     os.makedirs(pitcher_folder, exist_ok=True)
 
     # Save the filtered data to a CSV
-    pitcher_csv_path = os.path.join(pitcher_folder, f'{sanitized_pitcher_name}_FallPitching.csv')
-    pitcher_data.to_csv(pitcher_csv_path, index=False)
-    print(f"CSV saved to {pitcher_csv_path}")
+    if WRITE_PITCHER_CSVS:
+        pitcher_csv_path = os.path.join(pitcher_folder, f'{sanitized_pitcher_name}_FallPitching.csv')
+        pitcher_data.to_csv(pitcher_csv_path, index=False)
+        print(f"CSV saved to {pitcher_csv_path}")
 
     # Extract necessary columns for plotting
     plate_loc_height = pitcher_data['PlateLocHeight']
@@ -83,12 +90,12 @@ for pitcher in pitchers:
     pitch_type = pitcher_data['TaggedPitchType']
     pitch_called = pitcher_data['PitchCall']
 
-    # Define markers for different conditions
-    hard_hit_marker = exit_speed > 85
-    ball_called = pitch_called == 'BallCalled'
-    strike_swinging = pitch_called == 'StrikeSwinging'
-    strike_called = pitch_called == 'StrikeCalled'
-    normal_hit_ball = exit_speed < 85
+    # Define markers for different conditions (pitch calls come from the bitmaps)
+    hard_hit_marker = is_hard_hit(exit_speed)
+    ball_called = index.get('PitchCall', 'BallCalled').to_mask(start, stop)
+    strike_swinging = index.get('PitchCall', 'StrikeSwinging').to_mask(start, stop)
+    strike_called = index.get('PitchCall', 'StrikeCalled').to_mask(start, stop)
+    normal_hit_ball = exit_speed < HARD_HIT_MPH
 
     # Generate and save scatter plots for different pitch categories
     plot_pitches(pitcher_data, pitcher_folder, 'NormalPitches', normal_hit_ball, 'Normal Pitches')
@@ -98,18 +105,16 @@ for pitcher in pitchers:
     plot_pitches(pitcher_data, pitcher_folder, 'StrikeCalled', strike_called, 'Strike Called')
 
     # Add quadrant information
-    pitcher_data['Quadrant'] = pitcher_data.apply(
-        lambda row: get_quadrant(row['PlateLocSide'], row['PlateLocHeight']), axis=1
-    )
+    pitcher_data['Quadrant'] = quadrants.iloc[start:stop]
 
     # Update HardHit condition to only include balls in play (PitchCall == 'InPlay')
-    pitcher_data['HardHit'] = (pitcher_data['ExitSpeed'] > 85) & (pitcher_data['PitchCall'] == 'InPlay')
+    pitcher_data['HardHit'] = index.get('HardHit', True).to_mask(start, stop)
 
     # Update Outcome to include 'Hard Hit' for those pitches
     pitcher_data['Outcome'] = np.where(pitcher_data['HardHit'], 'Hard Hit', pitcher_data['PitchCall'])
 
     # Tally outcomes by quadrant
-    outcome_tally = pitcher_data.groupby(['Quadrant', 'Outcome']).size().unstack(fill_value=0)
+    outcome_tally = pitcher_data.groupby(['Quadrant', 'Outcome'], observed=True).size().unstack(fill_value=0)
 
     # Calculate totals and additional statistics
     total_pitches = outcome_tally.sum(axis=1)
@@ -1,8 +1,11 @@
 import os
 import sys
-import pandas as pd
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Pitching Reports'))
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Shared Scripts'))
 from SplitCSVbyPitcher import split_csv_by_pitcher
-from PitcherReport import generate_trackman_report, generate_pitch_summary_table, generate_pitch_location_plot, generate_pitch_color_legend, generate_pitch_movement_plot, generate_release_point, velocity_ridgeline_plot, generate_pitch_usage, generate_tilt_range
+from PlayerRegistry import load_registry
+from PitcherReport import ReportContext, open_physics, pitch_type_mapping, generate_trackman_report, generate_pitch_summary_table, generate_pitch_location_plot, generate_pitch_color_legend, generate_pitch_movement_plot, generate_release_point, velocity_ridgeline_plot, generate_pitch_usage, generate_tilt_range
 
 ## -- CONFIGURATION -- ##
 # Set your input file and output directories here
@@ -10,6 +13,9 @@ INPUT_FILE = "20250401-McGillField-1_unverified.csv"  # The Trackman CSV file to
 OUTPUT_BASE_DIR = "../Game Reports/MessiahGame"  # Base directory for all outputs
 CSV_OUTPUT_DIR = "Pitchers-CSV"  # Subdirectory for split CSV files
 PDF_OUTPUT_DIR = "Pitchers-Reports"  # Subdirectory for PDF reports
+WRITE_PITCHER_CSVS = False  # Also save one CSV per pitcher in CSV_OUTPUT_DIR
+# Player registry of the season store (read only; players are registered when games are ingested)
+REGISTRY_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "../All Game CSVs/SeasonStore/_players.csv")
 
 def ensure_output_directory():
     """Ensure the output directory for PDFs exists."""
@@ -30,60 +36,66 @@ def process_all_pitchers(input_file):
     # Ensure output directory exists
     output_dir = ensure_output_directory()
     
-    # Split the CSV file by pitcher
+    # Split the CSV file by pitcher in one pass; each pitcher's rows are a slice of the sorted data
     print(f"\nSplitting {input_file} by pitcher...")
-    split_csv_by_pitcher(input_file)
-    
-    # Get all CSV files in the output directory
-    csv_dir = os.path.join(OUTPUT_BASE_DIR, CSV_OUTPUT_DIR)
-    pitcher_files = [f for f in os.listdir(csv_dir) if f.endswith('.csv')]
+    csv_dir = os.path.join(OUTPUT_BASE_DIR, CSV_OUTPUT_DIR) if WRITE_PITCHER_CSVS else None
+    sorted_data, offsets, registry = split_csv_by_pitcher(input_file, output_dir=csv_dir,
+                                                          registry=load_registry(REGISTRY_FILE))
     
-    if not pitcher_files:
-        print("No pitcher files found after splitting!")
+    if not offsets:
+        print("No pitchers found after splitting!")
         return
     
-    print(f"\nFound {len(pitcher_files)} pitcher files to process.")
+    print(f"\nFound {len(offsets)} pitchers to process.")
+    
+    # Classify every pitch once; the summary tables and each pitcher's charts share it
+    mapped, sufficient = pitch_type_mapping(sorted_data, by='PitcherCode')
+    
+    # Summary tables for the whole staff in one grouped pass
+    summaries = generate_pitch_summary_table(sorted_data, by='PitcherCode', mapping=(mapped, sufficient))
+    
+    # Movement and release charts read the memory-mapped physics arrays (the index keeps the file's row positions)
+    physics = open_physics(input_file, sorted_data)
     
-    # Process each pitcher file
-    for pitcher_file in pitcher_files:
+    # Process each pitcher
+    for pitcher_code, (start, stop) in offsets.items():
+        player = registry.loc[pitcher_code]
+        pitcher = player['Name']
         try:
-            print(f"\nProcessing {pitcher_file}...")
-            pitcher_path = os.path.join(csv_dir, pitcher_file)
+            print(f"\nProcessing {pitcher}...")
             
-            # Load the CSV file
-            data = pd.read_csv(pitcher_path)
+            # Slice out this pitcher's rows
+            data = sorted_data.iloc[start:stop]
             
-            # Check if all rows have the same pitcher name and throwing hand
-            unique_pitchers = data['Pitcher'].unique()
+            # Check if all rows have the same throwing hand (the rows already share one pitcher code)
             unique_hands = data['PitcherThrows'].unique()
             
-            if len(unique_pitchers) == 1 and len(unique_hands) == 1:
+            if len(unique_hands) == 1:
                 # Extract values
-                pitcher_name = unique_pitchers[0]
                 pitcher_hand = unique_hands[0]
                 
                 # Map "Right" → "RHP", "Left" → "LHP"
                 hand_map = {"Right": "RHP", "Left": "LHP"}
                 hand_abbreviation = hand_map.get(pitcher_hand, pitcher_hand)
                 
-                # Reformat name from "Lastname, Firstname" to "Firstname Lastname"
-                last_name, first_name = pitcher_name.split(", ")
-                formatted_name = f"{first_name} {last_name}"
+                # "Firstname Lastname" and the file-safe name come precomputed from the registry
+                formatted_name = player['DisplayName']
                 
                 # Create a unique PDF filename
-                pdf_filename = f"{last_name}_{first_name}-PitchingReport.pdf"
+                pdf_filename = f"{player['FileName']}-PitchingReport.pdf"
                 pdf_path = os.path.join(output_dir, pdf_filename)
                 
                 # Generate all the plots and data
                 print("Generating plots and data...")
-                df_pitch_summary = generate_pitch_summary_table(data)
-                pitch_location_path = generate_pitch_location_plot(data)
-                legend_path = generate_pitch_color_legend(data)
-                pitch_movement_path = generate_pitch_movement_plot(data)
-                release_point_path = generate_release_point(data)
-                velocity_ridgeline_path = velocity_ridgeline_plot(data)
-                pitch_usage_path = generate_pitch_usage(data)
-                tilt_range_path = generate_tilt_range(data)
+                context = ReportContext(data, bool(sufficient.iloc[start]), mapped.iloc[start:stop], physics)
+                df_pitch_summary = summaries[pitcher_code]
+                pitch_location_path = generate_pitch_location_plot(context)
+                legend_path = generate_pitch_color_legend(context)
+                pitch_movement_path = generate_pitch_movement_plot(context)
+                release_point_path = generate_release_point(context)
+                velocity_ridgeline_path = velocity_ridgeline_plot(context)
+                pitch_usage_path = generate_pitch_usage(context)
+                tilt_range_path = generate_tilt_range(context)
                 
                 # Generate the report
                 print(f"Generating PDF report: {pdf_filename}")
@@ -101,17 +113,18 @@ def process_all_pitchers(input_file):
                     pdf_path  # Pass the PDF path to the function
                 )
                 
-                print(f"Successfully processed {pitcher_file}")
+                print(f"Successfully processed {pitcher}")
             else:
-                print(f"Error: Multiple pitchers or throwing hands detected in {pitcher_file}")
+                print(f"Error: Multiple throwing hands detected for {pitcher}")
                 
         except Exception as e:
-            print(f"Error processing {pitcher_file}: {str(e)}")
+            print(f"Error processing {pitcher}: {str(e)}")
             continue
 
 if __name__ == "__main__":
-    # Use the configured input file
-    trackman_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), INPUT_FILE)
+    # Use the file given on the command line (e.g. by WatchFolder.py), else the configured input file
+    input_file = sys.argv[1] if len(sys.argv) > 1 else INPUT_FILE
+    trackman_file = os.path.join(os.path.dirname(os.path.abspath(__file__)), input_file)
     print(f"Processing file: {trackman_file}")
     
     # Validate if the file exists before proceeding
@@ -1,12 +1,16 @@
-import pandas as pd
+import os
+import sys
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'Shared Scripts'))
+from SeasonStore import load_season
 
 # Step 1: Read the CSV file
 # Replace 'your_file.csv' with the path to your actual file
-df = pd.read_csv('../All Game CSVs/AllGameData 4-8-2025 xwoba.csv')
+df = load_season('../All Game CSVs/SeasonStore', columns=['Pitcher', 'xwOBA'])
 
 # Step 2: Group the data by the pitcher and calculate the mean xwOBA for each pitcher
 # Assuming 'pitcher' is the name of the pitcher column and 'xwOBA' is the xwOBA column
-pitcher_xwOBA = df.groupby('Pitcher')['xwOBA'].mean().reset_index()
+pitcher_xwOBA = df.groupby('Pitcher', observed=True)['xwOBA'].mean().reset_index()
 
 # Rename the columns to make it clear
 pitcher_xwOBA.columns = ['Pitcher', 'Avg_xwOBA']
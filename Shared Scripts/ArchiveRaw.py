@@ -0,0 +1,138 @@
+"""
+ArchiveRaw.py
+-------------
+
+Recompresses the raw TrackMan archive. Each CSV is rewritten as zstd (or gzip)
+compressed CSV, or converted to Parquet, and the new file is checked against the
+original before the original is (optionally) deleted. Every loader reads the
+compressed files directly, so the archive can stay compressed.
+
+Example:
+    python ArchiveRaw.py "../All Game CSVs/Game Files" --delete-originals
+"""
+
+import os
+import sys
+import hashlib
+import argparse
+
+from TrackmanFiles import CSV_EXTENSIONS, open_input, open_output
+from TrackmanSchema import load_trackman, write_trackman
+
+ARCHIVE_FORMATS = {"zst": ".csv.zst", "gz": ".csv.gz", "parquet": ".parquet"}
+DEFAULT_FORMAT = "zst"
+COPY_CHUNK = 1 << 20
+
+
+def strip_extension(path):
+    """Removes the CSV extension (.csv, .csv.zst or .csv.gz) from a path."""
+    lower = path.lower()
+    for ext in sorted(CSV_EXTENSIONS, key=len, reverse=True):
+        if lower.endswith(ext):
+            return path[:-len(ext)]
+    return path
+
+
+def content_hash(path):
+    """Returns the SHA-256 of a CSV's uncompressed contents."""
+    digest = hashlib.sha256()
+    with open_input(path) as stream:
+        for chunk in iter(lambda: stream.read(COPY_CHUNK), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def recompress_csv(source, destination):
+    """
+    Streams a CSV into a (differently) compressed CSV without parsing it.
+
+    Returns:
+        str: SHA-256 of the uncompressed contents that were written.
+    """
+    digest = hashlib.sha256()
+    with open_input(source) as src, open_output(destination) as dst:
+        for chunk in iter(lambda: src.read(COPY_CHUNK), b""):
+            digest.update(chunk)
+            dst.write(chunk)
+    return digest.hexdigest()
+
+
+def archive_file(path, archive_format=DEFAULT_FORMAT, delete_original=False):
+    """
+    Writes a compressed copy of a raw CSV next to it and verifies it.
+
+    Compressed CSVs must decompress to exactly the original bytes. Parquet copies must
+    load with the same rows and columns as the original.
+
+    Parameters:
+        path (str): The raw CSV (plain or already compressed).
+        archive_format (str): One of ARCHIVE_FORMATS.
+        delete_original (bool): Delete the original once the copy is verified.
+
+    Returns:
+        str: Path of the archived copy, or None if the file already has that format.
+    """
+    destination = strip_extension(path) + ARCHIVE_FORMATS[archive_format]
+    if os.path.abspath(destination) == os.path.abspath(path):
+        return None
+
+    # The temporary name keeps the extension (it selects the codec) and is hidden from folder scans
+    folder, name = os.path.split(destination)
+    temp_path = os.path.join(folder, ".tmp-" + name)
+    try:
+        if archive_format == "parquet":
+            original = load_trackman(path)
+            write_trackman(original, temp_path)
+            copy = load_trackman(temp_path)
+            if len(copy) != len(original) or list(copy.columns) != list(original.columns):
+                raise ValueError(f"Parquet copy of {path} does not match the original.")
+        elif recompress_csv(path, temp_path) != content_hash(temp_path):
+            raise ValueError(f"Compressed copy of {path} does not match the original.")
+        os.replace(temp_path, destination)
+    finally:
+        if os.path.exists(temp_path):
+            os.remove(temp_path)
+
+    if delete_original:
+        os.remove(path)
+    return destination
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Recompress raw TrackMan CSV files.")
+    parser.add_argument("inputs", nargs="+", help="CSV files or folders containing them")
+    parser.add_argument("--format", choices=sorted(ARCHIVE_FORMATS), default=DEFAULT_FORMAT,
+                        help=f"Archive format (default: {DEFAULT_FORMAT})")
+    parser.add_argument("--delete-originals", action="store_true",
+                        help="Delete each original once its compressed copy is verified")
+    args = parser.parse_args()
+
+    # Expand folders into the CSV files they contain
+    paths = []
+    for item in args.inputs:
+        if os.path.isdir(item):
+            paths.extend(sorted(os.path.join(item, name) for name in os.listdir(item)
+                                if name.lower().endswith(CSV_EXTENSIONS) and not name.startswith(".")))
+        else:
+            paths.append(item)
+
+    if not paths:
+        sys.exit("No CSV files found to archive.")
+
+    before = after = 0
+    for path in paths:
+        size = os.path.getsize(path)
+        destination = archive_file(path, args.format, args.delete_originals)
+        if destination is None:
+            print(f"Skipping {path}: already {args.format}")
+            continue
+        before += size
+        after += os.path.getsize(destination)
+        print(f"Archived {path} -> {destination}")
+
+    if before:
+        print(f"Archive size: {before / 1e6:.1f} MB -> {after / 1e6:.1f} MB")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+BattedBall.py
+-------------
+
+Shared batted-ball definitions: hit type from launch angle, hit hardness from exit
+velocity, and the hard-hit flag. Every function classifies a whole column at once
+(one binning pass, no per-row Python calls), and the thresholds are module constants
+that callers can override, so all scripts use the same definitions.
+
+Example:
+    in_play = df[df['PitchCall'] == 'InPlay']
+    hit_type = classify_hit_type(in_play['Angle'])
+    hard_hits = is_hard_hit(in_play['ExitSpeed']).sum()
+"""
+
+import numpy as np
+import pandas as pd
+
+# Launch angle (degrees) where each hit type starts; anything below the first is a ground ball
+HIT_TYPES = ["Ground Ball", "Line Drive", "Fly Ball", "Pop Up"]
+HIT_TYPE_ANGLES = [0, 30, 45]
+
+# Exit velocity (mph) where each hardness level starts; used by the xwOBA table
+HARDNESS_LEVELS = ["Soft Hit", "Medium Hit", "Hard Hit"]
+HARDNESS_SPEEDS = [75, 87]
+
+# Exit velocity (mph) at or above which a ball counts as hard hit
+HARD_HIT_MPH = 85
+
+
+def bin_values(values, edges, labels):
+    """
+    Bins values into labels, where edges are the lower bounds of every label but the first.
+    Bins include their lower edge (a 30 degree launch is a fly ball). Missing values stay missing.
+
+    Parameters:
+        values (pd.Series or array-like): Values to bin.
+        edges (list): Increasing lower bounds, one fewer than labels.
+        labels (list): Label of each bin, lowest first.
+
+    Returns:
+        pd.Series or pd.Categorical: Ordered categorical labels (a Series keeps the input's index).
+    """
+    if len(edges) != len(labels) - 1:
+        raise ValueError(f"Expected {len(labels) - 1} edges for {len(labels)} labels, got {len(edges)}.")
+
+    bins = [-np.inf] + list(edges) + [np.inf]
+    if not isinstance(values, pd.Series):
+        values = np.asarray(values, dtype="float64")
+    return pd.cut(values, bins=bins, labels=labels, right=False, ordered=True)
+
+
+def classify_hit_type(angle, edges=HIT_TYPE_ANGLES):
+    """
+    Classifies launch angles as Ground Ball, Line Drive, Fly Ball or Pop Up.
+
+    Parameters:
+        angle (pd.Series or array-like): Launch angles in degrees.
+        edges (list): Lower bounds of Line Drive, Fly Ball and Pop Up.
+
+    Returns:
+        pd.Series or pd.Categorical: Hit types; missing where the angle is missing.
+    """
+    return bin_values(angle, edges, HIT_TYPES)
+
+
+def classify_hardness(exit_speed, edges=HARDNESS_SPEEDS):
+    """
+    Classifies exit velocities as Soft Hit, Medium Hit or Hard Hit.
+
+    Parameters:
+        exit_speed (pd.Series or array-like): Exit velocities in mph.
+        edges (list): Lower bounds of Medium Hit and Hard Hit.
+
+    Returns:
+        pd.Series or pd.Categorical: Hardness levels; missing where the exit speed is missing.
+    """
+    return bin_values(exit_speed, edges, HARDNESS_LEVELS)
+
+
+def is_hard_hit(exit_speed, threshold=HARD_HIT_MPH):
+    """
+    Flags exit velocities at or above the hard-hit threshold.
+
+    Parameters:
+        exit_speed (pd.Series or array-like): Exit velocities in mph.
+        threshold (float): Hard-hit threshold in mph.
+
+    Returns:
+        pd.Series or np.ndarray: Boolean flags; a missing exit speed is not a hard hit.
+    """
+    if isinstance(exit_speed, pd.Series):
+        return (exit_speed >= threshold).fillna(False).astype(bool)
+    return np.asarray(exit_speed, dtype="float64") >= threshold
@@ -0,0 +1,150 @@
+"""
+BitmapIndex.py
+--------------
+
+Precomputed bitmaps for the categorical pitch columns (PitchCall, TaggedPitchType,
+BatterSide, PitcherThrows, TaggedHitType, the ball-strike count) and for hard hits
+in play. Each bitmap stores one bit per pitch (packed 8 to a byte), so conditions
+like "hard hits vs LHH on sliders" are built by AND/OR/NOT on bitmaps instead of
+repeated string comparisons over whole columns.
+
+Example:
+    index = build_index(data)
+    mask = (index.get("HardHit", True) & index.get("BatterSide", "Left")
+            & index.get("TaggedPitchType", "Slider")).to_mask()
+"""
+
+import numpy as np
+import pandas as pd
+
+from BattedBall import is_hard_hit
+
+# Columns that get one bitmap per distinct value
+INDEXED_COLUMNS = ["PitchCall", "TaggedPitchType", "BatterSide", "PitcherThrows", "TaggedHitType"]
+
+# Number of set bits in every byte value, for counting
+POPCOUNT = np.array([bin(value).count("1") for value in range(256)], dtype=np.uint16)
+
+
+class Bitmap:
+    """A packed boolean mask over the rows of a DataFrame."""
+
+    def __init__(self, bits, length):
+        self.bits = bits
+        self.length = length
+
+    @classmethod
+    def from_mask(cls, mask):
+        """Packs a boolean array or Series (missing values count as False)."""
+        if isinstance(mask, pd.Series):
+            mask = mask.to_numpy(dtype=bool, na_value=False)
+        mask = np.asarray(mask, dtype=bool)
+        return cls(np.packbits(mask), len(mask))
+
+    @classmethod
+    def zeros(cls, length):
+        """A bitmap with no rows set."""
+        return cls(np.zeros((length + 7) // 8, dtype=np.uint8), length)
+
+    def __len__(self):
+        return self.length
+
+    def _check(self, other):
+        if self.length != other.length:
+            raise ValueError(f"Bitmaps cover different row counts ({self.length} vs {other.length}).")
+
+    def __and__(self, other):
+        self._check(other)
+        return Bitmap(self.bits & other.bits, self.length)
+
+    def __or__(self, other):
+        self._check(other)
+        return Bitmap(self.bits | other.bits, self.length)
+
+    def __xor__(self, other):
+        self._check(other)
+        return Bitmap(self.bits ^ other.bits, self.length)
+
+    def __invert__(self):
+        bits = ~self.bits
+        # Clear the padding bits past the last row so counts stay right
+        tail = self.length % 8
+        if tail:
+            bits[-1] &= np.uint8((0xFF << (8 - tail)) & 0xFF)
+        return Bitmap(bits, self.length)
+
+    def count(self):
+        """Returns the number of rows set."""
+        return int(POPCOUNT[self.bits].sum())
+
+    def to_mask(self, start=0, stop=None):
+        """
+        Unpacks rows start..stop into a boolean array. Only the bytes covering the
+        range are unpacked, so per-pitcher slices of a partitioned frame are cheap.
+        """
+        stop = self.length if stop is None else stop
+        first_byte = start // 8
+        unpacked = np.unpackbits(self.bits[first_byte:(stop + 7) // 8])
+        offset = start - first_byte * 8
+        return unpacked[offset:offset + (stop - start)].astype(bool)
+
+
+class BitmapIndex:
+    """Bitmaps for every (column, value) pair of a DataFrame's indexed columns."""
+
+    def __init__(self, bitmaps, length):
+        self.bitmaps = bitmaps
+        self.length = length
+
+    def get(self, column, value):
+        """Returns the bitmap of rows where column == value (empty if the value never occurs)."""
+        bitmap = self.bitmaps.get((column, value))
+        return bitmap if bitmap is not None else Bitmap.zeros(self.length)
+
+    def any_of(self, column, values):
+        """Returns the bitmap of rows where column is any of the values."""
+        result = Bitmap.zeros(self.length)
+        for value in values:
+            result = result | self.get(column, value)
+        return result
+
+    def values(self, column):
+        """Returns the indexed values of a column."""
+        return [value for col, value in self.bitmaps if col == column]
+
+
+def add_value_bitmaps(bitmaps, column, values):
+    """Factorizes a column once and packs one bitmap per distinct value."""
+    codes, uniques = pd.factorize(values)
+    for code, value in enumerate(uniques):
+        bitmaps[(column, value)] = Bitmap(np.packbits(codes == code), len(codes))
+
+
+def build_index(df, columns=None):
+    """
+    Builds bitmaps for the categorical pitch columns present in df, the ball-strike
+    count ("Count", e.g. "1-2") and hard hits in play ("HardHit", True).
+
+    Parameters:
+        df (pd.DataFrame): TrackMan data.
+        columns (list, optional): Categorical columns to index. Defaults to INDEXED_COLUMNS.
+
+    Returns:
+        BitmapIndex: The bitmaps, keyed by (column, value).
+    """
+    bitmaps = {}
+    for col in (columns or INDEXED_COLUMNS):
+        if col in df.columns:
+            add_value_bitmaps(bitmaps, col, df[col])
+
+    if "Balls" in df.columns and "Strikes" in df.columns:
+        balls = pd.to_numeric(df["Balls"], errors="coerce")
+        strikes = pd.to_numeric(df["Strikes"], errors="coerce")
+        count = balls.astype("Int64").astype("string") + "-" + strikes.astype("Int64").astype("string")
+        add_value_bitmaps(bitmaps, "Count", count)
+
+    if "ExitSpeed" in df.columns and "PitchCall" in df.columns:
+        hard_hit = is_hard_hit(df["ExitSpeed"]) & (df["PitchCall"] == "InPlay")
+        bitmaps[("HardHit", True)] = Bitmap.from_mask(hard_hit)
+
+    return BitmapIndex(bitmaps, len(df))
@@ -0,0 +1,243 @@
+"""
+EnrichedColumns.py
+------------------
+
+Derived per-pitch columns (hit type, hardness, quadrant, xwOBA, pitch category, tilt
+minutes, sharpness, in-zone and swing flags) computed once at ingest and stored in
+each game's Parquet file next to the raw columns, so scripts read them instead of
+re-deriving them. Every derived column has a fingerprint: a hash of its inputs and of
+the definitions (thresholds, tables, labels) that produced it. The fingerprints are
+kept in the game file's metadata, and refresh_store recomputes only the columns whose
+definitions changed since the game was written.
+
+Example:
+    df, fingerprints = enrich_frame(df)
+    refresh_store('Season2025')  # after editing e.g. BattedBall.HARD_HIT_MPH
+"""
+
+import os
+import sys
+import json
+import hashlib
+import argparse
+import numpy as np
+import pandas as pd
+
+from BattedBall import (HARD_HIT_MPH, HARDNESS_LEVELS, HARDNESS_SPEEDS, HIT_TYPE_ANGLES, HIT_TYPES,
+                        classify_hardness, classify_hit_type, is_hard_hit)
+from GroupedMetrics import SWING_CALLS
+from SeasonStore import PARTITION_FILE, game_partition_dir, list_games, read_game_metadata, write_game
+from TiltStats import CLOCK_MINUTES, MISSING_TILT, parse_tilt
+from XwobaEngine import KORBB_VALUES, XWOBA_COLUMN, XWOBA_INPUT_COLUMNS, XWOBA_TABLE, compute_xwoba
+from ZoneBinning import (QUADRANT_LETTERS, QUADRANT_SPLIT_HEIGHT, QUADRANT_SPLIT_SIDE, STRIKE_ZONE,
+                         in_strike_zone, label_regions, quadrant_codes)
+
+# Parquet metadata key holding a game's {column: fingerprint}
+METADATA_KEY = "derived_columns"
+
+# Pitch categories used when a pitcher's tagged data is insufficient
+PITCH_CATEGORIES = {
+    "Fastball": {"Four-Seam", "Two-Seam", "Fastball", "Cutter", "Sinker"},
+    "Offspeed": {"Splitter", "Changeup", "Forkball", "Screwball"},
+    "Breaking": {"Slider", "Curveball", "Knuckleball", "Sweeper", "Slurve", "Other"}
+}
+
+# Pitch type -> category, for mapping whole columns at once
+PITCH_CATEGORY_LOOKUP = {pitch: category for category, pitch_set in PITCH_CATEGORIES.items() for pitch in pitch_set}
+
+# Boyle's sharpness: release-to-plate change of the vertical and horizontal angles, scaled
+SHARPNESS_ANGLES = [("VertApprAngle", "VertRelAngle"), ("HorzApprAngle", "HorzRelAngle")]
+SHARPNESS_SCALE = 10
+
+
+def pitch_category(df):
+    """
+    Groups pitches into PITCH_CATEGORIES from the tagged type, or the auto type when
+    the pitch is tagged "Other". Pitch types outside the categories are missing.
+    """
+    tagged = df["TaggedPitchType"]
+    return tagged.where(tagged != "Other", df["AutoPitchType"]).map(PITCH_CATEGORY_LOOKUP)
+
+
+def pitch_sharpness(angles):
+    """
+    Computes the sharpness of every pitch.
+
+    Parameters:
+        angles (pd.DataFrame or dict): The release and approach angle columns (arrays work too).
+
+    Returns:
+        pd.Series or np.ndarray: Sharpness, missing where an angle is missing.
+    """
+    change = sum(np.abs(np.abs(angles[approach]) - np.abs(angles[release])) for approach, release in SHARPNESS_ANGLES)
+    return change * SHARPNESS_SCALE
+
+
+def tilt_minutes(tilt):
+    """Returns tilt readings as nullable Int16 minutes on the clock (12:00 is 0)."""
+    minutes = parse_tilt(tilt)
+    return pd.Series(minutes, index=tilt.index).astype("Int16").mask(minutes == MISSING_TILT)
+
+
+class DerivedColumn:
+    """A derived column: the columns it reads, how it is computed and the definitions it depends on."""
+
+    def __init__(self, inputs, compute, definitions, version=1):
+        self.inputs = inputs
+        self.compute = compute  # df -> values aligned with df
+        self.definitions = definitions  # Constants the values depend on; changing one changes the fingerprint
+        self.version = version  # Bump when the computation changes in a way the definitions do not show
+
+    def fingerprint(self):
+        """Returns a short hash of the inputs, definitions and version."""
+        spec = {"inputs": self.inputs, "definitions": self.definitions, "version": self.version}
+        encoded = json.dumps(spec, sort_keys=True, default=sorted)  # Sets are hashed in sorted order
+        return hashlib.sha256(encoded.encode()).hexdigest()[:16]
+
+
+# Column name -> definition, in the order the columns are added
+DERIVED_COLUMNS = {
+    "HitType": DerivedColumn(
+        ["Angle"], lambda df: classify_hit_type(df["Angle"], HIT_TYPE_ANGLES),
+        {"labels": HIT_TYPES, "angles": HIT_TYPE_ANGLES}),
+    "Hardness": DerivedColumn(
+        ["ExitSpeed"], lambda df: classify_hardness(df["ExitSpeed"], HARDNESS_SPEEDS),
+        {"labels": HARDNESS_LEVELS, "speeds": HARDNESS_SPEEDS}),
+    "HardHit": DerivedColumn(
+        ["ExitSpeed"], lambda df: is_hard_hit(df["ExitSpeed"], HARD_HIT_MPH),
+        {"mph": HARD_HIT_MPH}),
+    "Quadrant": DerivedColumn(
+        ["PlateLocSide", "PlateLocHeight"],
+        lambda df: label_regions(quadrant_codes(df["PlateLocSide"], df["PlateLocHeight"], QUADRANT_SPLIT_SIDE,
+                                                QUADRANT_SPLIT_HEIGHT), QUADRANT_LETTERS, index=df.index),
+        {"labels": QUADRANT_LETTERS, "side": QUADRANT_SPLIT_SIDE, "height": QUADRANT_SPLIT_HEIGHT}),
+    "InZone": DerivedColumn(
+        ["PlateLocSide", "PlateLocHeight"],
+        lambda df: in_strike_zone(df["PlateLocSide"], df["PlateLocHeight"], STRIKE_ZONE),
+        {"zone": STRIKE_ZONE}),
+    "Swing": DerivedColumn(
+        ["PitchCall"], lambda df: df["PitchCall"].isin(SWING_CALLS),
+        {"calls": SWING_CALLS}),
+    XWOBA_COLUMN: DerivedColumn(
+        XWOBA_INPUT_COLUMNS, lambda df: compute_xwoba(df, XWOBA_TABLE),
+        {"table": XWOBA_TABLE, "korbb": KORBB_VALUES, "angles": HIT_TYPE_ANGLES, "speeds": HARDNESS_SPEEDS}),
+    "PitchCategory": DerivedColumn(
+        ["TaggedPitchType", "AutoPitchType"], pitch_category,
+        {"categories": PITCH_CATEGORIES}),
+    "TiltMinutes": DerivedColumn(
+        ["Tilt"], lambda df: tilt_minutes(df["Tilt"]),
+        {"clock": CLOCK_MINUTES}),
+    "PitchSharpness": DerivedColumn(
+        [col for pair in SHARPNESS_ANGLES for col in pair], pitch_sharpness,
+        {"angles": SHARPNESS_ANGLES, "scale": SHARPNESS_SCALE}),
+}
+
+
+def current_fingerprints(columns=None):
+    """Returns {column: fingerprint} of the current definitions."""
+    return {name: DERIVED_COLUMNS[name].fingerprint() for name in (columns or DERIVED_COLUMNS)}
+
+
+def stale_columns(fingerprints):
+    """Returns the derived columns whose stored fingerprint is missing or out of date."""
+    return [name for name, fingerprint in current_fingerprints().items() if fingerprints.get(name) != fingerprint]
+
+
+def derived_column(df, name):
+    """Returns a derived column: the stored one when df has it, computed otherwise."""
+    if name in df.columns:
+        return df[name]
+    return pd.Series(DERIVED_COLUMNS[name].compute(df), index=df.index, name=name)
+
+
+def quadrant_labels(df, labels=QUADRANT_LETTERS):
+    """Returns each pitch's quadrant (stored or computed), with labels given in ZoneBinning's code order."""
+    return derived_column(df, "Quadrant").cat.set_categories(QUADRANT_LETTERS).cat.rename_categories(labels)
+
+
+def enrich_frame(df, columns=None):
+    """
+    Computes derived columns and joins them to df, replacing any older versions.
+    Columns whose inputs df does not have are skipped but still fingerprinted: there
+    is nothing to compute for this data until their definition changes.
+
+    Parameters:
+        df (pd.DataFrame): TrackMan data.
+        columns (list, optional): Derived columns to compute. Computes all of them when omitted.
+
+    Returns:
+        tuple: (df, fingerprints)
+               - df (pd.DataFrame): The data with the derived columns.
+               - fingerprints (dict): Fingerprint of every requested column.
+    """
+    names = list(columns or DERIVED_COLUMNS)
+    derived = {}
+    for name in names:
+        column = DERIVED_COLUMNS[name]
+        if all(col in df.columns for col in column.inputs):
+            derived[name] = pd.Series(column.compute(df), index=df.index, name=name)
+
+    if derived:
+        # Joined in one step; inserting columns into a wide TrackMan frame is slow
+        df = pd.concat([df.drop(columns=list(derived), errors="ignore"), pd.DataFrame(derived, index=df.index)],
+                       axis=1)
+    return df, current_fingerprints(names)
+
+
+def derived_metadata(fingerprints):
+    """Returns the Parquet metadata recording a game's derived column fingerprints."""
+    return {METADATA_KEY: json.dumps(fingerprints, sort_keys=True)}
+
+
+def stored_fingerprints(store_dir, game_id):
+    """Returns the {column: fingerprint} stored with a game (empty for games written before enrichment)."""
+    return json.loads(read_game_metadata(store_dir, game_id).get(METADATA_KEY, "{}"))
+
+
+def refresh_store(store_dir, game_ids=None):
+    """
+    Recomputes the derived columns whose definitions changed, game by game. Games whose
+    fingerprints are all current are skipped without reading their data. A stale column
+    whose inputs the game does not have is only re-fingerprinted, so the game is not
+    read again on the next refresh.
+
+    Parameters:
+        store_dir (str): Root folder of the season store.
+        game_ids (list, optional): Games to refresh. Refreshes every game when omitted.
+
+    Returns:
+        dict: GameID -> the columns that were recomputed (empty when none could be).
+    """
+    refreshed = {}
+    for game_id in (list_games(store_dir) if game_ids is None else game_ids):
+        fingerprints = stored_fingerprints(store_dir, game_id)
+        stale = stale_columns(fingerprints)
+        if not stale:
+            continue
+
+        game_df = pd.read_parquet(os.path.join(game_partition_dir(store_dir, game_id), PARTITION_FILE))
+        game_df, updated = enrich_frame(game_df, stale)
+        write_game(game_df, store_dir, game_id, metadata=derived_metadata({**fingerprints, **updated}))
+        refreshed[game_id] = [name for name in stale if name in game_df.columns]
+
+    return refreshed
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Recompute the derived columns of a season store whose definitions changed."
+    )
+    parser.add_argument("store_dir", help="Root folder of the season store")
+    args = parser.parse_args()
+
+    if not list_games(args.store_dir):
+        sys.exit(f"No games found in season store {args.store_dir}")
+
+    refreshed = refresh_store(args.store_dir)
+    for game_id, columns in refreshed.items():
+        print(f"{game_id}: {', '.join(columns) or 'nothing to recompute (inputs missing)'}")
+    print(f"Refresh complete. Games rewritten: {len(refreshed)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,129 @@
+"""
+ExcelCache.py
+-------------
+
+Cached conversion of TrackMan Excel workbooks. Excel parsing is slow, so each
+workbook is converted once and the normalized result is stored as Parquet under
+the SHA-256 of the workbook's contents and the conversion version. Converting the
+same workbook again (even under another name) reads the Parquet file and never opens
+Excel.
+"""
+
+import os
+import numpy as np
+import pandas as pd
+
+from TrackmanFiles import file_hash
+
+CACHE_DIR_NAME = ".excel_cache"
+
+# Bump when convert_workbook's output changes, so entries from older conversions are not reused
+CONVERSION_VERSION = 2
+EXCEL_EXTENSIONS = (".xlsx", ".xls")
+
+# Matches HH:MM:SS and captures HH:MM
+TILT_WITH_SECONDS = r"^([^:]*):([^:]*):[^:]*$"
+
+
+def is_excel_file(path):
+    """Checks whether a path points to an Excel workbook."""
+    return path.lower().endswith(EXCEL_EXTENSIONS)
+
+
+def default_cache_dir(workbook_path):
+    """Returns the cache folder used for a workbook: .excel_cache next to it."""
+    return os.path.join(os.path.dirname(os.path.abspath(workbook_path)), CACHE_DIR_NAME)
+
+
+def fix_tilt_format(tilt):
+    """
+    Converts Tilt values from HH:MM:SS to HH:MM for a whole column at once.
+    Values already in HH:MM are kept, and missing values stay missing.
+
+    Parameters:
+        tilt (pd.Series): Tilt values as read from Excel (strings or times).
+
+    Returns:
+        pd.Series: Tilt values as HH:MM strings.
+    """
+    fixed = tilt.astype(str).str.replace(TILT_WITH_SECONDS, r"\1:\2", regex=True)
+    return fixed.where(tilt.notna(), np.nan)
+
+
+def csv_typed(column):
+    """
+    Types one column read from Excel the way pd.read_csv types the same values in a CSV
+    export: dates and times become text, and text columns whose values all parse as
+    numbers become numeric. Missing values are kept.
+
+    Parameters:
+        column (pd.Series): A column as returned by pd.read_excel.
+
+    Returns:
+        pd.Series: The column as numbers or text.
+    """
+    if pd.api.types.is_datetime64_any_dtype(column):
+        # Dates without a time of day are written without one, as to_csv does
+        dates_only = (column.dropna() == column.dropna().dt.normalize()).all()
+        return column.dt.strftime("%Y-%m-%d" if dates_only else "%Y-%m-%d %H:%M:%S")
+
+    if column.dtype != object:
+        return column
+
+    # Cells holding times, numbers and text mixed together are all written as text
+    present = column.notna()
+    text = column.where(~present, column.astype(str))
+    numbers = pd.to_numeric(text, errors="coerce")
+    return numbers if numbers.notna().sum() == present.sum() else text
+
+
+def convert_workbook(workbook_path):
+    """
+    Reads a workbook and normalizes it the way a CSV export looks: Tilt as HH:MM and
+    every column typed as pd.read_csv would type the exported CSV. The frame is
+    normalized column by column; no CSV is written.
+
+    Parameters:
+        workbook_path (str): Path to the Excel workbook.
+
+    Returns:
+        pd.DataFrame: The normalized data.
+    """
+    excel_data = pd.read_excel(workbook_path)
+
+    # If 'Tilt' column exists, ensure it is formatted correctly from HH:MM:SS to HH:MM
+    if "Tilt" in excel_data.columns:
+        excel_data["Tilt"] = fix_tilt_format(excel_data["Tilt"])
+
+    # Built in one step; replacing columns of a wide TrackMan frame one at a time is slow
+    return pd.DataFrame({col: csv_typed(excel_data[col]) for col in excel_data.columns})
+
+
+def load_workbook(workbook_path, cache_dir=None):
+    """
+    Loads a TrackMan workbook, converting it only if this content was never converted before.
+
+    Parameters:
+        workbook_path (str): Path to the Excel workbook.
+        cache_dir (str, optional): Cache folder. Defaults to .excel_cache next to the workbook.
+
+    Returns:
+        pd.DataFrame: The normalized data.
+    """
+    cache_dir = cache_dir or default_cache_dir(workbook_path)
+    cache_path = os.path.join(cache_dir, f"{file_hash(workbook_path)}-v{CONVERSION_VERSION}.parquet")
+
+    if os.path.exists(cache_path):
+        print(f"Using cached conversion of {workbook_path}")
+        return pd.read_parquet(cache_path)
+
+    print("Detected Excel file. Converting...")
+    data = convert_workbook(workbook_path)
+
+    # Write to a temporary file first so an interrupted run never leaves a partial cache entry
+    os.makedirs(cache_dir, exist_ok=True)
+    temp_path = cache_path + ".tmp"
+    data.to_parquet(temp_path, index=False, compression="zstd")
+    os.replace(temp_path, cache_path)
+
+    return data
@@ -0,0 +1,172 @@
+"""
+GroupedMetrics.py
+-----------------
+
+Declarative grouped metrics in one vectorized pass. Every metric is a ratio of two
+per-pitch indicator columns (or a plain count of one), so a whole table is built by
+adding the indicators once, summing them with a single groupby and dividing the sums.
+No Python code runs per group.
+
+Example:
+    grouped_metrics(df, ['Pitcher', 'TaggedPitchType'], HIT_SPLIT_METRICS)
+    grouped_metrics(df, ['Pitcher', 'BatterSide', 'Count'], {'Whiff%': ('StrikeSwinging', 'Swing'),
+                                                             'Pitches': ('Pitch', None)})
+"""
+
+import numpy as np
+import pandas as pd
+
+from BattedBall import classify_hit_type, is_hard_hit
+from ZoneBinning import QUADRANT_LETTERS, label_regions, quadrant_codes, zone_grid_codes
+
+# Pitch calls that count as a swing
+SWING_CALLS = ["StrikeSwinging", "FoulBall", "FoulBallNotFieldable", "FoulBallFieldable", "InPlay"]
+
+# Metric name -> (numerator indicator, denominator indicator). A metric with no denominator
+# is the count of its numerator; the others are percentages.
+HIT_SPLIT_METRICS = {
+    "HardHit%": ("HardHit", "InPlay"),
+    "GroundBall%": ("GroundBall", "InPlay"),
+    "PopUp%": ("PopUp", "InPlay"),
+    "TotalInPlay": ("InPlay", None),
+    "TotalHardHits": ("HardHit", None),
+}
+
+# The outcome split divides everything by the pitches thrown
+OUTCOME_SPLIT_METRICS = {
+    "HardHit%": ("HardHit", "Pitch"),
+    "GroundBall%": ("GroundBall", "Pitch"),
+    "PopUp%": ("PopUp", "Pitch"),
+    "StrikeCalled%": ("StrikeCalled", "Pitch"),
+    "StrikeSwinging%": ("StrikeSwinging", "Pitch"),
+    "TotalInPlay": ("InPlay", None),
+    "TotalHardHits": ("HardHit", None),
+    "TotalPitches": ("Pitch", None),
+}
+
+HARD_HIT_METRICS = {"HardHit%": ("HardHit", "InPlay")}
+
+WHIFF_METRICS = {
+    "Whiff%": ("StrikeSwinging", "Swing"),
+    "CalledStrike%": ("StrikeCalled", "Pitch"),
+    "Swings": ("Swing", None),
+    "Pitches": ("Pitch", None),
+}
+
+
+def indicator_columns(df, names):
+    """
+    Builds the requested per-pitch indicators as float columns (1.0 or 0.0).
+
+    Available indicators: Pitch, InPlay, HardHit, GroundBall, PopUp, Swing, and
+    any PitchCall value (e.g. StrikeCalled, StrikeSwinging, BallCalled). The Swing,
+    HardHit and HitType columns stored at ingest (EnrichedColumns.py) are used when
+    df has them.
+
+    Parameters:
+        df (pd.DataFrame): TrackMan data.
+        names (list): Indicator names.
+
+    Returns:
+        pd.DataFrame: One column per indicator, aligned with df.
+    """
+    calls = df["PitchCall"] if "PitchCall" in df.columns else None
+    in_play = None
+    hit_type = df["HitType"] if "HitType" in df.columns else None
+
+    columns = {}
+    for name in names:
+        if name == "Pitch":
+            flag = np.ones(len(df), dtype=bool)
+        elif name == "Swing":
+            flag = df["Swing"] if "Swing" in df.columns else calls.isin(SWING_CALLS)
+        elif name in ("InPlay", "HardHit", "GroundBall", "PopUp"):
+            in_play = (calls == "InPlay") if in_play is None else in_play
+            if name == "InPlay":
+                flag = in_play
+            elif name == "HardHit":
+                hard_hit = df["HardHit"] if "HardHit" in df.columns else is_hard_hit(df["ExitSpeed"])
+                flag = in_play & hard_hit
+            else:
+                # Hit types are classified once, however many of them are requested
+                hit_type = classify_hit_type(df["Angle"]) if hit_type is None else hit_type
+                flag = in_play & (hit_type == ("Ground Ball" if name == "GroundBall" else "Pop Up"))
+        else:
+            flag = calls == name
+
+        if isinstance(flag, pd.Series):
+            flag = flag.to_numpy(dtype=bool, na_value=False)
+        columns[name] = flag.astype("float64")
+
+    return pd.DataFrame(columns, index=df.index)
+
+
+def derived_key(df, key):
+    """
+    Returns a grouping column: an existing column of df, or one of the derived keys
+    Quadrant (A-D), Zone (3x3 grid cells 0-8) or Count ("balls-strikes").
+    """
+    if key in df.columns:
+        return df[key]
+    if key == "Quadrant":
+        return label_regions(quadrant_codes(df["PlateLocSide"], df["PlateLocHeight"]), QUADRANT_LETTERS,
+                             index=df.index)
+    if key == "Zone":
+        codes = zone_grid_codes(df["PlateLocSide"], df["PlateLocHeight"])
+        return label_regions(codes, list(range(9)), index=df.index)
+    if key == "Count":
+        balls = pd.to_numeric(df["Balls"], errors="coerce").astype("Int64").astype("string")
+        strikes = pd.to_numeric(df["Strikes"], errors="coerce").astype("Int64").astype("string")
+        return (balls + "-" + strikes).rename("Count")
+    raise KeyError(f"Unknown grouping key '{key}'.")
+
+
+def metric_table(sums, metrics, empty_value=None):
+    """
+    Turns summed indicators into metric columns.
+
+    Parameters:
+        sums (pd.DataFrame): Indicator sums, one row per group (group keys in the index).
+        metrics (dict): Metric name -> (numerator, denominator or None).
+        empty_value: Value of a percentage whose denominator is 0 (None for missing).
+
+    Returns:
+        pd.DataFrame: One row per group with the key columns first.
+    """
+    empty = np.nan if empty_value is None else empty_value
+
+    columns = {}
+    for name, (numerator, denominator) in metrics.items():
+        if denominator is None:
+            columns[name] = sums[numerator].astype("float64")
+        else:
+            total = sums[denominator]
+            columns[name] = np.where(total > 0, sums[numerator] / total.where(total > 0) * 100, empty)
+
+    return pd.DataFrame(columns, index=sums.index).reset_index()
+
+
+def required_indicators(metrics):
+    """Returns the indicators a set of metrics needs, in first-use order."""
+    names = []
+    for numerator, denominator in metrics.values():
+        names.extend(name for name in (numerator, denominator) if name is not None)
+    return list(dict.fromkeys(names))
+
+
+def grouped_metrics(df, keys, metrics, empty_value=None):
+    """
+    Computes every metric for every group in one groupby.
+
+    Parameters:
+        df (pd.DataFrame): TrackMan data.
+        keys (list): Grouping keys: columns of df or derived keys (Quadrant, Zone, Count).
+        metrics (dict): Metric name -> (numerator, denominator or None), e.g. HIT_SPLIT_METRICS.
+        empty_value: Value of a percentage whose denominator is 0 (None for missing).
+
+    Returns:
+        pd.DataFrame: One row per group (sorted by the keys), keys first, then the metrics.
+    """
+    indicators = indicator_columns(df, required_indicators(metrics))
+    sums = indicators.groupby([derived_key(df, key).rename(key) for key in keys], observed=True).sum()
+    return metric_table(sums, metrics, empty_value)
@@ -0,0 +1,142 @@
+"""
+PhysicsCache.py
+---------------
+
+Cache of the numeric pitch physics columns as one float32 .npy file per column,
+plus a small Parquet row index (pitcher, pitch type, game...). Arrays are opened
+with np.load(mmap_mode='r'), so repeated analyses do no parsing and no copying,
+and several processes reading the same cache share its pages in the OS page cache.
+"""
+
+import os
+import json
+import numpy as np
+import pandas as pd
+
+from TrackmanSchema import load_trackman
+
+# Numeric columns used by pitch shape, movement and release work
+PHYSICS_COLUMNS = [
+    "RelSpeed", "SpinRate", "SpinAxis", "InducedVertBreak", "HorzBreak", "VertBreak",
+    "RelHeight", "RelSide", "Extension", "VertRelAngle", "HorzRelAngle", "VertApprAngle",
+    "HorzApprAngle", "PlateLocHeight", "PlateLocSide", "ZoneSpeed", "EffectiveVelo",
+]
+
+# Row labels kept next to the arrays, in the same row order
+INDEX_COLUMNS = ["PitchUID", "GameID", "Date", "Pitcher", "PitcherThrows", "TaggedPitchType"]
+
+INDEX_FILE = "index.parquet"
+META_FILE = "_meta.json"
+
+
+def source_fingerprint(source_path):
+    """Returns the size and modified time that identify the version of a source file."""
+    stat = os.stat(source_path)
+    return {"path": os.path.abspath(source_path), "size": stat.st_size, "mtime": stat.st_mtime}
+
+
+def default_cache_dir(source_path):
+    """Returns the cache folder used for a source file: <name>_physics next to it."""
+    return os.path.splitext(os.path.abspath(source_path))[0] + "_physics"
+
+
+def replace_file(path, write, mode="wb"):
+    """
+    Writes a file through a temporary file in the same folder, then swaps it into place.
+    Readers see either the old or the new file, and arrays already memory-mapped from the
+    old one stay valid.
+
+    Parameters:
+        path (str): The file to write.
+        write (callable): Writes the content to the open file object it is given.
+        mode (str): Mode the temporary file is opened with.
+    """
+    temp_path = path + ".tmp"
+    with open(temp_path, mode) as f:
+        write(f)
+    os.replace(temp_path, path)
+
+
+def write_cache(df, cache_dir, source=None):
+    """
+    Writes the physics arrays and the row index for a DataFrame.
+
+    Parameters:
+        df (pd.DataFrame): TrackMan data. Missing physics columns are stored as all-NaN.
+        cache_dir (str): Folder to write the cache to.
+        source (dict, optional): Fingerprint of the source the data came from.
+
+    Returns:
+        str: The cache folder.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+
+    # The metadata goes last, so a half-written cache is never considered valid
+    meta_path = os.path.join(cache_dir, META_FILE)
+    if os.path.exists(meta_path):
+        os.remove(meta_path)
+
+    for col in PHYSICS_COLUMNS:
+        if col in df.columns:
+            values = pd.to_numeric(df[col], errors="coerce").to_numpy(dtype=np.float32, na_value=np.nan)
+        else:
+            values = np.full(len(df), np.nan, dtype=np.float32)
+        replace_file(os.path.join(cache_dir, f"{col}.npy"), lambda f: np.save(f, np.ascontiguousarray(values)))
+
+    # The row index is swapped in after every array, then the metadata marks the cache valid
+    index = df[[col for col in INDEX_COLUMNS if col in df.columns]].reset_index(drop=True)
+    replace_file(os.path.join(cache_dir, INDEX_FILE), lambda f: index.to_parquet(f, index=False))
+
+    meta = {"rows": len(df), "columns": PHYSICS_COLUMNS, "source": source}
+    replace_file(meta_path, lambda f: json.dump(meta, f, indent=2), mode="w")
+
+    return cache_dir
+
+
+def is_current(cache_dir, source_path):
+    """Checks whether a cache exists and was built from the current version of the source."""
+    meta_path = os.path.join(cache_dir, META_FILE)
+    if not os.path.exists(meta_path):
+        return False
+
+    with open(meta_path) as f:
+        meta = json.load(f)
+    return meta.get("source") == source_fingerprint(source_path) and meta.get("columns") == PHYSICS_COLUMNS
+
+
+def ensure_cache(source_path, cache_dir=None):
+    """
+    Builds the cache for a TrackMan CSV file unless an up-to-date one already exists.
+
+    Parameters:
+        source_path (str): Path to the TrackMan CSV file.
+        cache_dir (str, optional): Cache folder. Defaults to <name>_physics next to the file.
+
+    Returns:
+        str: The cache folder.
+    """
+    cache_dir = cache_dir or default_cache_dir(source_path)
+    if not is_current(cache_dir, source_path):
+        df = load_trackman(source_path, columns=INDEX_COLUMNS + PHYSICS_COLUMNS)
+        write_cache(df, cache_dir, source=source_fingerprint(source_path))
+    return cache_dir
+
+
+def open_columns(cache_dir, columns=None):
+    """
+    Opens physics arrays as read-only memory maps. Nothing is read until it is used.
+
+    Parameters:
+        cache_dir (str): The cache folder.
+        columns (list, optional): Columns to open. Opens every physics column when omitted.
+
+    Returns:
+        dict: Column name -> read-only float32 array backed by the .npy file.
+    """
+    return {col: np.load(os.path.join(cache_dir, f"{col}.npy"), mmap_mode="r")
+            for col in (columns or PHYSICS_COLUMNS)}
+
+
+def load_index(cache_dir, columns=None):
+    """Loads the row index (pitcher, pitch type, game...) that lines up with the arrays."""
+    return pd.read_parquet(os.path.join(cache_dir, INDEX_FILE), columns=columns)
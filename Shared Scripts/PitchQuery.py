@@ -0,0 +1,223 @@
+"""
+PitchQuery.py
+-------------
+
+Local SQL access to the season store. The store's games are copied into a SQLite
+file (next to the store) with indexes on the columns most questions filter on, so
+ad-hoc lookups are a single SQL query instead of a new script that reloads every
+game. Games are synced one at a time: only games added or rewritten since the last
+sync are copied again.
+
+Example:
+    find_pitches(store_dir, TaggedPitchType="Slider", BatterSide="Left", Strikes=2)
+"""
+
+import os
+import sys
+import sqlite3
+import argparse
+import pandas as pd
+
+from EnrichedColumns import DERIVED_COLUMNS
+from SeasonStore import PARTITION_COLUMN, PARTITION_FILE, game_partition_dir, list_games, load_season
+
+DB_FILE = "_pitches.sqlite"
+TABLE = "pitches"
+GAMES_TABLE = "synced_games"  # GameID -> size and modified time of the Parquet file that was copied
+
+# Secondary indexes for the usual filters
+INDEX_COLUMNS = ["Pitcher", "Batter", "GameID", "Date", "PitcherTeam", "BatterTeam", "TaggedPitchType"]
+
+
+def quote_name(name):
+    """Quotes a column name for SQL (TrackMan has names like 'Top/Bottom')."""
+    return '"' + str(name).replace('"', '""') + '"'
+
+
+def database_path(store_dir):
+    """Returns the SQLite file that mirrors a season store."""
+    return os.path.join(store_dir, DB_FILE)
+
+
+def table_columns(conn, table):
+    """Returns the column names of a table, or an empty list if it does not exist."""
+    return [row[1] for row in conn.execute(f"PRAGMA table_info({quote_name(table)})")]
+
+
+def drop_case_duplicates(df):
+    """
+    SQLite column names ignore case, so of the columns whose names differ only by case
+    (e.g. TrackMan's xwoba and the derived xwOBA) only one is kept: the source column
+    rather than the derived one.
+    """
+    seen = set()
+    duplicates = []
+    for col in sorted(df.columns, key=lambda name: name in DERIVED_COLUMNS):  # Source columns first
+        if col.lower() in seen:
+            duplicates.append(col)
+        seen.add(col.lower())
+    return df.drop(columns=duplicates)
+
+
+def prepare_game(df):
+    """Converts a game's rows to SQLite-friendly values; dates are stored as ISO text so they sort."""
+    df = drop_case_duplicates(df)
+    if "Date" in df.columns:
+        dates = pd.to_datetime(df["Date"].astype("string"), format="mixed", errors="coerce")
+        df["Date"] = dates.dt.strftime("%Y-%m-%d")
+
+    # SQLite has no categorical type, so categories are stored as their text values
+    for col in df.columns:
+        if isinstance(df[col].dtype, pd.CategoricalDtype):
+            df[col] = df[col].astype(object)
+    return df
+
+
+def add_missing_columns(conn, df):
+    """Adds columns that appear in later exports to the pitches table."""
+    existing = {col.lower() for col in table_columns(conn, TABLE)}
+    if not existing:
+        return
+
+    for col in df.columns:
+        if col.lower() not in existing:
+            conn.execute(f"ALTER TABLE {TABLE} ADD COLUMN {quote_name(col)}")
+
+
+def create_indexes(conn):
+    """Creates the secondary indexes that do not exist yet."""
+    columns = set(table_columns(conn, TABLE))
+    for col in INDEX_COLUMNS:
+        if col in columns:
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {quote_name('idx_' + col)} ON {TABLE} ({quote_name(col)})")
+
+
+def sync_database(store_dir):
+    """
+    Brings the SQLite mirror up to date with the season store. Each game that is new or was
+    rewritten since the last sync is replaced as a whole; games removed from the store are dropped.
+
+    Parameters:
+        store_dir (str): Root folder of the season store.
+
+    Returns:
+        list: The GameIDs that were (re)loaded.
+    """
+    conn = sqlite3.connect(database_path(store_dir))
+    try:
+        conn.execute(f"CREATE TABLE IF NOT EXISTS {GAMES_TABLE} "
+                     f"(GameID TEXT PRIMARY KEY, size INTEGER, mtime_ns INTEGER)")
+        synced = {game_id: (size, mtime_ns) for game_id, size, mtime_ns
+                  in conn.execute(f"SELECT GameID, size, mtime_ns FROM {GAMES_TABLE}")}
+
+        store_games = list_games(store_dir)
+        has_table = bool(table_columns(conn, TABLE))
+
+        # Games deleted from the store
+        for game_id in set(synced) - set(store_games):
+            with conn:
+                if has_table:
+                    conn.execute(f"DELETE FROM {TABLE} WHERE {PARTITION_COLUMN} = ?", (game_id,))
+                conn.execute(f"DELETE FROM {GAMES_TABLE} WHERE GameID = ?", (game_id,))
+
+        loaded = []
+        for game_id in store_games:
+            stat = os.stat(os.path.join(game_partition_dir(store_dir, game_id), PARTITION_FILE))
+            version = (stat.st_size, stat.st_mtime_ns)
+            if synced.get(game_id) == version:
+                continue
+
+            game_df = prepare_game(load_season(store_dir, game_ids=[game_id]))
+
+            # Replace the whole game in one transaction so a failed sync leaves the old rows
+            with conn:
+                add_missing_columns(conn, game_df)
+                if table_columns(conn, TABLE):
+                    conn.execute(f"DELETE FROM {TABLE} WHERE {PARTITION_COLUMN} = ?", (game_id,))
+                game_df.to_sql(TABLE, conn, if_exists="append", index=False)
+                conn.execute(f"INSERT OR REPLACE INTO {GAMES_TABLE} VALUES (?, ?, ?)", (game_id, *version))
+            loaded.append(game_id)
+
+        with conn:
+            create_indexes(conn)
+    finally:
+        conn.close()
+
+    return loaded
+
+
+def query(store_dir, sql, params=(), sync=True):
+    """
+    Runs a SQL query against the pitches table.
+
+    Parameters:
+        store_dir (str): Root folder of the season store.
+        sql (str): The query, e.g. "SELECT * FROM pitches WHERE Pitcher = ?".
+        params (tuple or dict): Query parameters.
+        sync (bool): Sync changed games from the store first.
+
+    Returns:
+        pd.DataFrame: The query result.
+    """
+    if sync:
+        sync_database(store_dir)
+
+    conn = sqlite3.connect(database_path(store_dir))
+    try:
+        return pd.read_sql_query(sql, conn, params=params)
+    finally:
+        conn.close()
+
+
+def find_pitches(store_dir, columns=None, sync=True, **filters):
+    """
+    Looks up pitches by column values. A list value matches any of its items.
+
+    Parameters:
+        store_dir (str): Root folder of the season store.
+        columns (list, optional): Columns to return. Returns every column when omitted.
+        sync (bool): Sync changed games from the store first.
+        **filters: Column=value conditions, all of which must hold.
+
+    Returns:
+        pd.DataFrame: The matching pitches.
+    """
+    conditions = []
+    params = []
+    for col, value in filters.items():
+        if isinstance(value, (list, tuple, set)):
+            values = list(value)
+            conditions.append(f"{quote_name(col)} IN ({', '.join('?' * len(values))})")
+            params.extend(values)
+        else:
+            conditions.append(f"{quote_name(col)} = ?")
+            params.append(value)
+
+    select = ", ".join(quote_name(col) for col in columns) if columns else "*"
+    sql = f"SELECT {select} FROM {TABLE}"
+    if conditions:
+        sql += " WHERE " + " AND ".join(conditions)
+
+    return query(store_dir, sql, tuple(params), sync=sync)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Run a SQL query against a season store.")
+    parser.add_argument("store_dir", help="Root folder of the season store")
+    parser.add_argument("sql", help=f"The query, using the '{TABLE}' table")
+    parser.add_argument("--output", help="Save the result to this CSV file instead of printing it")
+    args = parser.parse_args()
+
+    if not list_games(args.store_dir):
+        sys.exit(f"No games found in season store {args.store_dir}")
+
+    result = query(args.store_dir, args.sql)
+    if args.output:
+        result.to_csv(args.output, index=False)
+        print(f"{len(result)} rows saved to {args.output}")
+    else:
+        print(result.to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
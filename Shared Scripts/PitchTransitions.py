@@ -0,0 +1,140 @@
+"""
+PitchTransitions.py
+-------------------
+
+Pitch-to-pitch transitions within plate appearances. Pitches are put in plate
+appearance order (game, inning, half, PAofInning, then PitchofPA) once, and every
+pitch is paired with the previous pitch of the same plate appearance by shifting
+the sorted arrays, so the first pitch of a plate appearance (or game) never follows
+the last pitch of the one before. All pairs are counted in one pass into a
+pitcher x previous type x current type x outcome tensor, and per-pitcher tables are
+slices of it.
+
+Example:
+    transitions = transition_counts(df, outcomes=STRIKE_CALLS)
+    tally = transitions.tally('Schreier, Gaven')
+"""
+
+import numpy as np
+import pandas as pd
+
+# Columns that identify a plate appearance, and the pitch order within it
+PA_COLUMNS = ["GameID", "Inning", "Top/Bottom", "PAofInning"]
+ORDER_COLUMN = "PitchofPA"
+
+STRIKE_CALLS = ["StrikeCalled", "StrikeSwinging"]
+
+
+class TransitionCounts:
+    """Counts of previous pitch type x current pitch type x outcome for every pitcher."""
+
+    def __init__(self, counts, pitchers, pitch_types, outcomes):
+        self.counts = counts  # int64 array shaped (pitchers, pitch types, pitch types, outcomes)
+        self.pitchers = pitchers
+        self.pitch_types = pitch_types
+        self.outcomes = outcomes
+
+    def pitcher_counts(self, pitcher):
+        """Returns one pitcher's previous type x current type x outcome counts."""
+        return self.counts[self.pitchers.get_loc(pitcher)]
+
+    def tally(self, pitcher=None, outcomes=None):
+        """
+        Returns one pitcher's transitions as a table: one row per (PreviousPitch,
+        CurrentPitch) pair that led to at least one of the outcomes, one column per
+        outcome that occurred (named by StrikeType), sorted like a groupby.
+
+        Parameters:
+            pitcher (optional): The pitcher (default: every pitcher combined).
+            outcomes (list, optional): Outcomes to include (default: all counted outcomes).
+
+        Returns:
+            pd.DataFrame: Transition counts.
+        """
+        keep = np.arange(len(self.outcomes)) if outcomes is None else self.outcomes.get_indexer(outcomes)
+        keep = np.sort(keep[keep >= 0])
+        counts = self.counts.sum(axis=0) if pitcher is None else self.pitcher_counts(pitcher)
+        counts = counts[:, :, keep]
+
+        n_types = len(self.pitch_types)
+        index = pd.MultiIndex.from_product([self.pitch_types, self.pitch_types],
+                                           names=["PreviousPitch", "CurrentPitch"])
+        table = pd.DataFrame(counts.reshape(n_types * n_types, len(keep)), index=index,
+                             columns=pd.Index(self.outcomes[keep], name="StrikeType"))
+
+        # Only pairs and outcomes that occurred, as groupby(...).size().unstack() reports them
+        table = table.loc[table.sum(axis=1) > 0, table.sum(axis=0) > 0]
+        return table
+
+
+def plate_appearance_order(df, by="Pitcher"):
+    """
+    Puts pitches in plate appearance order and flags the pitches that have a previous
+    pitch from the same pitcher in the same plate appearance.
+
+    Parameters:
+        df (pd.DataFrame): TrackMan data with PA_COLUMNS, ORDER_COLUMN and by.
+        by (str): Pitcher column; a pitching change starts a new sequence.
+
+    Returns:
+        tuple: (order, follows)
+               - order (np.ndarray): Row positions in plate appearance order.
+               - follows (np.ndarray): For each pitch in that order, whether the pitch before it
+                 is from the same plate appearance (False for first pitches and missing keys).
+    """
+    missing = [col for col in PA_COLUMNS + [ORDER_COLUMN, by] if col not in df.columns]
+    if missing:
+        raise ValueError(f"Plate appearance columns missing from the data: {missing}")
+
+    plate_appearance = df.groupby(PA_COLUMNS + [by], sort=False, observed=True).ngroup()
+    plate_appearance = plate_appearance.to_numpy(dtype="float64", na_value=np.nan)
+    pitch_of_pa = pd.to_numeric(df[ORDER_COLUMN], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+
+    # Stable, so pitches with the same PitchofPA keep their file order
+    order = np.lexsort((pitch_of_pa, plate_appearance))
+    sorted_pa = plate_appearance[order]
+
+    follows = np.zeros(len(order), dtype=bool)
+    follows[1:] = (sorted_pa[1:] == sorted_pa[:-1]) & ~np.isnan(sorted_pa[1:])
+    return order, follows
+
+
+def transition_counts(df, by="Pitcher", outcomes=None, pitch_column="TaggedPitchType", outcome_column="PitchCall"):
+    """
+    Counts every previous pitch -> current pitch transition with the current pitch's
+    outcome, for every pitcher in one pass.
+
+    Parameters:
+        df (pd.DataFrame): TrackMan data with PA_COLUMNS, ORDER_COLUMN, by, pitch_column
+                           and outcome_column.
+        by (str): Pitcher column.
+        outcomes (list, optional): Outcomes to count (e.g. STRIKE_CALLS); others are skipped.
+                                   Default: every outcome in the data.
+        pitch_column (str): Pitch type column.
+        outcome_column (str): Outcome column.
+
+    Returns:
+        TransitionCounts: Pitchers in order of first appearance; pitch types and outcomes sorted.
+    """
+    order, follows = plate_appearance_order(df, by)
+
+    pitcher_codes, pitchers = pd.factorize(df[by])
+    type_codes, pitch_types = pd.factorize(df[pitch_column], sort=True)
+    if outcomes is None:
+        outcome_codes, outcome_values = pd.factorize(df[outcome_column], sort=True)
+    else:
+        outcome_values = pd.Index(sorted(outcomes))
+        outcome_codes = outcome_values.get_indexer(df[outcome_column])
+
+    pitcher_codes, type_codes, outcome_codes = pitcher_codes[order], type_codes[order], outcome_codes[order]
+
+    # Each pitch paired with the one before it (only used where follows is set)
+    previous_codes = np.roll(type_codes, 1)
+    valid = follows & (pitcher_codes >= 0) & (previous_codes >= 0) & (type_codes >= 0) & (outcome_codes >= 0)
+
+    n_pitchers, n_types, n_outcomes = len(pitchers), len(pitch_types), len(outcome_values)
+    cells = ((pitcher_codes * n_types + previous_codes) * n_types + type_codes) * n_outcomes + outcome_codes
+    counts = np.bincount(cells[valid], minlength=n_pitchers * n_types * n_types * n_outcomes)
+
+    return TransitionCounts(counts.reshape(n_pitchers, n_types, n_types, n_outcomes).astype(np.int64),
+                            pd.Index(pitchers), pd.Index(pitch_types), pd.Index(outcome_values))
@@ -0,0 +1,74 @@
+"""
+PitcherPartition.py
+-------------------
+
+Splits TrackMan data by pitcher (or any key) in a single pass. The rows are
+stably sorted by the key once and each pitcher's row range is recorded, so a
+pitcher's data is an O(1) slice of the sorted frame instead of a full-table
+filter per pitcher. Writing one CSV per pitcher is optional.
+"""
+
+import os
+import numpy as np
+import pandas as pd
+
+
+def partition_rows(df, key="Pitcher", sort=False):
+    """
+    Sorts the rows by key once and records where each key's rows start and stop.
+    The sort is stable, so every pitcher's rows keep their original order.
+
+    Parameters:
+        df (pd.DataFrame): The data to partition.
+        key (str): Column to partition by.
+        sort (bool): Order partitions by key value. By default they follow the order in
+                     which each value first appears, like df[key].unique().
+
+    Returns:
+        tuple: (sorted DataFrame, dict of key value -> (start, stop) row positions).
+               Rows with a missing key are kept at the top and left out of the offsets.
+    """
+    codes, uniques = pd.factorize(df[key], sort=sort)
+    order = np.argsort(codes, kind="stable")
+
+    # Missing keys get code -1 and sort to the front
+    counts = np.bincount(codes[codes >= 0], minlength=len(uniques))
+    bounds = np.concatenate([[0], np.cumsum(counts)]) + np.count_nonzero(codes < 0)
+
+    offsets = {value: (int(bounds[i]), int(bounds[i + 1])) for i, value in enumerate(uniques)}
+    return df.take(order), offsets
+
+
+def iter_partitions(sorted_df, offsets):
+    """Yields (key value, rows) pairs; each rows frame is a slice of sorted_df, not a copy."""
+    for value, (start, stop) in offsets.items():
+        yield value, sorted_df.iloc[start:stop]
+
+
+def safe_filename(name):
+    """Creates a valid filename by replacing spaces and dropping commas."""
+    return str(name).replace(" ", "_").replace(",", "") + ".csv"
+
+
+def write_partitions(sorted_df, offsets, output_dir, filename=safe_filename):
+    """
+    Saves each partition as its own CSV file.
+
+    Parameters:
+        sorted_df (pd.DataFrame): Output of partition_rows.
+        offsets (dict): Output of partition_rows.
+        output_dir (str): Folder to write the files to.
+        filename (callable): Turns a key value into a file name.
+
+    Returns:
+        list: Paths of the written files.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+
+    paths = []
+    for value, rows in iter_partitions(sorted_df, offsets):
+        path = os.path.join(output_dir, filename(value))
+        rows.to_csv(path, index=False)
+        paths.append(path)
+
+    return paths
@@ -0,0 +1,236 @@
+"""
+PlayerRegistry.py
+-----------------
+
+Persistent registry of players with compact integer codes. Players are identified
+by their TrackMan id (PitcherId / BatterId / CatcherId) and fall back to the name
+only when an export has no id. Each player's name variants (display name, file-safe
+name, other spellings seen) are worked out once when they are registered, so reports
+do not re-parse "Lastname, Firstname" strings, and grouping or joining can use the
+int32 PitcherCode / BatterCode / CatcherCode columns instead of names.
+"""
+
+import os
+import re
+import numpy as np
+import pandas as pd
+
+# Id column -> name column -> code column for each player role
+PLAYER_COLUMNS = [
+    ("PitcherId", "Pitcher", "PitcherCode"),
+    ("BatterId", "Batter", "BatterCode"),
+    ("CatcherId", "Catcher", "CatcherCode"),
+]
+
+REGISTRY_COLUMNS = ["PlayerCode", "TrackmanId", "Name", "LastName", "FirstName", "Suffix",
+                    "DisplayName", "FileName", "Aliases"]
+ALIAS_SEPARATOR = "|"
+MISSING_CODE = -1  # Code for rows without a player
+
+NAME_SUFFIXES = {"jr", "sr", "ii", "iii", "iv", "v"}
+
+
+def is_suffix(token):
+    """Checks whether a name token is a generational suffix like Jr. or III."""
+    return token.rstrip(".").lower() in NAME_SUFFIXES
+
+
+def split_name(name):
+    """
+    Splits a TrackMan name into (last name, first name, suffix). Handles
+    "Smith, John", "Smith Jr., John", "Smith, John Jr.", "Smith, Jr., John" and names
+    without a comma ("John Smith").
+    """
+    parts = [part.strip() for part in " ".join(str(name).split()).split(",")]
+
+    if len(parts) >= 3 and is_suffix(parts[1]):
+        last, suffix, first = parts[0], parts[1], ", ".join(parts[2:])
+    elif len(parts) >= 2:
+        last, first, suffix = parts[0], ", ".join(parts[1:]), ""
+    else:
+        # No comma: the last word (before any suffix) is the last name
+        tokens = parts[0].split(" ")
+        suffix = tokens.pop() if len(tokens) > 2 and is_suffix(tokens[-1]) else ""
+        last, first = tokens[-1], " ".join(tokens[:-1])
+        return last, first, suffix
+
+    # The suffix can also trail the last or the first name
+    for field in ("last", "first"):
+        tokens = (last if field == "last" else first).split(" ")
+        if not suffix and len(tokens) > 1 and is_suffix(tokens[-1]):
+            suffix = tokens.pop()
+            if field == "last":
+                last = " ".join(tokens)
+            else:
+                first = " ".join(tokens)
+
+    return last, first, suffix
+
+
+def file_safe(text):
+    """Makes a string safe to use in a file name."""
+    return re.sub(r"[^A-Za-z0-9_.-]+", "_", text).strip("_.")
+
+
+def name_variants(name):
+    """Returns the registry fields derived from a TrackMan name."""
+    last, first, suffix = split_name(name)
+    display = " ".join(part for part in (first, last, suffix) if part)
+    return {
+        "Name": name,
+        "LastName": last,
+        "FirstName": first,
+        "Suffix": suffix,
+        "DisplayName": display,
+        "FileName": file_safe("_".join(part for part in (last, first, suffix) if part)),
+    }
+
+
+def empty_registry():
+    """Returns a registry with no players."""
+    return pd.DataFrame({col: pd.Series(dtype="string") for col in REGISTRY_COLUMNS}).astype(
+        {"PlayerCode": "int32", "TrackmanId": "Int64"}).set_index("PlayerCode", drop=False)
+
+
+def load_registry(path):
+    """Loads the registry CSV, or an empty registry if it does not exist yet."""
+    if not os.path.exists(path):
+        return empty_registry()
+
+    registry = pd.read_csv(path, dtype={"PlayerCode": "int32", "TrackmanId": "Int64"}, keep_default_na=False,
+                           na_values={"TrackmanId": [""]})
+    return registry.set_index("PlayerCode", drop=False)
+
+
+def save_registry(registry, path):
+    """Writes the registry atomically."""
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    temp_path = path + ".tmp"
+    registry[REGISTRY_COLUMNS].to_csv(temp_path, index=False)
+    os.replace(temp_path, path)
+
+
+def collect_players(df):
+    """Returns the distinct (TrackmanId, Name) pairs over all player roles in df."""
+    frames = []
+    for id_col, name_col, _ in PLAYER_COLUMNS:
+        if name_col not in df.columns:
+            continue
+        ids = df[id_col] if id_col in df.columns else pd.Series(pd.NA, index=df.index)
+        frames.append(pd.DataFrame({
+            "TrackmanId": pd.to_numeric(ids, errors="coerce").round().astype("Int64"),
+            "Name": df[name_col].astype("string"),
+        }).drop_duplicates())
+
+    if not frames:
+        return pd.DataFrame({"TrackmanId": pd.Series(dtype="Int64"), "Name": pd.Series(dtype="string")})
+    return pd.concat(frames).dropna(subset=["Name"]).drop_duplicates()
+
+
+def update_registry(df, path=None, registry=None):
+    """
+    Registers every player in df that is not in the registry yet. A player with a known
+    TrackmanId under a new spelling gets that spelling added to Aliases.
+
+    Parameters:
+        df (pd.DataFrame): TrackMan data.
+        path (str, optional): Registry CSV to load and save.
+        registry (pd.DataFrame, optional): Registry to update when no path is given.
+
+    Returns:
+        pd.DataFrame: The updated registry, indexed by PlayerCode.
+    """
+    if registry is None:
+        registry = load_registry(path) if path else empty_registry()
+
+    records = registry[REGISTRY_COLUMNS].to_dict("records")
+    by_id = {rec["TrackmanId"]: rec for rec in records if not pd.isna(rec["TrackmanId"])}
+    by_name = {}
+    for rec in records:
+        for name in [rec["Name"]] + [a for a in str(rec["Aliases"] or "").split(ALIAS_SEPARATOR) if a]:
+            by_name.setdefault(name, rec)
+
+    changed = False
+    for trackman_id, name in collect_players(df).itertuples(index=False):
+        has_id = not pd.isna(trackman_id)
+        rec = by_id.get(trackman_id) if has_id else by_name.get(name)
+
+        # A player first seen without an id keeps their code once an id shows up
+        if rec is None and has_id:
+            rec = by_name.get(name)
+            if rec is not None and pd.isna(rec["TrackmanId"]):
+                rec["TrackmanId"] = trackman_id
+                by_id[trackman_id] = rec
+                changed = True
+            else:
+                rec = None
+
+        if rec is None:
+            rec = {"PlayerCode": len(records), "TrackmanId": trackman_id if has_id else pd.NA,
+                   "Aliases": "", **name_variants(name)}
+            records.append(rec)
+            if has_id:
+                by_id[trackman_id] = rec
+            by_name.setdefault(name, rec)
+            changed = True
+        elif name != rec["Name"] and name not in str(rec["Aliases"] or "").split(ALIAS_SEPARATOR):
+            rec["Aliases"] = ALIAS_SEPARATOR.join(a for a in [rec["Aliases"], name] if a)
+            by_name.setdefault(name, rec)
+            changed = True
+
+    if not changed:
+        return registry
+
+    registry = pd.DataFrame(records, columns=REGISTRY_COLUMNS).astype({"PlayerCode": "int32", "TrackmanId": "Int64"})
+    registry = registry.set_index("PlayerCode", drop=False)
+    if path:
+        save_registry(registry, path)
+    return registry
+
+
+def encode_players(df, registry):
+    """
+    Adds int32 PitcherCode / BatterCode / CatcherCode columns (MISSING_CODE when there is
+    no player). Rows are matched on TrackmanId, and on name when the id is missing.
+
+    Parameters:
+        df (pd.DataFrame): TrackMan data whose players are in the registry.
+        registry (pd.DataFrame): Output of update_registry or load_registry.
+
+    Returns:
+        pd.DataFrame: A copy of df with the code columns added.
+    """
+    known = registry["TrackmanId"].notna().to_numpy()
+    id_index = pd.Index(registry["TrackmanId"].to_numpy(dtype="float64")[known])
+    id_codes = registry["PlayerCode"].to_numpy()[known]
+
+    # Names and aliases -> code, for rows without an id
+    name_codes = {}
+    for code, name, aliases in registry[["PlayerCode", "Name", "Aliases"]].itertuples(index=False):
+        for variant in [name] + [a for a in str(aliases or "").split(ALIAS_SEPARATOR) if a]:
+            name_codes.setdefault(variant, code)
+
+    code_columns = {}
+    for id_col, name_col, code_col in PLAYER_COLUMNS:
+        if name_col not in df.columns:
+            continue
+
+        codes = np.full(len(df), MISSING_CODE, dtype=np.int32)
+        if id_col in df.columns:
+            ids = pd.to_numeric(df[id_col], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+            positions = id_index.get_indexer(ids)
+            codes[positions >= 0] = id_codes[positions[positions >= 0]]
+
+        # Name lookup once per distinct name, then spread to the rows by integer code
+        name_positions, names = pd.factorize(df[name_col])
+        per_name = np.array([name_codes.get(name, MISSING_CODE) for name in names] + [MISSING_CODE],
+                            dtype=np.int32)
+        by_name = per_name[name_positions]
+        unmatched = codes == MISSING_CODE
+        codes[unmatched] = by_name[unmatched]
+
+        code_columns[code_col] = codes
+
+    # Joined in one step; inserting columns one by one into a wide TrackMan frame is slow
+    df = df.drop(columns=list(code_columns), errors="ignore")
+    return pd.concat([df, pd.DataFrame(code_columns, index=df.index)], axis=1)
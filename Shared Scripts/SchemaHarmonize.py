@@ -0,0 +1,118 @@
+"""
+SchemaHarmonize.py
+------------------
+
+Maps the different TrackMan export flavors onto one canonical schema. Newer
+exports carry TaggedPitchType with full names ("Fastball", "Slider"), older and
+R-prepared exports carry a PitchType column with abbreviations ("FF", "SL", "CR").
+Everything is rewritten to full names in TaggedPitchType so no analysis has to
+re-map pitch types itself.
+"""
+
+import numpy as np
+import pandas as pd
+
+# Export flavors, detected from the column headers
+FULL_NAME_FLAVOR = "TaggedPitchType"
+ABBREVIATED_FLAVOR = "PitchType"
+
+# Column names used by other flavors (or mangled by R's read.csv) -> canonical names
+COLUMN_ALIASES = {
+    "PitchType": "TaggedPitchType",
+    "Top.Bottom": "Top/Bottom",
+}
+
+# Pitch type abbreviations and alternate spellings -> canonical full names
+# (follows the recode in PitchingReportVersion.R, where ST and two-seamers are sinkers)
+PITCH_TYPE_ALIASES = {
+    "FF": "Fastball",
+    "FA": "Fastball",
+    "FourSeamFastBall": "Fastball",
+    "Four-Seam": "Fastball",
+    "SL": "Slider",
+    "CR": "Curveball",
+    "CU": "Curveball",
+    "CB": "Curveball",
+    "CH": "Changeup",
+    "ChangeUp": "Changeup",
+    "SP": "Splitter",
+    "FS": "Splitter",
+    "CT": "Cutter",
+    "FC": "Cutter",
+    "ST": "Sinker",
+    "SI": "Sinker",
+    "TwoSeamFastBall": "Sinker",
+    "OneSeamFastBall": "Sinker",
+    "Two-Seam": "Sinker",
+    "KN": "Knuckleball",
+    "SW": "Sweeper",
+    "SV": "Slurve",
+    "FO": "Forkball",
+    "SC": "Screwball",
+}
+
+
+def detect_flavor(columns):
+    """
+    Detects the export flavor from the column headers.
+
+    Returns:
+        str or None: FULL_NAME_FLAVOR, ABBREVIATED_FLAVOR, or None if there is no pitch type column.
+    """
+    if FULL_NAME_FLAVOR in columns:
+        return FULL_NAME_FLAVOR
+    if ABBREVIATED_FLAVOR in columns:
+        return ABBREVIATED_FLAVOR
+    return None
+
+
+def alias_sources(columns):
+    """Returns the alias columns that would supply any of the given canonical columns."""
+    return [alias for alias, canonical in COLUMN_ALIASES.items() if canonical in columns]
+
+
+def map_values(series, lookup):
+    """
+    Replaces values using a lookup dict, leaving unknown values unchanged. The lookup
+    is applied once per distinct value and the rows are rebuilt from integer codes,
+    so the cost does not depend on how many rows share a value.
+
+    Parameters:
+        series (pd.Series): The values to map (any dtype, categoricals are fastest).
+        lookup (dict): Old value -> new value.
+
+    Returns:
+        pd.Series: A categorical Series with the mapped values.
+    """
+    codes, uniques = pd.factorize(series)
+    mapped = pd.Index([lookup.get(value, value) for value in uniques], dtype=object)
+
+    # Several old values can land on the same new value, so rebuild the (sorted) categories
+    categories = pd.Index(mapped.unique()).sort_values()
+    new_codes = categories.get_indexer(mapped)
+    row_codes = np.where(codes >= 0, new_codes[codes], -1)
+
+    return pd.Series(pd.Categorical.from_codes(row_codes, categories=categories),
+                     index=series.index, name=series.name)
+
+
+def harmonize(df):
+    """
+    Rewrites any supported export flavor into the canonical schema.
+
+    Parameters:
+        df (pd.DataFrame): TrackMan data as exported.
+
+    Returns:
+        pd.DataFrame: Data with canonical column names and full pitch type names.
+    """
+    # Rename alias columns only when the canonical column is not already there
+    renames = {alias: canonical for alias, canonical in COLUMN_ALIASES.items()
+               if alias in df.columns and canonical not in df.columns}
+    if renames:
+        df = df.rename(columns=renames)
+
+    if "TaggedPitchType" in df.columns:
+        df["TaggedPitchType"] = map_values(df["TaggedPitchType"], PITCH_TYPE_ALIASES)
+
+    return df
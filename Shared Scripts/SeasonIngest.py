@@ -0,0 +1,322 @@
+"""
+SeasonIngest.py
+---------------
+
+Incremental ingestion of TrackMan exports into the season store. A manifest of
+every source file (path, size, modified time, content hash) is kept next to the
+store so that re-running an ingest only reads new or changed files. New players
+are added to the store's player registry and every row gets integer player codes,
+a parsed PitchTime, its source file and the derived columns of EnrichedColumns.py
+(xwOBA, hit type, quadrant, swing flag...). A changed file replaces the rows it
+stored before. A file with the same content as one already ingested is only recorded
+as its duplicate; if the original later changes, the duplicate is ingested under its
+own name so its pitches stay in the store.
+"""
+
+import os
+import sys
+import json
+import argparse
+import pandas as pd
+
+from PlayerRegistry import PLAYER_COLUMNS, encode_players, update_registry
+from SchemaHarmonize import detect_flavor
+from EnrichedColumns import derived_metadata, enrich_frame, stale_columns, stored_fingerprints
+from TimeIndex import add_pitch_time
+from TrackmanFiles import file_hash, find_trackman_files, read_columns
+from SeasonStore import PARTITION_COLUMN, PARTITION_FILE, game_partition_dir, remove_game, write_game
+from TrackmanSchema import SOURCE_COLUMN, TIME_COLUMN, apply_schema, load_trackman
+
+MANIFEST_FILE = "_manifest.json"  # Leading underscore keeps it out of the Parquet dataset
+REGISTRY_FILE = "_players.csv"
+DEDUP_KEYS = ["GameUID", "PitchUID"]
+
+
+def load_manifest(store_dir):
+    """Loads the ingest manifest, or an empty one if the store is new."""
+    manifest_path = os.path.join(store_dir, MANIFEST_FILE)
+    if not os.path.exists(manifest_path):
+        return {"files": {}}
+
+    with open(manifest_path) as f:
+        return json.load(f)
+
+
+def save_manifest(manifest, store_dir):
+    """Writes the manifest atomically so an interrupted ingest never corrupts it."""
+    os.makedirs(store_dir, exist_ok=True)
+    manifest_path = os.path.join(store_dir, MANIFEST_FILE)
+    temp_path = manifest_path + ".tmp"
+    with open(temp_path, "w") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    os.replace(temp_path, manifest_path)
+
+
+def drop_duplicate_pitches(df):
+    """
+    Removes repeated pitches, keeping the last copy of each (GameUID, PitchUID).
+    Rows without a PitchUID cannot be matched and are always kept.
+    """
+    keys = [col for col in DEDUP_KEYS if col in df.columns]
+    if "PitchUID" not in keys:
+        return df
+
+    duplicated = df.duplicated(subset=keys, keep="last") & df["PitchUID"].notna()
+    return df[~duplicated]
+
+
+def registry_path(store_dir):
+    """Returns the player registry file of a season store."""
+    return os.path.join(store_dir, REGISTRY_FILE)
+
+
+def merge_into_store(df, store_dir, registry=None, source=None, replaced_games=()):
+    """
+    Merges rows into the store game by game. Only the partitions of the games
+    present in df (or in replaced_games) are read and rewritten. Stored rows that
+    came from source are replaced by the new ones, so pitches a changed file no
+    longer contains are dropped; only the new rows are enriched.
+
+    Parameters:
+        df (pd.DataFrame): Newly read TrackMan rows.
+        store_dir (str): Root folder of the season store.
+        registry (pd.DataFrame, optional): Player registry used to encode stored rows that have no player codes.
+        source (str, optional): File the rows were read from. Its previously stored rows are replaced.
+        replaced_games (iterable, optional): Games source was stored in before, so games it no
+                                             longer contains lose its rows too.
+
+    Returns:
+        list: The GameIDs that were written.
+    """
+    if PARTITION_COLUMN not in df.columns:
+        raise ValueError(f"Cannot store data without a '{PARTITION_COLUMN}' column.")
+
+    df = df.dropna(subset=[PARTITION_COLUMN])
+    if source is not None:
+        df = pd.concat([df.drop(columns=[SOURCE_COLUMN], errors="ignore"),
+                        pd.DataFrame({SOURCE_COLUMN: source}, index=df.index)], axis=1)
+
+    game_frames = {str(game_id): game_df for game_id, game_df in df.groupby(PARTITION_COLUMN, sort=False,
+                                                                            observed=True)}
+    for game_id in replaced_games:
+        game_frames.setdefault(str(game_id), df.iloc[:0])
+
+    written = []
+    for game_id, game_df in game_frames.items():
+        game_df, fingerprints = enrich_frame(drop_duplicate_pitches(game_df))
+        existing = read_stored_rows(store_dir, game_id, source, registry)
+
+        if existing is not None:
+            existing, existing_fingerprints = existing
+            # A column is only current for the game when both parts were computed with the same definitions
+            fingerprints = {name: fingerprint for name, fingerprint in fingerprints.items()
+                            if existing_fingerprints.get(name) == fingerprint}
+
+            # The newest copy of a pitch wins
+            existing[PARTITION_COLUMN] = game_id
+            game_df = drop_duplicate_pitches(apply_schema(pd.concat([existing, game_df], ignore_index=True)))
+
+        if game_df.empty:
+            # The changed file held the only rows of this game
+            remove_game(store_dir, game_id)
+            continue
+
+        write_game(game_df, store_dir, game_id, metadata=derived_metadata(fingerprints))
+        written.append(game_id)
+
+    return written
+
+
+def read_stored_rows(store_dir, game_id, source=None, registry=None):
+    """
+    Reads the rows already stored for a game, without the ones that came from source.
+    Derived columns whose definitions changed since the game was written are recomputed.
+
+    Returns:
+        tuple or None: (rows, fingerprints) of the kept rows, or None when the game is not stored
+                       or only held rows from source.
+    """
+    existing_path = os.path.join(game_partition_dir(store_dir, game_id), PARTITION_FILE)
+    if not os.path.exists(existing_path):
+        return None
+
+    # Rows stored before sources were recorded cannot be attributed and are kept
+    existing = pd.read_parquet(existing_path)
+    if source is not None and SOURCE_COLUMN in existing.columns:
+        existing = existing[existing[SOURCE_COLUMN] != source]
+    if existing.empty:
+        return None
+
+    # Rows stored before the time index existed do not have that column yet
+    if TIME_COLUMN not in existing.columns:
+        existing = add_pitch_time(existing)
+
+    # Rows stored before the registry existed have no player codes yet
+    if registry is not None and not all(code_col in existing.columns for _, _, code_col in PLAYER_COLUMNS):
+        existing = encode_players(existing, registry)
+
+    fingerprints = stored_fingerprints(store_dir, game_id)
+    stale = stale_columns(fingerprints)
+    if stale:
+        existing, updated = enrich_frame(existing, stale)
+        fingerprints = {**fingerprints, **updated}
+    return existing, fingerprints
+
+
+def ingest_file(path, store_dir, replaced_games=()):
+    """
+    Reads one TrackMan file and merges its rows into the store.
+
+    Parameters:
+        path (str): Absolute path of the TrackMan file.
+        store_dir (str): Root folder of the season store.
+        replaced_games (iterable, optional): Games the file was stored in before.
+
+    Returns:
+        tuple: (games, flavor)
+               - games (list): The GameIDs that were written.
+               - flavor (str): The detected export flavor.
+    """
+    # The loader maps older export flavors onto the canonical schema
+    flavor = detect_flavor(read_columns(path))
+    print(f"Ingesting {path} ({flavor or 'no pitch type'} export)...")
+    df = drop_duplicate_pitches(load_trackman(path))
+
+    # Parse the pitch times once here; derived columns are added game by game in merge_into_store
+    df = add_pitch_time(df)
+
+    # Register new players and attach their integer codes
+    registry = update_registry(df, registry_path(store_dir))
+    df = encode_players(df, registry)
+    # A changed file replaces the rows it stored before, including games it no longer has
+    games = merge_into_store(df, store_dir, registry, source=path, replaced_games=replaced_games)
+    return games, flavor
+
+
+def ingest_files(paths, store_dir):
+    """
+    Ingests TrackMan files (plain or compressed CSV, or Parquet) into the store, skipping files that were already ingested.
+
+    A file is skipped without being read when its size and modified time match the
+    manifest, and skipped after hashing when its content matches a file already
+    ingested (for example the same game saved under two names). Such a duplicate is
+    recorded with the original's games; when the original changes, the duplicates of
+    its old content are ingested under their own names.
+
+    Parameters:
+        paths (list): TrackMan files to ingest.
+        store_dir (str): Root folder of the season store.
+
+    Returns:
+        list: The GameIDs that were written during this run.
+    """
+    manifest = load_manifest(store_dir)
+    files = manifest["files"]
+    known_hashes = {entry["sha256"]: path for path, entry in files.items() if "duplicate_of" not in entry}
+
+    written = []
+    for path in paths:
+        abs_path = os.path.abspath(path)
+        stat = os.stat(abs_path)
+        entry = files.get(abs_path)
+
+        # Cheap check first: unchanged size and modified time means nothing to do
+        if entry and entry["size"] == stat.st_size and entry["mtime"] == stat.st_mtime:
+            continue
+
+        digest = file_hash(abs_path)
+        if known_hashes.get(digest) == abs_path:
+            # Touched but not changed
+            entry.update(size=stat.st_size, mtime=stat.st_mtime)
+            save_manifest(manifest, store_dir)
+            continue
+
+        if digest in known_hashes:
+            original = known_hashes[digest]
+            print(f"Skipping {path}: same content as {original}")
+            files[abs_path] = {"size": stat.st_size, "mtime": stat.st_mtime, "sha256": digest,
+                               "flavor": files[original].get("flavor"), "games": files[original]["games"],
+                               "duplicate_of": original}
+            save_manifest(manifest, store_dir)
+            continue
+
+        games, flavor = ingest_file(abs_path, store_dir, replaced_games=entry["games"] if entry else ())
+
+        # Record the file right away so an interrupted run keeps its progress
+        files[abs_path] = {"size": stat.st_size, "mtime": stat.st_mtime, "sha256": digest,
+                           "flavor": flavor, "games": games}
+        if entry and known_hashes.get(entry["sha256"]) == abs_path:
+            del known_hashes[entry["sha256"]]
+        known_hashes[digest] = abs_path
+        save_manifest(manifest, store_dir)
+        written.extend(games)
+
+        # Duplicates of this file's old content lost their pitches with its old rows
+        if entry:
+            written.extend(ingest_duplicates(abs_path, manifest, known_hashes, store_dir))
+
+    return written
+
+
+def ingest_duplicates(original, manifest, known_hashes, store_dir):
+    """
+    Ingests, under their own names, the files recorded as duplicates of a file whose
+    content changed. Of several files with the same content only the first is ingested
+    and the others become its duplicates. Duplicates no longer on disk are dropped from
+    the manifest.
+
+    Returns:
+        list: The GameIDs that were written.
+    """
+    files = manifest["files"]
+    written = []
+    for path in [path for path, entry in files.items() if entry.get("duplicate_of") == original]:
+        if not os.path.exists(path):
+            del files[path]
+            save_manifest(manifest, store_dir)
+            continue
+
+        stat = os.stat(path)
+        digest = file_hash(path)
+        if digest in known_hashes:
+            files[path] = {"size": stat.st_size, "mtime": stat.st_mtime, "sha256": digest,
+                           "flavor": files[known_hashes[digest]].get("flavor"),
+                           "games": files[known_hashes[digest]]["games"], "duplicate_of": known_hashes[digest]}
+            save_manifest(manifest, store_dir)
+            continue
+
+        games, flavor = ingest_file(path, store_dir)
+        files[path] = {"size": stat.st_size, "mtime": stat.st_mtime, "sha256": digest,
+                       "flavor": flavor, "games": games}
+        known_hashes[digest] = path
+        save_manifest(manifest, store_dir)
+        written.extend(games)
+
+    return written
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Ingest new or changed TrackMan files into a season store."
+    )
+    parser.add_argument("store_dir", help="Root folder of the season store")
+    parser.add_argument("inputs", nargs="+", help="TrackMan files (.csv, .csv.zst, .csv.gz, .parquet) or folders containing them")
+    args = parser.parse_args()
+
+    # Expand folders into the TrackMan files they contain
+    paths = []
+    for item in args.inputs:
+        if os.path.isdir(item):
+            paths.extend(find_trackman_files(item))
+        else:
+            paths.append(item)
+
+    if not paths:
+        sys.exit("No TrackMan files found to ingest.")
+
+    written = ingest_files(paths, args.store_dir)
+    print(f"Ingest complete. Games written: {', '.join(written) if written else 'none'}")
+
+
+if __name__ == "__main__":
+    main()
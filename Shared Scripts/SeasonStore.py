@@ -0,0 +1,206 @@
+"""
+SeasonStore.py
+--------------
+
+Columnar season store for TrackMan data. Each game is written as its own Parquet
+file under a GameID=<id> folder, so new games are appended without rewriting old
+ones and loads only read the columns and games they ask for. Rows inside a game
+are kept in pitch time order, so time ranges are contiguous slices.
+"""
+
+import os
+from urllib.parse import quote, unquote
+
+import pyarrow as pa
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+
+from TrackmanSchema import CATEGORY_COLUMNS, TIME_COLUMN, apply_schema
+
+PARTITION_COLUMN = "GameID"
+PARTITION_FILE = "part-0.parquet"
+PARTITIONING = ds.partitioning(pa.schema([(PARTITION_COLUMN, pa.string())]), flavor="hive")
+
+
+def game_partition_dir(store_dir, game_id):
+    """Returns the folder holding a single game's Parquet file."""
+    return os.path.join(store_dir, f"{PARTITION_COLUMN}={quote(str(game_id), safe='')}")
+
+
+def normalize_table(table):
+    """
+    Stores every text column as a plain string so that games with different
+    category sets (or none at all) share one schema. Parquet dictionary-encodes
+    the values on disk either way.
+    """
+    fields = []
+    for field in table.schema:
+        if pa.types.is_dictionary(field.type) or pa.types.is_large_string(field.type):
+            field = field.with_type(pa.string())
+        fields.append(field)
+    return table.cast(pa.schema(fields))
+
+
+def write_game(game_df, store_dir, game_id, metadata=None):
+    """
+    Writes (or replaces) one game's partition. Only this game's file is touched.
+
+    Parameters:
+        game_df (pd.DataFrame): Rows for a single game.
+        store_dir (str): Root folder of the season store.
+        game_id (str): The GameID the rows belong to.
+        metadata (dict, optional): Text key -> value pairs kept in the file's footer
+                                   (e.g. the derived column fingerprints of EnrichedColumns.py).
+
+    Returns:
+        str: Path to the written Parquet file.
+    """
+    partition_dir = game_partition_dir(store_dir, game_id)
+    os.makedirs(partition_dir, exist_ok=True)
+
+    # The GameID lives in the folder name, so it is not stored again in the file
+    game_df = apply_schema(game_df.drop(columns=[PARTITION_COLUMN], errors="ignore"))
+
+    # Stable sort, so pitches logged at the same instant keep their export order
+    if TIME_COLUMN in game_df.columns:
+        game_df = game_df.sort_values(TIME_COLUMN, kind="stable", ignore_index=True)
+    table = normalize_table(pa.Table.from_pandas(game_df, preserve_index=False))
+    if metadata:
+        table = table.replace_schema_metadata({**(table.schema.metadata or {}), **metadata})
+
+    # Write to a temporary file first so readers never see a half-written game
+    file_path = os.path.join(partition_dir, PARTITION_FILE)
+    temp_path = file_path + ".tmp"
+    pq.write_table(table, temp_path, compression="zstd")
+    os.replace(temp_path, file_path)
+
+    return file_path
+
+
+def append_game(df, store_dir):
+    """
+    Appends TrackMan rows to the store, one partition per GameID.
+
+    Parameters:
+        df (pd.DataFrame): TrackMan rows, possibly spanning several games.
+        store_dir (str): Root folder of the season store.
+
+    Returns:
+        list: The GameIDs that were written.
+    """
+    if PARTITION_COLUMN not in df.columns:
+        raise ValueError(f"Cannot store data without a '{PARTITION_COLUMN}' column.")
+
+    if df[PARTITION_COLUMN].isna().any():
+        raise ValueError(f"Found rows with a missing '{PARTITION_COLUMN}'.")
+
+    written = []
+    for game_id, game_df in df.groupby(PARTITION_COLUMN, sort=False, observed=True):
+        write_game(game_df, store_dir, game_id)
+        written.append(game_id)
+
+    return written
+
+
+def remove_game(store_dir, game_id):
+    """Deletes one game's partition from the store, if it exists."""
+    partition_dir = game_partition_dir(store_dir, game_id)
+    file_path = os.path.join(partition_dir, PARTITION_FILE)
+    if os.path.exists(file_path):
+        os.remove(file_path)
+    if os.path.isdir(partition_dir) and not os.listdir(partition_dir):
+        os.rmdir(partition_dir)
+
+
+def read_game_metadata(store_dir, game_id):
+    """Returns the metadata stored with one game, read from the file footer only."""
+    file_path = os.path.join(game_partition_dir(store_dir, game_id), PARTITION_FILE)
+    metadata = pq.read_schema(file_path).metadata or {}
+    return {key.decode(): value.decode() for key, value in metadata.items()}
+
+
+def list_games(store_dir):
+    """Returns the sorted GameIDs currently in the store."""
+    if not os.path.isdir(store_dir):
+        return []
+
+    prefix = f"{PARTITION_COLUMN}="
+    return sorted(
+        unquote(name[len(prefix):]) for name in os.listdir(store_dir)
+        if name.startswith(prefix) and os.path.exists(os.path.join(store_dir, name, PARTITION_FILE))
+    )
+
+
+def open_dataset(store_dir):
+    """
+    Opens the store as a pyarrow dataset. Game files exported at different times can
+    carry slightly different columns, so the footers are unified into one schema.
+    """
+    files = [os.path.join(game_partition_dir(store_dir, game_id), PARTITION_FILE)
+             for game_id in list_games(store_dir)]
+    if not files:
+        raise FileNotFoundError(f"No games found in season store {store_dir}")
+
+    schema = pa.unify_schemas([pq.read_schema(path) for path in files], promote_options="permissive")
+    schema = schema.append(pa.field(PARTITION_COLUMN, pa.string()))
+
+    # Categorical columns are decoded straight from the Parquet dictionary pages
+    category_columns = [col for col in CATEGORY_COLUMNS if col in schema.names]
+    for col in category_columns:
+        schema = schema.set(schema.get_field_index(col),
+                            pa.field(col, pa.dictionary(pa.int32(), pa.string())))
+    file_format = ds.ParquetFileFormat(read_options=ds.ParquetReadOptions(
+        dictionary_columns=category_columns))
+
+    return ds.dataset(files, schema=schema, format=file_format, partitioning=PARTITIONING,
+                      partition_base_dir=store_dir)
+
+
+def load_season(store_dir, columns=None, game_ids=None):
+    """
+    Loads data from the store, reading only the requested columns and games.
+
+    Parameters:
+        store_dir (str): Root folder of the season store.
+        columns (list, optional): Columns to read. Reads every column when omitted.
+        game_ids (list, optional): GameIDs to read. Reads every game when omitted.
+
+    Returns:
+        pd.DataFrame: The requested slice of the season.
+    """
+    dataset = open_dataset(store_dir)
+    table = dataset.to_table(**scan_options(dataset, columns, game_ids))
+    return apply_schema(table.to_pandas())
+
+
+def iter_season(store_dir, columns=None, game_ids=None, chunk_rows=250_000):
+    """
+    Reads the store in chunks of at most chunk_rows rows, typed like load_season.
+    Only one chunk is held in memory at a time.
+
+    Parameters:
+        store_dir (str): Root folder of the season store.
+        columns (list, optional): Columns to read. Reads every column when omitted.
+        game_ids (list, optional): GameIDs to read. Reads every game when omitted.
+        chunk_rows (int): Maximum number of rows per chunk.
+
+    Yields:
+        pd.DataFrame: The typed rows of the next chunk.
+    """
+    dataset = open_dataset(store_dir)
+    for batch in dataset.to_batches(batch_size=chunk_rows, **scan_options(dataset, columns, game_ids)):
+        if batch.num_rows:
+            yield apply_schema(batch.to_pandas())
+
+
+def scan_options(dataset, columns=None, game_ids=None):
+    """Returns the column projection and partition filter of a store read."""
+    # Partition filters are applied to the folder names, so skipped games are never opened
+    row_filter = None
+    if game_ids is not None:
+        row_filter = ds.field(PARTITION_COLUMN).isin([str(game_id) for game_id in game_ids])
+
+    if columns is not None:
+        columns = [col for col in columns if col in dataset.schema.names]
+
+    return {"columns": columns, "filter": row_filter}
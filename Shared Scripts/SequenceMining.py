@@ -0,0 +1,227 @@
+"""
+SequenceMining.py
+-----------------
+
+Mines pitch sequences (n-grams) within plate appearances. Every pitch becomes an
+integer token (its pitch type, optionally combined with its zone cell), and the
+n-gram ending at each pitch is kept as a rolling hash: the previous n-gram's key
+times the vocabulary size plus the new token. That is an exact base-V number, so
+keys never collide, and all lengths up to max_length are built with one vectorized
+step per length, linear in the number of pitches. Each n-gram is counted with the
+outcome of its last pitch, and the counts are indexed by pitcher so top-k queries
+are a slice and a sort.
+
+Example:
+    sequences = mine_sequences(df, max_length=4)
+    sequences.top_k('Schreier, Gaven', k=10, length=3, outcome='Whiff', min_count=5)
+"""
+
+import numpy as np
+import pandas as pd
+
+from BattedBall import classify_hardness, is_hard_hit
+from PitchTransitions import plate_appearance_order
+from ZoneBinning import MISSING_REGION, OUTSIDE_REGION, zone_grid_codes
+
+MAX_LENGTH = 4
+
+# Zone cells 0-8 of the 3x3 strike zone grid, then located outside it, then no location
+ZONE_LABELS = [str(cell) for cell in range(9)] + ["Out", "NoLoc"]
+
+# Terminal outcomes a sequence is counted with
+OUTCOME_LABELS = ["Whiff", "Weak Contact", "Hard Contact", "Contact", "Called Strike", "Foul", "Ball", "Other"]
+BALL_CALLS = ["BallCalled", "BallinDirt", "BallIntentional"]
+FOUL_CALLS = ["FoulBall", "FoulBallNotFieldable", "FoulBallFieldable"]
+
+# Keys are int64, so vocabulary_size ** max_length has to stay below this
+MAX_KEY = 2 ** 62
+
+
+def classify_outcomes(df):
+    """
+    Labels every pitch with one of OUTCOME_LABELS. Weak contact is a soft-hit ball in
+    play (BattedBall.classify_hardness) and hard contact a hard-hit one (is_hard_hit).
+
+    Parameters:
+        df (pd.DataFrame): TrackMan data with PitchCall and ExitSpeed.
+
+    Returns:
+        pd.Series: Ordered categorical outcomes aligned with df.
+    """
+    calls = df["PitchCall"]
+    in_play = (calls == "InPlay").to_numpy(dtype=bool, na_value=False)
+    soft = (classify_hardness(df["ExitSpeed"]) == "Soft Hit").to_numpy(dtype=bool, na_value=False)
+    hard = is_hard_hit(df["ExitSpeed"]).to_numpy()
+
+    conditions = [
+        (calls == "StrikeSwinging").to_numpy(dtype=bool, na_value=False),
+        in_play & soft,
+        in_play & hard,
+        in_play,
+        (calls == "StrikeCalled").to_numpy(dtype=bool, na_value=False),
+        calls.isin(FOUL_CALLS).to_numpy(dtype=bool, na_value=False),
+        calls.isin(BALL_CALLS).to_numpy(dtype=bool, na_value=False),
+    ]
+    codes = np.select(conditions, range(len(conditions)), default=len(OUTCOME_LABELS) - 1)
+    return pd.Series(pd.Categorical.from_codes(codes, categories=OUTCOME_LABELS, ordered=True),
+                     index=df.index, name="Outcome")
+
+
+def encode_pitches(df, pitch_column="TaggedPitchType", zones=False):
+    """
+    Turns every pitch into an integer token.
+
+    Parameters:
+        df (pd.DataFrame): TrackMan data.
+        pitch_column (str): Pitch type column.
+        zones (bool): Combine the pitch type with its 3x3 zone cell (needs PlateLocSide
+                      and PlateLocHeight).
+
+    Returns:
+        tuple: (tokens, vocabulary)
+               - tokens (np.ndarray): int64 token per pitch, -1 where the pitch type is missing.
+               - vocabulary (list): Label of each token.
+    """
+    type_codes, pitch_types = pd.factorize(df[pitch_column], sort=True)
+    type_codes = type_codes.astype(np.int64)
+    if not zones:
+        return type_codes, [str(pitch_type) for pitch_type in pitch_types]
+
+    cells = zone_grid_codes(df["PlateLocSide"], df["PlateLocHeight"]).astype(np.int64)
+    cells = np.where(cells == OUTSIDE_REGION, 9, np.where(cells == MISSING_REGION, 10, cells))
+
+    tokens = np.where(type_codes >= 0, type_codes * len(ZONE_LABELS) + cells, -1)
+    vocabulary = [f"{pitch_type}@{zone}" for pitch_type in pitch_types for zone in ZONE_LABELS]
+    return tokens, vocabulary
+
+
+class SequenceCounts:
+    """Sequence counts per pitcher, length and sequence, with one column per terminal outcome."""
+
+    def __init__(self, table, vocabulary):
+        self.table = table  # Indexed (Pitcher, Length, Key), sorted; outcome columns then Total
+        self.vocabulary = vocabulary
+        self.outcomes = [col for col in table.columns if col != "Total"]
+
+    def decode(self, lengths, keys):
+        """Turns (length, key) pairs back into "Fastball > Slider > ..." labels."""
+        base = len(self.vocabulary)
+        labels = []
+        for length, key in zip(lengths, keys):
+            tokens = [(int(key) // base ** power) % base for power in range(int(length) - 1, -1, -1)]
+            labels.append(" > ".join(self.vocabulary[token] for token in tokens))
+        return labels
+
+    def pitcher_rows(self, pitcher, length=None):
+        """Returns one pitcher's counts (optionally for one sequence length) by Length and Key."""
+        try:
+            rows = self.table.loc[pitcher]
+        except KeyError:
+            rows = self.table.iloc[:0].droplevel("Pitcher")
+        if length is not None:
+            rows = rows[rows.index.get_level_values("Length") == length]
+        return rows.reset_index()
+
+    def with_sequences(self, rows):
+        """Replaces the Key column of pitcher_rows output with readable sequences."""
+        sequences = pd.Series(self.decode(rows["Length"], rows["Key"]), index=rows.index, name="Sequence")
+        return pd.concat([sequences, rows.drop(columns=["Key"])], axis=1)
+
+    def pitcher_table(self, pitcher, length=None):
+        """Returns one pitcher's counts (optionally for one sequence length) with readable sequences."""
+        return self.with_sequences(self.pitcher_rows(pitcher, length))
+
+    def top_k(self, pitcher, k=10, length=None, outcome=None, min_count=1):
+        """
+        Returns a pitcher's top sequences.
+
+        Parameters:
+            pitcher: The pitcher.
+            k (int): Number of sequences.
+            length (int, optional): Only sequences of this many pitches.
+            outcome (str, optional): Rank by how often the sequence ends in this outcome
+                                     (e.g. "Whiff"); by default rank by how often it was thrown.
+            min_count (int): Only sequences thrown at least this many times.
+
+        Returns:
+            pd.DataFrame: Sequence, Length, the outcome counts, Total (and Rate % for an outcome).
+        """
+        rows = self.pitcher_rows(pitcher, length)
+        rows = rows[rows["Total"] >= min_count]
+
+        # Only the k sequences returned are decoded
+        if outcome is None:
+            rows = rows.sort_values(["Total", "Length"], ascending=[False, True], kind="stable")
+        elif outcome not in self.outcomes:
+            raise ValueError(f"Unknown outcome '{outcome}'. Choose from {self.outcomes}.")
+        else:
+            rows = rows.assign(**{"Rate %": rows[outcome] / rows["Total"] * 100})
+            rows = rows.sort_values(["Rate %", outcome], ascending=False, kind="stable")
+        return self.with_sequences(rows.head(k))
+
+
+def mine_sequences(df, max_length=MAX_LENGTH, by="Pitcher", pitch_column="TaggedPitchType", zones=False,
+                   outcomes=None):
+    """
+    Counts every sequence of 1 to max_length consecutive pitches within a plate
+    appearance, for every pitcher, with the outcome of its last pitch.
+
+    Parameters:
+        df (pd.DataFrame): TrackMan data with the plate appearance columns of PitchTransitions.
+        max_length (int): Longest sequence counted.
+        by (str): Pitcher column; a pitching change starts a new sequence.
+        pitch_column (str): Pitch type column.
+        zones (bool): Include each pitch's zone cell in its token.
+        outcomes (pd.Series, optional): Outcome of each pitch (default: classify_outcomes(df)).
+
+    Returns:
+        SequenceCounts: The counts.
+    """
+    tokens, vocabulary = encode_pitches(df, pitch_column, zones)
+    if len(vocabulary) ** max_length >= MAX_KEY:
+        raise ValueError(f"{len(vocabulary)} tokens are too many for sequences of {max_length} pitches.")
+
+    outcomes = classify_outcomes(df) if outcomes is None else outcomes
+    if isinstance(outcomes.dtype, pd.CategoricalDtype):
+        # Every category gets a column, even if no sequence ends in it
+        outcome_codes, outcome_labels = outcomes.cat.codes.to_numpy(), outcomes.cat.categories
+    else:
+        outcome_codes, outcome_labels = pd.factorize(outcomes, sort=True)
+    pitcher_codes, pitchers = pd.factorize(df[by])
+
+    # Plate appearance order; follows marks pitches with a previous pitch in the same plate appearance
+    order, follows = plate_appearance_order(df, by)
+    tokens, outcome_codes, pitcher_codes = tokens[order], outcome_codes[order], pitcher_codes[order]
+
+    has_token = tokens >= 0
+    countable = has_token & (outcome_codes >= 0) & (pitcher_codes >= 0)
+    base = len(vocabulary)
+
+    # Length-1 sequences are the tokens; each longer key extends the key ending at the previous pitch
+    keys, complete = np.where(has_token, tokens, 0), has_token
+    parts = []
+    for length in range(1, max_length + 1):
+        if length > 1:
+            longer_keys = np.zeros_like(keys)
+            longer_keys[1:] = keys[:-1] * base + tokens[1:]
+            longer = np.zeros_like(complete)
+            longer[1:] = complete[:-1] & follows[1:] & has_token[1:]
+            keys, complete = longer_keys, longer
+
+        selected = complete & countable
+        parts.append(pd.DataFrame({
+            "Pitcher": pitcher_codes[selected],
+            "Length": np.full(np.count_nonzero(selected), length, dtype=np.int8),
+            "Key": keys[selected],
+            "Outcome": outcome_codes[selected],
+        }))
+
+    # One hashed groupby over every sequence of every length
+    counts = pd.concat(parts, ignore_index=True).groupby(["Pitcher", "Length", "Key", "Outcome"]).size()
+    table = counts.unstack("Outcome", fill_value=0).reindex(columns=range(len(outcome_labels)), fill_value=0)
+    table.columns = [str(label) for label in outcome_labels]
+    table["Total"] = table.sum(axis=1)
+
+    # Pitcher names instead of codes, sorted so a pitcher's rows are one slice
+    table.index = table.index.set_levels(pd.Index(pitchers)[table.index.levels[0].to_numpy()], level="Pitcher")
+    return SequenceCounts(table.sort_index(), vocabulary)
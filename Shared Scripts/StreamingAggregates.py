@@ -0,0 +1,220 @@
+"""
+StreamingAggregates.py
+----------------------
+
+Grouped aggregates over TrackMan files (or season stores) that are too large to load
+at once. The data is read in bounded chunks and each chunk is folded into partial
+aggregates (count, sum, sum of squares, min, max per group). Each chunk's partials are
+merged into running totals as soon as the chunk is done; partials merge exactly, so the
+result does not depend on the chunk size and peak memory is one chunk plus one row per
+group. Groups come out in the order an in-memory groupby of the whole data would give them.
+"""
+
+import os
+import numpy as np
+import pandas as pd
+
+from GroupedMetrics import HIT_SPLIT_METRICS, indicator_columns, metric_table
+from SeasonStore import iter_season
+from TrackmanSchema import iter_trackman
+
+DEFAULT_CHUNK_ROWS = 250_000
+
+# How each partial statistic combines across chunks
+MERGE_RULES = {
+    "count": "sum",
+    "sum": "sum",
+    "sumsq": "sum",
+    "min": "min",
+    "max": "max",
+}
+
+# Columns needed to build the hit-type indicators below; the HardHit and HitType columns
+# stored at ingest are read when the store has them
+HIT_PERCENTAGE_COLUMNS = ["PitchCall", "ExitSpeed", "Angle", "HardHit", "HitType"]
+HIT_INDICATORS = ["InPlay", "HardHit", "GroundBall", "PopUp"]
+
+
+def partial_aggregate(chunk, keys, values):
+    """
+    Computes the partial aggregates of one chunk.
+
+    Parameters:
+        chunk (pd.DataFrame): The rows to aggregate.
+        keys (list): Columns to group by.
+        values (list): Numeric or boolean columns to aggregate.
+
+    Returns:
+        pd.DataFrame: One row per group, columns (statistic, value column).
+    """
+    numbers = chunk[values].astype("float64")
+    grouped = numbers.groupby([chunk[key] for key in keys], observed=True, sort=False)
+    partial = pd.concat({
+        "count": grouped.count(),
+        "sum": grouped.sum(),
+        "sumsq": (numbers ** 2).groupby([chunk[key] for key in keys], observed=True, sort=False).sum(),
+        "min": grouped.min(),
+        "max": grouped.max(),
+    }, axis=1)
+
+    # Each chunk has its own category set, so keys are kept as plain values for merging
+    key_values = partial.index.to_frame(index=False).astype(object)
+    if len(keys) > 1:
+        partial.index = pd.MultiIndex.from_frame(key_values)
+    else:
+        partial.index = pd.Index(key_values.iloc[:, 0])
+    return partial
+
+
+def record_levels(chunk, keys, levels):
+    """Adds the values of each key column in chunk to levels (key -> pd.Index in first-appearance order)."""
+    for key in keys:
+        column = chunk[key]
+        values = column.cat.categories if isinstance(column.dtype, pd.CategoricalDtype) else pd.Index(column.dropna().unique())
+        levels[key] = values if key not in levels else levels[key].append(values).unique()
+
+
+def order_groups(totals, keys, levels, sort_levels):
+    """
+    Puts merged aggregates in the order grouped_metrics gives for the whole data: by the
+    key categories, which are sorted for a CSV read and in first-appearance order for a
+    season store.
+
+    Parameters:
+        totals (pd.DataFrame): Merged partial aggregates indexed by plain key values.
+        keys (list): The key columns.
+        levels (dict): Key -> values in first-appearance order (from record_levels).
+        sort_levels (bool): Whether the categories are sorted rather than kept in appearance order.
+
+    Returns:
+        pd.DataFrame: totals with a categorical index in group order.
+    """
+    key_values = totals.index.to_frame(index=False)
+    ordered = {}
+    for key in keys:
+        categories = levels[key].sort_values() if sort_levels else levels[key]
+        ordered[key] = pd.Categorical(key_values[key], categories=categories)
+
+    positions = np.lexsort([ordered[key].codes for key in reversed(keys)])
+    if len(keys) > 1:
+        index = pd.MultiIndex.from_arrays([ordered[key][positions] for key in keys], names=keys)
+    else:
+        index = pd.CategoricalIndex(ordered[keys[0]][positions], name=keys[0])
+    return totals.iloc[positions].set_axis(index)
+
+
+def merge_partials(partials):
+    """Combines partial aggregates of the same keys and values into one."""
+    combined = pd.concat(partials)
+    levels = list(range(combined.index.nlevels)) if combined.index.nlevels > 1 else 0
+    return pd.concat({
+        stat: combined[stat].groupby(level=levels, sort=False).agg(how)
+        for stat, how in MERGE_RULES.items()
+    }, axis=1)
+
+
+def stream_aggregate(path, groupings, values, prepare=None, columns=None,
+                     chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Aggregates a TrackMan file or season store chunk by chunk, for several groupings in one pass.
+
+    Parameters:
+        path (str): Path to the TrackMan file, or the root folder of a season store.
+        groupings (dict): Name -> list of key columns, e.g. {'Pitcher': ['Pitcher', 'TaggedPitchType']}.
+        values (list): Columns to aggregate (after prepare has run).
+        prepare (callable, optional): Applied to each chunk first, e.g. to add indicator columns.
+        columns (list, optional): Columns to read.
+        chunk_rows (int): Maximum number of rows held in memory at a time.
+
+    Returns:
+        dict: Name -> merged partial aggregates, in the order of an in-memory groupby.
+    """
+    running = dict.fromkeys(groupings)
+    levels = {name: {} for name in groupings}
+
+    # read_csv sorts the categories it infers; the store keeps its dictionary order
+    from_store = os.path.isdir(path)
+    if from_store:
+        chunks = iter_season(path, columns=columns, chunk_rows=chunk_rows)
+    else:
+        chunks = iter_trackman(path, columns=columns, chunk_rows=chunk_rows)
+
+    for chunk in chunks:
+        if prepare is not None:
+            chunk = prepare(chunk)
+
+        for name, keys in groupings.items():
+            partial = partial_aggregate(chunk, keys, values)
+            running[name] = partial if running[name] is None else merge_partials([running[name], partial])
+            record_levels(chunk, keys, levels[name])
+
+    totals = {}
+    for name, keys in groupings.items():
+        if running[name] is None:
+            raise ValueError(f"No rows found in {path}")
+        merged = running[name]
+        merged.index.names = keys
+        totals[name] = order_groups(merged, keys, levels[name], sort_levels=not from_store)
+
+    return totals
+
+
+def summarize(totals):
+    """
+    Turns merged partial aggregates into final statistics.
+
+    Returns:
+        pd.DataFrame: count, sum, mean, std (sample), min and max for each value column.
+    """
+    count = totals["count"]
+    mean = totals["sum"] / count.where(count > 0)
+    variance = (totals["sumsq"] - totals["sum"] * mean) / (count - 1).where(count > 1)
+
+    return pd.concat({
+        "count": count,
+        "sum": totals["sum"],
+        "mean": mean,
+        "std": np.sqrt(variance.clip(lower=0)),
+        "min": totals["min"],
+        "max": totals["max"],
+    }, axis=1)
+
+
+def add_hit_indicators(chunk):
+    """
+    Adds the per-pitch indicators behind the hard-hit and hit-type breakdowns, using
+    the shared GroupedMetrics definitions. They replace the stored HardHit flag (which
+    counts every pitch, not only balls in play) once it has been read.
+    """
+    indicators = indicator_columns(chunk, HIT_INDICATORS)
+    return pd.concat([chunk.drop(columns=HIT_INDICATORS, errors="ignore"), indicators], axis=1)
+
+
+def hit_percentages(totals, empty_value=0):
+    """
+    Builds the HardHit% / GroundBall% / PopUp% table from merged hit-indicator aggregates,
+    in the same layout the grouped apply version writes.
+
+    Parameters:
+        totals (pd.DataFrame): Output of stream_aggregate for the HIT_INDICATORS values.
+        empty_value: Percentage reported for groups without a ball in play (0 or None).
+
+    Returns:
+        pd.DataFrame: One row per group with the key columns first.
+    """
+    return metric_table(totals["sum"], HIT_SPLIT_METRICS, empty_value)
+
+
+def stream_hit_percentages(path, roles=("Pitcher", "Batter"), by="TaggedPitchType", empty_value=0,
+                           chunk_rows=DEFAULT_CHUNK_ROWS):
+    """
+    Streams the hit-type breakdown for each role in a single pass over the file (or store).
+
+    Returns:
+        dict: Role -> hit percentage table grouped by [role, by].
+    """
+    groupings = {role: [role, by] for role in roles}
+    columns = list(dict.fromkeys(list(roles) + [by] + HIT_PERCENTAGE_COLUMNS))
+    totals = stream_aggregate(path, groupings, HIT_INDICATORS, prepare=add_hit_indicators,
+                              columns=columns, chunk_rows=chunk_rows)
+    return {role: hit_percentages(totals[role], empty_value) for role in roles}
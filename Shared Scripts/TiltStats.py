@@ -0,0 +1,137 @@
+"""
+TiltStats.py
+------------
+
+Circular statistics for spin tilt. Tilt is a clock reading ("1:45", or "01:45:00" in
+some exports), so averages and ranges have to wrap at 12:00: 11:45 and 12:15 are 30
+minutes apart, not 11.5 hours. parse_tilt turns a whole Tilt column into integer
+minutes on the clock once, and tilt_stats computes the mean, spread and covering arc
+of every group in one grouped pass.
+
+Example:
+    stats = tilt_stats(df['Tilt'], [df['Pitcher'], df['TaggedPitchType']])
+"""
+
+import numpy as np
+import pandas as pd
+
+CLOCK_MINUTES = 12 * 60  # One turn of the clock
+TILT_ROUNDING = 15  # Average tilts are reported to the nearest 15 minutes
+MISSING_TILT = -1  # parse_tilt value of a missing or unreadable tilt
+
+
+def parse_tilt(tilt):
+    """
+    Converts tilt readings (H:MM, HH:MM or HH:MM:SS) to minutes on the clock, with
+    12:00 as 0. Seconds are ignored.
+
+    Parameters:
+        tilt (pd.Series or array-like): Tilt readings.
+
+    Returns:
+        np.ndarray: int16 minutes (0-719), MISSING_TILT where a reading is missing or invalid.
+    """
+    parts = pd.Series(tilt).astype("string").str.extract(r"^\s*(\d{1,2}):(\d{2})")
+    hours = pd.to_numeric(parts[0], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+    minutes = pd.to_numeric(parts[1], errors="coerce").to_numpy(dtype="float64", na_value=np.nan)
+
+    total = (hours * 60 + minutes) % CLOCK_MINUTES  # 12:XX -> 0:XX
+    return np.where(np.isnan(total), MISSING_TILT, total).astype(np.int16)
+
+
+def format_tilt(minutes):
+    """
+    Converts minutes on the clock back to H:MM tilt readings (0 is 12:00).
+
+    Parameters:
+        minutes (pd.Series or array-like): Minutes; missing or negative values stay missing.
+
+    Returns:
+        pd.Series: Tilt readings as strings.
+    """
+    index = minutes.index if isinstance(minutes, pd.Series) else None
+    minutes = pd.Series(np.asarray(minutes, dtype="float64"), index=index)
+    valid = minutes >= 0
+
+    whole = minutes.where(valid, 0).round().astype("int64") % CLOCK_MINUTES
+    hours = (whole // 60).replace(0, 12)
+    readings = hours.astype("string") + ":" + (whole % 60).astype("string").str.zfill(2)
+    return readings.where(valid)
+
+
+def clock_degrees(minutes):
+    """Converts minutes on the clock to degrees clockwise from 12:00."""
+    return np.asarray(minutes, dtype="float64") * 360 / CLOCK_MINUTES
+
+
+def tilt_stats(tilt, keys, rounding=TILT_ROUNDING):
+    """
+    Computes circular tilt statistics for every group in one pass.
+
+    The mean is the direction of the summed unit vectors, rounded to `rounding` minutes.
+    The spread is the circular standard deviation. The arc is the shortest clockwise arc
+    covering every tilt of the group, found by leaving out the largest gap between
+    neighbouring tilts, so a group spread across 12:00 gets an arc through 12:00.
+
+    Parameters:
+        tilt (pd.Series): Tilt readings, or minutes already parsed with parse_tilt.
+        keys (list): Grouping Series aligned with tilt (e.g. [df['Pitcher'], df['TaggedPitchType']]).
+        rounding (int): Minutes the mean tilt is rounded to.
+
+    Returns:
+        pd.DataFrame: One row per group with a tilt, indexed by the keys, with columns
+                      Count, Tilt (mean as H:MM), MeanMinutes, Spread (minutes),
+                      ArcStart, ArcEnd and ArcWidth (minutes, clockwise from ArcStart).
+    """
+    if pd.api.types.is_numeric_dtype(tilt):
+        minutes = tilt.to_numpy(dtype="float64", na_value=np.nan)
+        minutes = np.where(np.isnan(minutes), MISSING_TILT, minutes)
+    else:
+        minutes = parse_tilt(tilt)
+
+    valid = minutes >= 0
+    minutes = minutes[valid].astype("float64")
+    angles = np.deg2rad(clock_degrees(minutes))
+    parts = pd.DataFrame({"Count": 1, "Cos": np.cos(angles), "Sin": np.sin(angles)})
+
+    grouped = parts.groupby([pd.Series(key.to_numpy()[valid], name=key.name) for key in keys], observed=True)
+    sums = grouped.sum()
+
+    # Tilts whose group key is missing are left out, as groupby leaves them out of the sums
+    codes = grouped.ngroup()
+    in_group = (codes.notna() & (codes >= 0)).to_numpy()
+    minutes, codes = minutes[in_group], codes[in_group].to_numpy(dtype="int64")
+
+    # Circular mean and spread from the resultant vector
+    mean_angle = np.arctan2(sums["Sin"], sums["Cos"]) % (2 * np.pi)
+    # Floating-point noise is dropped first so a mean exactly between two steps rounds consistently (to even)
+    exact_minutes = np.round(mean_angle * CLOCK_MINUTES / (2 * np.pi), 6)
+    mean_minutes = (np.round(exact_minutes / rounding) * rounding) % CLOCK_MINUTES
+    resultant = (np.hypot(sums["Sin"], sums["Cos"]) / sums["Count"]).clip(upper=1.0)
+    spread = np.sqrt(-2 * np.log(resultant)) * CLOCK_MINUTES / (2 * np.pi)
+
+    # Sort each group's tilts around the clock; the gap before a tilt is the distance from
+    # the previous one, and the first tilt's gap wraps around from the group's last tilt
+    order = np.lexsort((minutes, codes))
+    sorted_minutes, sorted_codes = minutes[order], codes[order]
+    first = np.ones(len(order), dtype=bool)
+    first[1:] = sorted_codes[1:] != sorted_codes[:-1]
+    last = np.roll(first, -1)
+
+    gaps = np.diff(sorted_minutes, prepend=np.nan)
+    gaps[first] = sorted_minutes[first] + CLOCK_MINUTES - sorted_minutes[last]
+
+    # The arc starts after the largest gap and covers everything else
+    widest = pd.Series(gaps).groupby(sorted_codes).idxmax().to_numpy()
+    arc_start = sorted_minutes[widest]
+    arc_width = CLOCK_MINUTES - gaps[widest]
+
+    return pd.DataFrame({
+        "Count": sums["Count"],
+        "Tilt": format_tilt(mean_minutes),
+        "MeanMinutes": mean_minutes,
+        "Spread": spread,
+        "ArcStart": arc_start,
+        "ArcEnd": (arc_start + arc_width) % CLOCK_MINUTES,
+        "ArcWidth": arc_width,
+    }, index=sums.index)
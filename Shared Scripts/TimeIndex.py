@@ -0,0 +1,188 @@
+"""
+TimeIndex.py
+------------
+
+Pitch time index for the season store. Date and Time are parsed once at ingest into
+an int64 PitchTime column (nanoseconds, TrackMan's local clock), and every game is
+stored sorted by it. Date-range questions ("last 14 days", "since Mar 1") then pick
+the games from the time range in each Parquet footer and cut the rows with a binary
+search, without scanning or re-parsing any date strings.
+
+Example:
+    recent = last_days(store_dir, 14, columns=["Pitcher", "TaggedPitchType", "RelSpeed"])
+    march = between(store_dir, "2025-03-01", "2025-04-01")
+"""
+
+import os
+import numpy as np
+import pandas as pd
+import pyarrow.parquet as pq
+
+from SeasonStore import PARTITION_COLUMN, PARTITION_FILE, game_partition_dir, list_games, load_season
+from TrackmanSchema import TIME_COLUMN
+
+# Rows without a readable time sort first and never fall inside a range
+MISSING_TIME = np.iinfo(np.int64).min
+
+
+def parse_pitch_time(df):
+    """
+    Parses the pitch times of df into int64 nanoseconds. Uses Date and Time when the
+    export has them, and UTCDateTime otherwise.
+
+    Parameters:
+        df (pd.DataFrame): TrackMan data.
+
+    Returns:
+        np.ndarray: int64 times, MISSING_TIME where no time could be read.
+    """
+    if "Date" in df.columns and "Time" in df.columns:
+        text = df["Date"].astype("string") + " " + df["Time"].astype("string")
+    elif "UTCDateTime" in df.columns:
+        text = df["UTCDateTime"].astype("string")
+    else:
+        return np.full(len(df), MISSING_TIME, dtype=np.int64)
+
+    # ISO dates parse in one vectorized pass; other layouts (e.g. 4/8/2025) fall back per value.
+    # Offsets such as the Z of UTCDateTime are converted to UTC; times without one are kept as they are
+    parsed = pd.to_datetime(text, format="ISO8601", errors="coerce", utc=True)
+    retry = parsed.isna() & text.notna()
+    if retry.any():
+        parsed[retry] = pd.to_datetime(text[retry], format="mixed", errors="coerce", utc=True)
+
+    # NaT is already int64 min, which is MISSING_TIME
+    return parsed.dt.tz_localize(None).astype("datetime64[ns]").to_numpy().view(np.int64)
+
+
+def add_pitch_time(df):
+    """Returns df with its PitchTime column (re)computed from the date and time columns."""
+    times = pd.DataFrame({TIME_COLUMN: parse_pitch_time(df)}, index=df.index)
+
+    # Joined in one step; inserting a column into a wide TrackMan frame is slow
+    return pd.concat([df.drop(columns=[TIME_COLUMN], errors="ignore"), times], axis=1)
+
+
+def to_nanos(value):
+    """Converts a date, date string or Timestamp to int64 nanoseconds."""
+    return pd.Timestamp(value).as_unit("ns").value
+
+
+def sort_by_time(df):
+    """Stably sorts rows by PitchTime (the order time_slice expects)."""
+    return df.sort_values(TIME_COLUMN, kind="stable", ignore_index=True)
+
+
+def time_slice(df, start=None, end=None):
+    """
+    Returns the rows with start <= PitchTime < end from a frame sorted by PitchTime.
+    Both bounds are found by binary search and the result is a slice, not a filter.
+
+    Parameters:
+        df (pd.DataFrame): Rows sorted by PitchTime.
+        start (optional): First time included (date, string or Timestamp). Open when omitted.
+        end (optional): First time excluded. Open when omitted.
+
+    Returns:
+        pd.DataFrame: The contiguous rows inside the range.
+    """
+    times = df[TIME_COLUMN].to_numpy()
+    first = np.searchsorted(times, to_nanos(start), side="left") if start is not None \
+        else np.searchsorted(times, MISSING_TIME, side="right")
+    last = np.searchsorted(times, to_nanos(end), side="left") if end is not None else len(times)
+    return df.iloc[first:max(first, last)]
+
+
+def game_time_ranges(store_dir):
+    """
+    Reads the first and last PitchTime of every game from the Parquet footers
+    (no rows are read). Games stored without PitchTime are left out, and games with
+    rows missing a time read only their PitchTime column to find the first real time.
+
+    Parameters:
+        store_dir (str): Root folder of the season store.
+
+    Returns:
+        pd.DataFrame: GameID, Start and End (int64 nanoseconds), sorted by Start.
+    """
+    records = []
+    for game_id in list_games(store_dir):
+        path = os.path.join(game_partition_dir(store_dir, game_id), PARTITION_FILE)
+        metadata = pq.read_metadata(path)
+        names = metadata.schema.names
+        if TIME_COLUMN not in names or metadata.num_rows == 0:
+            continue
+
+        col = names.index(TIME_COLUMN)
+        stats = [metadata.row_group(i).column(col).statistics for i in range(metadata.num_row_groups)]
+        first, last = min(s.min for s in stats), max(s.max for s in stats)
+        if first == MISSING_TIME:
+            times = pq.read_table(path, columns=[TIME_COLUMN])[TIME_COLUMN].to_numpy()
+            times = times[times != MISSING_TIME]
+            if len(times) == 0:
+                continue
+            first = times.min()
+
+        records.append((game_id, first, last))
+
+    ranges = pd.DataFrame(records, columns=[PARTITION_COLUMN, "Start", "End"]).astype(
+        {"Start": "int64", "End": "int64"})
+    return ranges.sort_values("Start", kind="stable", ignore_index=True)
+
+
+def between(store_dir, start=None, end=None, columns=None):
+    """
+    Loads the pitches with start <= PitchTime < end from the season store. Only games
+    whose time range overlaps the request are read.
+
+    Parameters:
+        store_dir (str): Root folder of the season store.
+        start (optional): First time included (date, string or Timestamp). Open when omitted.
+        end (optional): First time excluded. Open when omitted.
+        columns (list, optional): Columns to read. Reads every column when omitted.
+
+    Returns:
+        pd.DataFrame: The pitches in the range, in time order.
+    """
+    ranges = game_time_ranges(store_dir)
+
+    # Games are ordered by start time, so the ones starting before the end are a prefix
+    stop = np.searchsorted(ranges["Start"].to_numpy(), to_nanos(end), side="left") if end is not None \
+        else len(ranges)
+    candidates = ranges.iloc[:stop]
+    if start is not None:
+        candidates = candidates[candidates["End"].to_numpy() >= to_nanos(start)]
+
+    read_columns = None if columns is None else list(dict.fromkeys(list(columns) + [TIME_COLUMN]))
+    df = load_season(store_dir, columns=read_columns, game_ids=list(candidates[PARTITION_COLUMN]))
+
+    # Each game is already sorted, so this only interleaves games that overlap in time
+    rows = time_slice(sort_by_time(df), start, end)
+    if columns is not None and TIME_COLUMN not in columns:
+        rows = rows.drop(columns=[TIME_COLUMN])
+    return rows
+
+
+def since(store_dir, start, columns=None):
+    """Loads every pitch from start (inclusive) onward, e.g. since(store_dir, "2025-03-01")."""
+    return between(store_dir, start=start, columns=columns)
+
+
+def last_days(store_dir, days, columns=None):
+    """
+    Loads the pitches of the last `days` calendar days of the season store, counting
+    the day of the latest stored pitch as the first day.
+
+    Parameters:
+        store_dir (str): Root folder of the season store.
+        days (int): Number of calendar days.
+        columns (list, optional): Columns to read. Reads every column when omitted.
+
+    Returns:
+        pd.DataFrame: The pitches in those days, in time order.
+    """
+    ranges = game_time_ranges(store_dir)
+    if ranges.empty:
+        return between(store_dir, columns=columns)
+
+    latest_day = pd.Timestamp(int(ranges["End"].max())).normalize()
+    return between(store_dir, start=latest_day - pd.Timedelta(days=days - 1), columns=columns)
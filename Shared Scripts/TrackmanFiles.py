@@ -0,0 +1,83 @@
+"""
+TrackmanFiles.py
+----------------
+
+File formats for raw TrackMan data, chosen by extension: plain CSV (.csv),
+compressed CSV (.csv.zst, .csv.gz) and columnar Parquet (.parquet). Compressed
+files are streamed through pyarrow's codecs, so they read and write like plain
+CSVs and only the compressed bytes ever move off the disk.
+"""
+
+import os
+import glob
+import hashlib
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+CSV_EXTENSIONS = (".csv", ".csv.zst", ".csv.gz")
+PARQUET_EXTENSIONS = (".parquet",)
+TRACKMAN_EXTENSIONS = CSV_EXTENSIONS + PARQUET_EXTENSIONS
+
+
+def is_parquet_file(path):
+    """Checks whether a path points to a Parquet file."""
+    return path.lower().endswith(PARQUET_EXTENSIONS)
+
+
+def is_trackman_file(path):
+    """Checks whether a path has one of the TrackMan data extensions."""
+    return path.lower().endswith(TRACKMAN_EXTENSIONS)
+
+
+def trackman_patterns():
+    """Returns glob patterns matching every TrackMan data extension."""
+    return ["*" + ext for ext in TRACKMAN_EXTENSIONS]
+
+
+def find_trackman_files(folder):
+    """Returns the TrackMan data files in a folder, sorted by path."""
+    paths = set()
+    for pattern in trackman_patterns():
+        paths.update(glob.glob(os.path.join(folder, pattern)))
+    return sorted(paths)
+
+
+def file_hash(path, chunk_size=1 << 20):
+    """Returns the SHA-256 hex digest of a file, read in fixed-size chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(chunk_size), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def open_input(path):
+    """Opens a CSV for reading, decompressing on the fly when the extension says so."""
+    return pa.input_stream(path, compression="detect")
+
+
+def open_output(path):
+    """Opens a CSV for writing, compressing on the fly when the extension says so."""
+    return pa.output_stream(path, compression="detect")
+
+
+def read_raw(path):
+    """
+    Reads a TrackMan file as-is (pandas' default CSV typing, no schema or harmonization),
+    for scripts that expect exactly what pd.read_csv returns on the plain CSV.
+    """
+    if is_parquet_file(path):
+        return pd.read_parquet(path)
+
+    with open_input(path) as stream:
+        return pd.read_csv(stream)
+
+
+def read_columns(path):
+    """Returns the column names of a TrackMan file without reading its rows."""
+    if is_parquet_file(path):
+        return pq.read_schema(path).names
+
+    with open_input(path) as stream:
+        return list(pd.read_csv(stream, nrows=0).columns)
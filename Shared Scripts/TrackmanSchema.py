@@ -0,0 +1,239 @@
+"""
+TrackmanSchema.py
+-----------------
+
+Declared column types for TrackMan exports and a shared loader that uses them.
+String enums are read as categoricals, sensor readings as float32 and counts as
+nullable integers, and callers can pass columns= to parse only what they need.
+Older export flavors are harmonized to the canonical column names on load.
+Compressed CSVs and Parquet files are read and written by extension (see TrackmanFiles.py).
+"""
+
+import pandas as pd
+import pyarrow.parquet as pq
+
+from BattedBall import HARDNESS_LEVELS, HIT_TYPES
+from SchemaHarmonize import alias_sources, harmonize
+from TrackmanFiles import is_parquet_file, open_input, open_output
+from ZoneBinning import QUADRANT_LETTERS
+
+# Repeated text values (names, teams, pitch calls...) are stored once per category
+CATEGORY_COLUMNS = [
+    "Date", "Pitcher", "PitcherThrows", "PitcherTeam", "Batter", "BatterSide", "BatterTeam",
+    "PitcherSet", "Top/Bottom", "TaggedPitchType", "AutoPitchType", "PitchCall", "KorBB",
+    "TaggedHitType", "PlayResult", "Tilt", "HomeTeam", "AwayTeam", "Stadium", "Level", "League",
+    "GameID", "UTCDate", "AutoHitType", "System", "Catcher", "CatcherThrows", "CatcherTeam",
+    "PitchReleaseConfidence", "PitchLocationConfidence", "PitchMovementConfidence",
+    "HitLaunchConfidence", "HitLandingConfidence", "CatcherThrowCatchConfidence",
+    "CatcherThrowReleaseConfidence", "CatcherThrowLocationConfidence",
+    # Derived at ingest (see EnrichedColumns.py)
+    "HitType", "Hardness", "Quadrant", "PitchCategory",
+    # File each stored row was ingested from (see SeasonIngest.py)
+    "SourceFile",
+]
+
+# Derived categories with a fixed label order; Parquet keeps only the text, so the order is restored on load
+CATEGORY_LEVELS = {
+    "HitType": pd.CategoricalDtype(HIT_TYPES, ordered=True),
+    "Hardness": pd.CategoricalDtype(HARDNESS_LEVELS, ordered=True),
+    "Quadrant": pd.CategoricalDtype(QUADRANT_LETTERS),
+}
+
+# Unique per pitch (or free text), so a category would not save anything
+STRING_COLUMNS = [
+    "Time", "Notes", "PitchUID", "GameUID", "UTCTime", "LocalDateTime", "UTCDateTime", "PlayID",
+]
+
+# Counts and game state, nullable so missing values survive
+INTEGER_COLUMNS = {
+    "PitchNo": "Int32",
+    "PAofInning": "Int16",
+    "PitchofPA": "Int16",
+    "Inning": "Int16",
+    "Outs": "Int8",
+    "Balls": "Int8",
+    "Strikes": "Int8",
+    "OutsOnPlay": "Int8",
+    "RunsScored": "Int8",
+    "TiltMinutes": "Int16",  # Derived at ingest (see EnrichedColumns.py)
+}
+
+# Pitch time as int64 nanoseconds, parsed once from Date and Time at ingest (see TimeIndex.py)
+TIME_COLUMN = "PitchTime"
+
+# Source file of every stored row, so a re-ingested file replaces exactly its own rows
+SOURCE_COLUMN = "SourceFile"
+
+# Player, team and game ids are too long for float32, so they get 64-bit integers
+ID_COLUMNS = [
+    "PitcherId", "BatterId", "CatcherId", "HomeTeamForeignID", "AwayTeamForeignID", "GameForeignID",
+]
+
+# Sensor readings; float32 keeps ~7 significant digits, more than TrackMan reports
+FLOAT_COLUMNS = [
+    "RelSpeed", "VertRelAngle", "HorzRelAngle", "SpinRate", "SpinAxis", "RelHeight", "RelSide",
+    "Extension", "VertBreak", "InducedVertBreak", "HorzBreak", "PlateLocHeight", "PlateLocSide",
+    "ZoneSpeed", "VertApprAngle", "HorzApprAngle", "ZoneTime", "ExitSpeed", "Angle", "Direction",
+    "HitSpinRate", "PositionAt110X", "PositionAt110Y", "PositionAt110Z", "Distance",
+    "LastTrackedDistance", "Bearing", "HangTime", "pfxx", "pfxz", "x0", "y0", "z0", "vx0", "vy0",
+    "vz0", "ax0", "ay0", "az0", "EffectiveVelo", "MaxHeight", "MeasuredDuration", "SpeedDrop",
+    "PitchLastMeasuredX", "PitchLastMeasuredY", "PitchLastMeasuredZ", "ContactPositionX",
+    "ContactPositionY", "ContactPositionZ", "HitSpinAxis", "ThrowSpeed", "PopTime", "ExchangeTime", "TimeToBase",
+    "CatchPositionX", "CatchPositionY", "CatchPositionZ", "ThrowPositionX", "ThrowPositionY",
+    "ThrowPositionZ", "BasePositionX", "BasePositionY", "BasePositionZ",
+] + [f"PitchTrajectory{axis}c{i}" for axis in "XYZ" for i in range(3)] \
+  + [f"HitTrajectory{axis}c{i}" for axis in "XYZ" for i in range(9)] \
+  + [f"ThrowTrajectory{axis}c{i}" for axis in "XYZ" for i in range(3)] \
+  + ["PitchSharpness"]  # Derived at ingest (see EnrichedColumns.py)
+
+
+# Values taken from lookup tables (see XwobaEngine.py); float32 would change their digits
+FLOAT64_COLUMNS = ["xwOBA"]
+
+
+def read_dtypes():
+    """
+    Returns the dtype mapping handed to pd.read_csv. Integer and id columns are
+    parsed as floats first, since some exports write counts as "1.0".
+    """
+    dtypes = {col: "category" for col in CATEGORY_COLUMNS}
+    dtypes.update({col: "string" for col in STRING_COLUMNS})
+    dtypes.update({col: "float32" for col in FLOAT_COLUMNS})
+    dtypes.update({col: "float64" for col in FLOAT64_COLUMNS})
+    dtypes.update({col: "float32" for col in INTEGER_COLUMNS})
+    dtypes.update({col: "float64" for col in ID_COLUMNS})
+    return dtypes
+
+
+def apply_schema(df):
+    """
+    Casts the TrackMan columns of an already loaded DataFrame to the declared types.
+    Columns that are not part of the schema are left as they are.
+
+    Parameters:
+        df (pd.DataFrame): TrackMan data with any dtypes.
+
+    Returns:
+        pd.DataFrame: The same data with declared dtypes.
+    """
+    for col in df.columns:
+        if col in CATEGORY_LEVELS:
+            df[col] = df[col].astype("string").astype(CATEGORY_LEVELS[col])
+        elif col in CATEGORY_COLUMNS:
+            if not isinstance(df[col].dtype, pd.CategoricalDtype):
+                df[col] = df[col].astype("string").astype("category")
+        elif col in STRING_COLUMNS:
+            df[col] = df[col].astype("string")
+        elif col in FLOAT_COLUMNS:
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype("float32")
+        elif col in FLOAT64_COLUMNS:
+            df[col] = pd.to_numeric(df[col], errors="coerce").astype("float64")
+        elif col in INTEGER_COLUMNS:
+            df[col] = pd.to_numeric(df[col], errors="coerce").round().astype(INTEGER_COLUMNS[col])
+        elif col in ID_COLUMNS:
+            df[col] = pd.to_numeric(df[col], errors="coerce").round().astype("Int64")
+        elif col == TIME_COLUMN:
+            df[col] = df[col].astype("int64")
+    return df
+
+
+def read_options(columns=None):
+    """
+    Returns the pd.read_csv keyword arguments for a TrackMan export: declared dtypes
+    and, when columns are given, a usecols filter that also keeps their alias columns.
+    """
+    usecols = None
+    if columns is not None:
+        # Also read the alias columns that older exports use for the requested ones
+        wanted = set(columns) | set(alias_sources(columns))
+        usecols = lambda col: col in wanted
+
+    dtypes = read_dtypes()
+    dtypes.update({alias: "category" for alias in alias_sources(CATEGORY_COLUMNS)})
+    return {"usecols": usecols, "dtype": dtypes}
+
+
+def parquet_columns(path, columns=None):
+    """Returns the columns of a Parquet file to read: the requested ones and their aliases."""
+    names = pq.read_schema(path).names
+    if columns is None:
+        return names
+    wanted = set(columns) | set(alias_sources(columns))
+    return [col for col in names if col in wanted]
+
+
+def finish_frame(df, columns=None):
+    """Finishes a freshly parsed frame: integer casts, harmonization and projection."""
+    # Finish the integer columns that were parsed as floats
+    for col in df.columns:
+        if col in INTEGER_COLUMNS:
+            df[col] = df[col].round().astype(INTEGER_COLUMNS[col])
+        elif col in ID_COLUMNS:
+            df[col] = df[col].round().astype("Int64")
+
+    df = harmonize(df)
+    if columns is not None:
+        df = df[[col for col in df.columns if col in set(columns)]]
+
+    return df
+
+
+def load_trackman(path, columns=None):
+    """
+    Loads a TrackMan export with the declared schema, harmonized to the
+    canonical column names and pitch type names.
+
+    Parameters:
+        path (str): Path to the TrackMan file (.csv, .csv.zst, .csv.gz or .parquet).
+        columns (list, optional): Columns to parse. Every column is parsed when omitted.
+                                  Requested columns missing from the file are skipped.
+
+    Returns:
+        pd.DataFrame: The typed TrackMan data.
+    """
+    if is_parquet_file(path):
+        df = apply_schema(pd.read_parquet(path, columns=parquet_columns(path, columns)))
+    else:
+        with open_input(path) as stream:
+            df = pd.read_csv(stream, **read_options(columns))
+    return finish_frame(df, columns)
+
+
+def iter_trackman(path, columns=None, chunk_rows=250_000):
+    """
+    Reads a TrackMan export in chunks of at most chunk_rows rows, each typed and
+    harmonized exactly like load_trackman. Only one chunk is held in memory at a time.
+
+    Parameters:
+        path (str): Path to the TrackMan file (.csv, .csv.zst, .csv.gz or .parquet).
+        columns (list, optional): Columns to parse. Every column is parsed when omitted.
+        chunk_rows (int): Maximum number of rows per chunk.
+
+    Yields:
+        pd.DataFrame: The typed rows of the next chunk.
+    """
+    if is_parquet_file(path):
+        parquet = pq.ParquetFile(path)
+        for batch in parquet.iter_batches(batch_size=chunk_rows, columns=parquet_columns(path, columns)):
+            yield finish_frame(apply_schema(batch.to_pandas()), columns)
+        return
+
+    with open_input(path) as stream, pd.read_csv(stream, chunksize=chunk_rows, **read_options(columns)) as reader:
+        for chunk in reader:
+            yield finish_frame(chunk, columns)
+
+
+def write_trackman(df, path):
+    """
+    Writes TrackMan data in the format given by the extension: Parquet (zstd) for .parquet,
+    otherwise CSV, compressed when the name ends in .zst or .gz.
+
+    Parameters:
+        df (pd.DataFrame): The data to write.
+        path (str): Destination file.
+    """
+    if is_parquet_file(path):
+        df.to_parquet(path, index=False, compression="zstd")
+    else:
+        with open_output(path) as stream:
+            df.to_csv(stream, index=False)
@@ -0,0 +1,209 @@
+"""
+WatchFolder.py
+--------------
+
+Long-running watcher for new TrackMan exports. Drop a game's CSV into the watch
+folder and it is validated, ingested into the season store (only new or changed
+files are read) and handed to every configured report job, without editing any
+script's input path. A file is only picked up once its size and modified time have
+stopped changing for SETTLE_SECONDS, so exports that are still being copied are
+never read half-written.
+
+Example:
+    python WatchFolder.py                       # watch with the configured folders
+    python WatchFolder.py Incoming SeasonStore --once
+"""
+
+import os
+import sys
+import glob
+import time
+import argparse
+import subprocess
+
+from SchemaHarmonize import detect_flavor
+from SeasonIngest import ingest_files
+from TrackmanFiles import read_columns, trackman_patterns
+
+## -- CONFIGURATION -- ##
+REPO_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+WATCH_DIR = os.path.join(REPO_DIR, "All Game CSVs", "Incoming")  # Folder new exports are dropped into
+STORE_DIR = os.path.join(REPO_DIR, "All Game CSVs", "SeasonStore")  # Season store to ingest into
+WATCH_PATTERNS = trackman_patterns()  # Plain and compressed CSVs and Parquet files
+POLL_SECONDS = 1.0  # How often the folder is scanned
+SETTLE_SECONDS = 3.0  # A file must be unchanged this long before it is read
+
+# Columns an export needs before it is ingested (plus a pitch type column, in either flavor)
+REQUIRED_COLUMNS = ["GameID", "PitchUID", "Date", "Time", "Pitcher", "PitcherThrows", "PitchCall"]
+
+# Report jobs run for every newly ingested file: (command, working folder).
+# "{path}" in a command is replaced with the absolute path of the new file.
+REPORT_JOBS = [
+    ([sys.executable, "ProcessAllPitchers.py", "{path}"], os.path.join(REPO_DIR, "Pitching Scripts")),
+]
+
+
+def scan_folder(watch_dir, patterns=WATCH_PATTERNS):
+    """
+    Returns the current (size, modified time) of every matching file in watch_dir.
+    Files that disappear while scanning are left out.
+    """
+    found = {}
+    for pattern in patterns:
+        for path in glob.glob(os.path.join(watch_dir, pattern)):
+            try:
+                stat = os.stat(path)
+            except FileNotFoundError:
+                continue
+            found[os.path.abspath(path)] = (stat.st_size, stat.st_mtime_ns)
+    return found
+
+
+def validate_export(path):
+    """
+    Checks that a file looks like a TrackMan export by reading its header only.
+
+    Parameters:
+        path (str): The file to check.
+
+    Returns:
+        list: Problems found; empty when the file can be ingested.
+    """
+    try:
+        columns = read_columns(path)
+    except (ValueError, OSError) as e:
+        return [f"could not read header ({e})"]
+
+    problems = [f"missing column '{col}'" for col in REQUIRED_COLUMNS if col not in columns]
+    if detect_flavor(columns) is None:
+        problems.append("missing a pitch type column")
+    return problems
+
+
+def run_report_jobs(path, jobs=REPORT_JOBS):
+    """
+    Runs every report job for a newly ingested file. A failing job is reported and
+    does not stop the others.
+
+    Parameters:
+        path (str): The ingested file.
+        jobs (list): (command, working folder) pairs.
+
+    Returns:
+        int: Number of jobs that failed.
+    """
+    failed = 0
+    for command, cwd in jobs:
+        command = [part.replace("{path}", path) for part in command]
+        print(f"Running: {' '.join(command)}")
+        result = subprocess.run(command, cwd=cwd)
+        if result.returncode != 0:
+            print(f"Report job failed with exit code {result.returncode}: {' '.join(command)}")
+            failed += 1
+    return failed
+
+
+def process_file(path, store_dir, jobs=REPORT_JOBS):
+    """
+    Validates, ingests and reports on one settled file.
+
+    Parameters:
+        path (str): The new or updated export.
+        store_dir (str): Root folder of the season store.
+        jobs (list): Report jobs to run when the file brought new data.
+
+    Returns:
+        list: The GameIDs that were written (empty if the file was invalid or already ingested).
+    """
+    problems = validate_export(path)
+    if problems:
+        print(f"Skipping {path}: {'; '.join(problems)}")
+        return []
+
+    # The manifest makes this a no-op for files whose content was already ingested
+    games = ingest_files([path], store_dir)
+    if games:
+        run_report_jobs(path, jobs)
+    return games
+
+
+def settled_files(pending, current, now, settle_seconds=SETTLE_SECONDS):
+    """
+    Updates the debounce state with the latest scan and returns the files that are ready.
+
+    Parameters:
+        pending (dict): path -> (signature, time the signature was first seen). Updated in place.
+        current (dict): Output of scan_folder.
+        now (float): Current time.
+        settle_seconds (float): How long a signature must stay the same.
+
+    Returns:
+        list: Paths whose size and modified time have not changed for settle_seconds.
+    """
+    for path in list(pending):
+        if path not in current:
+            del pending[path]
+
+    ready = []
+    for path, signature in current.items():
+        seen = pending.get(path)
+        if seen is None or seen[0] != signature:
+            pending[path] = (signature, now)
+        elif now - seen[1] >= settle_seconds:
+            ready.append(path)
+    return ready
+
+
+def watch(watch_dir, store_dir, jobs=REPORT_JOBS, poll_seconds=POLL_SECONDS, settle_seconds=SETTLE_SECONDS,
+          once=False):
+    """
+    Watches a folder and processes every new or updated export once it has settled.
+
+    Parameters:
+        watch_dir (str): Folder to watch.
+        store_dir (str): Root folder of the season store.
+        jobs (list): Report jobs to run for each newly ingested file.
+        poll_seconds (float): Time between scans.
+        settle_seconds (float): How long a file must be unchanged before it is read.
+        once (bool): Process the files currently in the folder and return.
+    """
+    os.makedirs(watch_dir, exist_ok=True)
+    pending = {}
+    handled = {}  # path -> signature that was processed last
+
+    print(f"Watching {watch_dir} (store: {store_dir})")
+    while True:
+        current = scan_folder(watch_dir)
+        for path in sorted(settled_files(pending, current, time.time(), settle_seconds)):
+            if handled.get(path) == current[path]:
+                continue
+            handled[path] = current[path]
+            try:
+                process_file(path, store_dir, jobs)
+            except Exception as e:
+                print(f"Error processing {path}: {e}")
+
+        if once and all(handled.get(path) == signature for path, signature in current.items()):
+            return
+        time.sleep(poll_seconds)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Watch a folder and ingest new TrackMan exports as they arrive.")
+    parser.add_argument("watch_dir", nargs="?", default=WATCH_DIR, help="Folder new exports are dropped into")
+    parser.add_argument("store_dir", nargs="?", default=STORE_DIR, help="Root folder of the season store")
+    parser.add_argument("--settle", type=float, default=SETTLE_SECONDS,
+                        help="Seconds a file must be unchanged before it is read")
+    parser.add_argument("--no-reports", action="store_true", help="Only ingest; do not run the report jobs")
+    parser.add_argument("--once", action="store_true", help="Process the files already in the folder and exit")
+    args = parser.parse_args()
+
+    try:
+        watch(args.watch_dir, args.store_dir, jobs=[] if args.no_reports else REPORT_JOBS,
+              settle_seconds=args.settle, once=args.once)
+    except KeyboardInterrupt:
+        print("Stopped watching.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+XwobaEngine.py
+--------------
+
+Column-at-a-time xwOBA. Strikeouts and walks get their fixed values from KorBB, and
+balls in play are looked up in a 2-D array indexed by the integer hit-type and
+hardness bins from BattedBall.py, so a season is scored with a handful of array
+operations instead of one Python call per pitch.
+"""
+
+import numpy as np
+import pandas as pd
+
+from BattedBall import HARDNESS_LEVELS, HIT_TYPES, classify_hardness, classify_hit_type
+
+XWOBA_COLUMN = "xwOBA"
+
+# xwOBA of a ball in play by hit type and hardness
+XWOBA_TABLE = {
+    'Pop Up': {'Hard Hit': 0.127, 'Medium Hit': 0.0455, 'Soft Hit': 0.0455},
+    'Fly Ball': {'Hard Hit': 0.76575, 'Medium Hit': 0.0635, 'Soft Hit': 0.356},
+    'Line Drive': {'Hard Hit': 1.1416, 'Medium Hit': 0.791, 'Soft Hit': 0.502},
+    'Ground Ball': {'Hard Hit': 0.2415, 'Medium Hit': 0.0966, 'Soft Hit': 0.0455},
+}
+
+# Plate appearance results scored from KorBB; these take priority over the batted ball
+KORBB_VALUES = {'Strikeout': 0.0, 'Walk': 0.75}
+
+# Columns compute_xwoba reads
+XWOBA_INPUT_COLUMNS = ["KorBB", "PitchCall", "Angle", "ExitSpeed"]
+
+
+def lookup_array(table=XWOBA_TABLE):
+    """Turns the nested xwOBA table into an array indexed [hit type code, hardness code]."""
+    return np.array([[table[hit_type][hardness] for hardness in HARDNESS_LEVELS] for hit_type in HIT_TYPES],
+                    dtype=np.float64)
+
+
+def bin_codes(binned):
+    """Returns the integer bin codes of a classification (-1 where it is missing)."""
+    return np.asarray(binned.cat.codes if isinstance(binned, pd.Series) else binned.codes)
+
+
+def compute_xwoba(df, table=XWOBA_TABLE):
+    """
+    Computes xwOBA for every pitch. Strikeouts score 0 and walks 0.75; other balls in
+    play with a launch angle and exit speed get the table value; everything else is NaN.
+
+    Parameters:
+        df (pd.DataFrame): TrackMan data with the XWOBA_INPUT_COLUMNS.
+        table (dict): Hit type -> hardness -> xwOBA.
+
+    Returns:
+        pd.Series: float64 xwOBA aligned with df.
+    """
+    hit_type = bin_codes(classify_hit_type(df["Angle"]))
+    hardness = bin_codes(classify_hardness(df["ExitSpeed"]))
+
+    xwoba = np.full(len(df), np.nan)
+    batted = (df["PitchCall"] == "InPlay").to_numpy(dtype=bool, na_value=False) & (hit_type >= 0) & (hardness >= 0)
+    xwoba[batted] = lookup_array(table)[hit_type[batted], hardness[batted]]
+
+    for result, value in KORBB_VALUES.items():
+        xwoba[(df["KorBB"] == result).to_numpy(dtype=bool, na_value=False)] = value
+
+    return pd.Series(xwoba, index=df.index, name=XWOBA_COLUMN)
+
+
+def add_xwoba(df, table=XWOBA_TABLE):
+    """
+    Returns df with its xwOBA column (re)computed. Data without the input columns is
+    returned unchanged.
+    """
+    if any(col not in df.columns for col in XWOBA_INPUT_COLUMNS):
+        return df
+
+    # Joined in one step; inserting a column into a wide TrackMan frame is slow
+    xwoba = compute_xwoba(df, table).to_frame()
+    return pd.concat([df.drop(columns=[XWOBA_COLUMN], errors="ignore"), xwoba], axis=1)
@@ -0,0 +1,122 @@
+"""
+ZoneBinning.py
+--------------
+
+Maps plate locations (PlateLocSide, PlateLocHeight) to strike-zone regions with
+np.digitize over whole columns. Regions come back as int8 codes that groupby can use
+as they are, and label_regions turns them into names when a report needs them.
+Supported layouts: the four quadrants used by the outcome and xwOBA breakdowns, the
+3x3 grid drawn by draw_strike_zone in PitcherReport.py, and any N x M grid.
+
+Codes count cells row by row from the top-left cell (0), so for the quadrants
+0 = A (top left), 1 = B (top right), 2 = C (bottom left), 3 = D (bottom right).
+"""
+
+import numpy as np
+import pandas as pd
+
+# Strike zone in feet: (left, right, bottom, top), as drawn by draw_strike_zone
+STRIKE_ZONE = (-0.83, 0.83, 1.5, 3.5)
+
+# The quadrants split the plate at the middle and the zone at 2.75 ft
+QUADRANT_SPLIT_SIDE = 0.0
+QUADRANT_SPLIT_HEIGHT = 2.75
+QUADRANT_LETTERS = ['A', 'B', 'C', 'D']
+QUADRANT_NAMES = ['Top Left', 'Top Right', 'Bottom Left', 'Bottom Right']
+
+MISSING_REGION = -1  # No plate location
+OUTSIDE_REGION = -2  # Located, but outside the grid
+
+
+def as_float_array(values):
+    """Returns values as a float64 array with missing values as NaN."""
+    if isinstance(values, pd.Series):
+        return values.to_numpy(dtype="float64", na_value=np.nan)
+    return np.asarray(values, dtype="float64")
+
+
+def grid_codes(side, height, side_edges, height_edges):
+    """
+    Bins plate locations into the cells of a grid.
+
+    A side bin includes its left edge and a height bin includes its top edge, so a pitch
+    at exactly 0 ft is on the right half and one at exactly 2.75 ft is in the bottom half.
+    Use -np.inf / np.inf as outer edges for a grid that covers every location.
+
+    Parameters:
+        side (pd.Series or array-like): PlateLocSide values.
+        height (pd.Series or array-like): PlateLocHeight values.
+        side_edges (list): Increasing column edges, left to right (N + 1 values for N columns).
+        height_edges (list): Increasing row edges, bottom to top (M + 1 values for M rows).
+
+    Returns:
+        np.ndarray: int8 cell codes (row from the top * N + column), MISSING_REGION where a
+                    location is missing and OUTSIDE_REGION where it is outside the grid.
+    """
+    n_cols, n_rows = len(side_edges) - 1, len(height_edges) - 1
+    if n_cols < 1 or n_rows < 1:
+        raise ValueError("A grid needs at least two side edges and two height edges.")
+    if n_cols * n_rows > np.iinfo(np.int8).max:
+        raise ValueError(f"A {n_cols} x {n_rows} grid has too many cells for int8 codes.")
+
+    side = as_float_array(side)
+    height = as_float_array(height)
+
+    col = np.digitize(side, side_edges, right=False) - 1
+    row = np.digitize(height, height_edges, right=True) - 1
+
+    codes = (n_rows - 1 - row) * n_cols + col
+    outside = (col < 0) | (col >= n_cols) | (row < 0) | (row >= n_rows)
+    codes = np.where(outside, OUTSIDE_REGION, codes)
+    codes = np.where(np.isnan(side) | np.isnan(height), MISSING_REGION, codes)
+    return codes.astype(np.int8)
+
+
+def quadrant_codes(side, height, split_side=QUADRANT_SPLIT_SIDE, split_height=QUADRANT_SPLIT_HEIGHT):
+    """
+    Assigns every pitch to a quadrant: 0 = top left, 1 = top right, 2 = bottom left,
+    3 = bottom right (side < split_side is left, height > split_height is top).
+
+    Returns:
+        np.ndarray: int8 quadrant codes, MISSING_REGION where the location is missing.
+    """
+    return grid_codes(side, height, [-np.inf, split_side, np.inf], [-np.inf, split_height, np.inf])
+
+
+def zone_grid_codes(side, height, rows=3, cols=3, zone=STRIKE_ZONE):
+    """
+    Assigns every pitch to a cell of an even rows x cols grid over the strike zone
+    (3 x 3 by default, cells 0-8 from the top left).
+
+    Returns:
+        np.ndarray: int8 cell codes, OUTSIDE_REGION outside the zone, MISSING_REGION where
+                    the location is missing.
+    """
+    left, right, bottom, top = zone
+    return grid_codes(side, height, np.linspace(left, right, cols + 1), np.linspace(bottom, top, rows + 1))
+
+
+def in_strike_zone(side, height, zone=STRIKE_ZONE):
+    """Flags pitches located inside the strike zone (edges included); missing locations are outside."""
+    left, right, bottom, top = zone
+    side = as_float_array(side)
+    height = as_float_array(height)
+    return (side >= left) & (side <= right) & (height >= bottom) & (height <= top)
+
+
+def label_regions(codes, labels, index=None):
+    """
+    Turns region codes into a categorical of labels, in code order. Missing and
+    outside codes become missing labels.
+
+    Parameters:
+        codes (np.ndarray): Region codes.
+        labels (list): Label of each code.
+        index (pd.Index, optional): Index for the result. Returns a Categorical when omitted.
+
+    Returns:
+        pd.Series or pd.Categorical: The region labels.
+    """
+    codes = np.where(np.asarray(codes) < 0, -1, codes)
+    labeled = pd.Categorical.from_codes(codes, categories=labels)
+    return labeled if index is None else pd.Series(labeled, index=index)